@@ -1,2235 +1,3839 @@
-# name=ICON QCON Pro X
-# url= https://forum.image-line.com/viewtopic.php?f=1994&t=254916#p1607888
-# supportedDevices=ICON QCON Pro X
-# Based on the ImageLine default Mackie script (refactored for the ICON QCON Pro X)
-#
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# Includes the following additional features:
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# Support for the second screen
-# Support for the Stereo Master Meters
-# Support for the FL Studio Overlay (firmware 2)
-# Option to always default Jog Dial to the playlist (song pointer)
-# Option to display Track Numbers (default) or expanded TrackNames over 2 rows on the first screen
-# Dynamic Channel (Track) numbers shown on second screen
-# Dynamic Bank numbers shown on second screen
-# Full selected Track name shown on second screen
-# Current assignment information shown on second screen
-# All temporary messages defaulted to the second screen 
-# Added options for Mixer Colouring (+reset to default)
-# Added feedback (where possible) for all operations onto the second screen
-# Added support to reset all tracks to "un-muted" (with a single operation)
-# Added support to disarm all tracks (with a single operation)
-# Added 4 options for "Free Control" parameter naming choices
-# Added comment headers to asist with script readability
-# Added parameter value nanmesfor EQ Assignment (relating to default FL Studio Mixer parametric EQ)
-# Option added for EQ Assignment to "Reset all"
-
-import time
-import arrangement
-import channels
-import device
-import general
-import launchMapPages
-import math
-import midi
-import mixer
-import patterns
-import playlist
-import plugins
-import transport
-import ui
-import utils
-
-MackieCU_KnobOffOnT = [(midi.MIDI_CONTROLCHANGE + (1 << 6)) << 16,
-                       midi.MIDI_CONTROLCHANGE + ((0xB + (2 << 4) + (1 << 6)) << 16)]
-MackieCU_nFreeTracks = 64
-
-# -----------------
-# STATIC VARIABLES
-# -----------------
-# Mackie CU pages
-MackieCUPage_Pan = 0
-MackieCUPage_Stereo = 1
-MackieCUPage_Sends = 2
-MackieCUPage_FX = 3
-MackieCUPage_EQ = 4
-MackieCUPage_Free = 5
-
-ExtenderLeft = 0
-ExtenderRight = 1
-
-OffOnStr = ('off', 'on')
-MasterPeak = 0
-BankingColours = [-22508, -15461356, -14397697, -60167, -98028, -1768, -8126692, -14617601, -2479873, -54171, -52992, -98028]
-TrackColours = [ -4930828, -16777216, -14737633, -12632257, -10526881,-8421505, -6316129, -4210753,
-                -12037802, -251649, -244993, -238081, -165633, -158721, -151809, -79361, -72449, -16382223, -14605838, -12763660,-10921483, -9079305, -7302919, -5460742,
-                 -3618564, -34560, -30692, -26567, -22442, -18317, -14193, -10068, -5943, -2555897, -2286810,-1952187, -1617564, -1282941, -1013854, -679231,
-                 -344608, -16763645, -15118819, -13408457, -11763631, -10053013, -8408187, -6697825,-5052999, -13608273, -12425032, -11175998, -9926964, -8677930, -7428896, -6179862,
-                 -2105377, -13762559, -12052197, -10341834, -8631472, -6920853, -5210490, -3500128,
-                 -1789765, -1119232, -1053161,-987090, -921019, -854692, -788621, -722550, -656479, -22508, -15461356, -14397697, -60167, -98028, -1768, -8126692,
-                 -14617601, -2479873, -54171, -52992, -98028,-12037802, -251649, -244993, -238081, -165633, -158721, -151809, -79361, -72449, -16382223, -14605838,
-                 -12763660, -10921483, -9079305, -7302919, -5460742, -3618564,-34560, -30692, -26567, -22442, -18317, -14193, -10068, -5943, -2555897, -2286810,
-                 -1952187, -1617564, -1282941, -1013854, -679231, -344608, -16763645, -15118819, -13408457,
-                -11763631, -10053013, -8408187, -6697825, -5052999, -13608273, -12425032, -11175998, -9926964, -8677930, -7428896, -6179862, -4930828, -16777216, -14737633, -12632257, -10526881,
-                -8421505, -6316129, -4210753, -2105377, -13762559, -12052197, -10341834, -8631472, -6920853, -5210490, -3500128, -1789765, -1119232, -1053161, -987090, -921019, -854692, -788621, -722550,
-                -656479, -22508, -15461356, -14397697, -60167, -98028, -1768, -8126692, -14617601, -2479873, -54171, -52992, -98028]
-debug = True
-
-#################################
-# CLASS FOR COLUMN RELATED ITEMS
-#################################
-
-class TMackieCol:
-    def __init__(self):
-        self.TrackNum = 0
-        self.BaseEventID = 0
-        self.KnobEventID = 0
-        self.KnobPressEventID = 0
-        self.KnobResetEventID = 0
-        self.KnobResetValue = 0
-        self.KnobMode = 0 #[0=default], [1=parameter, pan, volume, off],[2=self.Flip],[3=centered?],[4=?]
-        self.KnobCenter = 0
-        self.SliderEventID = 0
-        self.Peak = 0
-        self.Tag = 0
-        self.SliderName = ""
-        self.KnobName = ""
-        self.LastValueIndex = 0
-        self.ZPeak = False
-        self.Dirty = False
-        self.KnobHeld = False
-
-##################################
-# CLASS FOR GENERAL FUNCTIONALITY
-##################################
-
-class TMackieCU():
-    def __init__(self):
-        self.LastMsgLen = 0x37
-        self.TempMsgT = ["", ""]
-        self.LastTimeMsg = bytearray(10)
-        self.Shift = False
-        self.Control = False
-        self.Option = False
-        self.Alt = False
-        self.TempMsgDirty = False
-        self.JogSource = 0
-        self.TempMsgCount = 0
-        self.SliderHoldCount = 0
-        self.FirstTrack = 0
-        self.FirstTrackT = [0, 0]
-        self.ColT = [0 for x in range(9)]
-        for x in range(0, 9):
-            self.ColT[x] = TMackieCol()
-        self.FreeCtrlT = [0 for x in range(
-            MackieCU_nFreeTracks - 1 + 2)]  # 64+1 sliders
-        self.Clicking = False
-        self.Scrub = False
-        self.Flip = False
-        self.MeterMode = 1  # enabled!
-        self.CurMeterMode = 0
-        self.Page = 0
-        self.SmoothSpeed = 0
-        self.MeterMax = 0
-        self.ActivityMax = 0
-        self.DefaultJogToPlaylist = False
-        self.MixerScroll = False
-        self.MackieCU_PageNameT = ('Panning                          (press VPOTS to reset)', 'Stereo Separation               (press VPOTS to reset)', '" - press VPOTS to enable',
-                                   '" - turn VPOTS to adjust', '" - press VPOTS to reset',  '(Free Controls)')
-        self.MackieCU_MeterModeNameT = ('Meters Disabled', 'Meters Enabled')
-        self.MackieCU_ExtenderPosT = ('left', 'right')
-        self.FreeEventID = 400
-        self.ArrowsStr = chr(0x7F) + chr(0x7E) + chr(0x32)
-        self.AlphaTrack_SliderMax = round(13072 * 16000 / 12800)
-        self.ExtenderPos = ExtenderLeft
-        self.CurPluginID = -1
-        self.LCD1 = bytearray([0xF0, 0x00, 0x00, 0x66, 0x14, 0x12, 0])
-        self.LCD2 = bytearray([0xF0, 0x00, 0x00, 0x67, 0x15, 0x13, 0])
-        self.MasterPeak = 0
-        self.Msg1 = ''
-        self.Msg2 = ''
-        self.ShowTrackNumbers = True
-        self.FreeText = 0  # Zenology - change to 1 (generic) or -1 (blank)
-        self.colourOptions = 0
-
-# -------------------------------------------------------------------------------------------------------------------------------
-# FUNCTIONS:
-# -------------------------------------------------------------------------------------------------------------------------------
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    # REMOVE CARRIAGE RETURNS & LINEFEEDS CHARS FROM STRING                                                                     #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def trimcr(str):
-        if debug:
-            print('trimcr() '+str)
-        if str == '':
-            return ''
-        if str[-1:] in '\n\r':
-            return trimcr(str[:-1])
-        else:
-            return str
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    # Display shortened name to fit to 7 characters (e.g., Fruity Chorus = FChorus, EQ Enhancer = EQEnhan)                      #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-
-    def DisplayName(name):
-        if debug:
-            print('DisplayName() ' + name)
-        if name == '':
-            return ''
-
-        words = name.split()
-        if len(words) == 0:
-            return ''
-
-        shortName = ''
-
-        for w in words:
-            first = True
-            for c in w:
-                if c.isupper():
-                    shortName += c
-                elif first:
-                    shortName += c
-                else:
-                    break
-                first = False
-
-        lastWord = words[len(words)-1]
-        shortName += lastWord[1:]
-        if debug:
-            print('DisplayName() ' + shortName[0:6])
-        return shortName[0:6]
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  CALLED FROM UPDATECOL TO RETURN SLIDER / LEVEL VALUEDS                                                                   #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def AlphaTrack_LevelToSlider(self, Value, Max=midi.FromMIDI_Max):
-        return round(Value / Max * self.AlphaTrack_SliderMax)
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  CALLED FROM UPDATECOL TO RETURN SLIDER / LEVEL VALUEDS                                                                   #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def AlphaTrack_SliderToLevel(self, Value, Max=midi.FromMIDI_Max):
-        return min(round(Value / self.AlphaTrack_SliderMax * Max), Max)
-
-# --------------------------------------------------------------------------------------------------------------------------------
-# EVENTS:
-# --------------------------------------------------------------------------------------------------------------------------------
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  Called when the script has been started.                                                                                 #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnInit(self):
-
-        self.FirstTrackT[0] = 1
-        self.FirstTrack = 0
-        self.SmoothSpeed = 469
-        self.Clicking = True
-
-        device.setHasMeters()
-        self.LastTimeMsg = bytearray(10)
-
-        for m in range(0, len(self.FreeCtrlT)):
-            self.FreeCtrlT[m] = 8192  # default free faders to center
-        if device.isAssigned():
-            device.midiOutSysex(
-                bytes([0xF0, 0x00, 0x00, 0x66, 0x14, 0x0C, 1, 0xF7]))
-        self.SetBackLight(2)  # backlight timeout to 2 minutes
-        self.UpdateClicking()
-        self.UpdateMeterMode()
-        self.SetPage(self.Page)
-        self.SendMsg(chr(32)*112)
-        self.SendMsg2(chr(32)*112)
-        if debug:
-            print('OnInit()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  	Called before the script will be stopped.                                                                               #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnDeInit(self):
-
-        if device.isAssigned():
-            for m in range(0, 8):
-                device.midiOutSysex(bytes([0xF0, 0x00, 0x00, 0x66, 0x14, 0x20, m, 0, 0xF7]))
-                device.midiOutSysex(bytes(bytearray([0xd1, 0, 0xF7])))
-                device.midiOutSysex(bytes(bytearray([0xd1, 16, 0xF7])))
-                
-            if ui.isClosing():
-                # self.SendMsg(chr(32)*112)
-                self.SendMsg(
-                    "Your QCON Pro X script version is 0.8                   (Please check on www.gadgeteer.home.blog for updates).   ")
-                # self.SendMsg2(chr(32)*112)
-                self.SendMsg2(ui.getProgTitle() + ' session closed at ' +
-                              time.ctime(time.time())+chr(32)*60, 0)
-            else:
-                self.SendMsg('', 1)
-
-            self.SendAssignmentMsg('   ')
-        if debug:
-            print('OnDeInit()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  	Called on mixer track(s) change, 'index' indicates track index of track that changed or -1 when all tracks changed.     #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnDirtyMixerTrack(self, SetTrackNum):
-        for m in range(0, len(self.ColT)):
-            if (self.ColT[m].TrackNum == SetTrackNum) | (SetTrackNum == -1):
-                self.ColT[m].Dirty = True
-        if debug:
-            print('OnDirtyMixerTrack() '+str(SetTrackNum))
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  Called when something changed that the script might want to respond to.                                                  #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnRefresh(self, flags):
-
-        if flags & midi.HW_Dirty_Mixer_Sel:
-            self.UpdateMixer_Sel()
-
-        if flags & midi.HW_Dirty_Mixer_Display:
-            self.UpdateTextDisplay()
-            self.UpdateColT()
-
-        if flags & midi.HW_Dirty_Mixer_Controls:
-            for n in range(0, len(self.ColT)):
-                if self.ColT[n].Dirty:
-                    self.UpdateCol(n)
-
-        # LEDs
-        if flags & midi.HW_Dirty_LEDs:
-            self.UpdateLEDs()
-        if debug:
-            print('OnRefresh() '+str(flags))
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #   SEND A MESSAGE TO THE SECOND DISPLAY (USSUALLY RAISED BY FL STUDIO)                                                     #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnSendTempMsg(self, Msg, Duration=1000):
-        if debug:
-            print('OnSendTempMsg() '+str(Msg))
-        self.SendMsg('  '+Msg.ljust(54, ' '), 0, 2)
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  Called when the beat indicator has changes.                                                                              #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnUpdateBeatIndicator(self, Value):
-
-        SyncLEDMsg = [midi.MIDI_NOTEON + (0x5E << 8), midi.MIDI_NOTEON + (
-            0x5E << 8) + (0x7F << 16), midi.MIDI_NOTEON + (0x5E << 8) + (0x7F << 16)]
-
-        if device.isAssigned():
-            device.midiOutNewMsg(SyncLEDMsg[Value], 128)
-        if debug:
-            print('OnUpdateBeatIndicator()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  Called when peak meters needs to be updated                                                                              #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnUpdateMeters(self):
-        if self.CurMeterMode == 1:
-            if self.Page != MackieCUPage_Free:
-                # for m in range(0, len(self.ColT) - 1):
-                #    self.ColT[m].Peak = max(self.ColT[m].Peak, round(mixer.getTrackPeaks(self.ColT[m].TrackNum, midi.PEAK_LR_INV) * self.MeterMax))
-                for m in range(0, len(self.ColT) - 1):
-                    self.ColT[m].Peak = max(0, round(mixer.getTrackPeaks(
-                        self.ColT[m].TrackNum, 0) * self.MeterMax))
-                n = max(0, round(mixer.getTrackPeaks(MasterPeak, 0) * self.MeterMax))
-                device.midiOutSysex(bytes(bytearray([0xd1, n, 0xF7])))
-                n = max(0, round(mixer.getTrackPeaks(MasterPeak, 1) * self.MeterMax))
-                device.midiOutSysex(bytes(bytearray([0xd1, n+16, 0xF7])))
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  CALLED BY FL WHENEVER IT IS NOT BUSY \\:-)                                                                                     #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnIdle(self):
-        # ----------------
-        # REFRESH METERS
-        # ---------------
-        if device.isAssigned():
-            f = self.Page == MackieCUPage_Free
-            for m in range(0,  len(self.ColT) - 1):
-                self.ColT[m].Tag = utils.Limited(
-                    self.ColT[m].Peak, 0, self.MeterMax)
-                self.ColT[m].Peak = 0
-                if self.ColT[m].Tag == 0:
-                    if self.ColT[m].ZPeak:
-                        continue
-                    else:
-                        self.ColT[m].ZPeak = True
-                else:
-                    self.ColT[m].ZPeak = f
-                device.midiOutMsg(midi.MIDI_CHANAFTERTOUCH +
-                                  (self.ColT[m].Tag << 8) + (m << 12))
-        # -------------------------
-        # UPDATE THE TIME DISPLAY
-        # -------------------------
-        if ui.getTimeDispMin():
-            # HHH.MM.SS.CC_
-            if playlist.getVisTimeBar() == -midi.MaxInt:
-                s = '-   0'
-            else:
-                n = abs(playlist.getVisTimeBar())
-                h, m = utils.DivModU(n, 60)
-                # todo sign of...
-                s = utils.Zeros_Strict(
-                    (h * 100 + m) * utils.SignOf(playlist.getVisTimeBar()), 5, ' ')
-
-            s = s + utils.Zeros_Strict(abs(playlist.getVisTimeStep()), 2) + \
-                utils.Zeros_Strict(playlist.getVisTimeTick(), 2) + ' '
-        else:
-            # BBB.BB.__.TTT
-            s = utils.Zeros_Strict(playlist.getVisTimeBar(), 3, ' ') + utils.Zeros_Strict(abs(
-                playlist.getVisTimeStep()), 2) + '  ' + utils.Zeros_Strict(playlist.getVisTimeTick(), 3)
-
-        self.SendTimeMsg(s)
-        # -------------------------------
-        # MANAGE ANY TEMPORARY MESSAGES
-        # -------------------------------
-        if self.TempMsgDirty:
-            self.UpdateTempMsg()
-            self.TempMsgDirty = False
-
-        if (self.TempMsgCount > 0) & (self.SliderHoldCount <= 0) & (not ui.isInPopupMenu()):
-            self.TempMsgCount -= 1
-            if self.TempMsgCount == 0:
-                self.UpdateTempMsg()
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  Called for all MIDI messages that were not handled by OnMidiIn.       .                                                  #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def OnMidiMsg(self, event):
-
-        ArrowStepT = [2, -2, -1, 1]
-        CutCopyMsgT = ('Cut', 'Copy', 'Paste', 'Insert',
-                       'Delete')  # FPT_Cut..FPT_Delete
-        if debug:
-            print("midiID,HEX,data1,hex,data2,hex")
-            print(event.midiId, hex(event.midiId), event.data1,
-                  hex(event.data1), event.data2, hex(event.data2))
-
-        #############################################################################################################################
-        #                                                                                                                           #
-        #   CONTROL CHANGE                                                                                                     #
-        #                                                                                                                           #
-        #############################################################################################################################
-        if (event.midiId == midi.MIDI_CONTROLCHANGE):
-            if debug:
-                print("midi control change")
-            if self.DefaultJogToPlaylist:
-                ui.setFocused(midi.widPlaylist)
-            if (event.midiChan == 0):
-                event.inEv = event.data2
-                if event.inEv >= 0x40:
-                    event.outEv = -(event.inEv - 0x40)
-                else:
-                    event.outEv = event.inEv
-                if event.data1 == 0x3C:
-                    self.Jog(event)
-                    event.handled = True
-
-                # knobs
-                elif event.data1 in [0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17]:
-                    r = utils.KnobAccelToRes2(event.outEv)  # todo outev signof
-                    Res = r * (1 / (40 * 2.5))
-                    if self.Page == MackieCUPage_FX:
-                        self.SetKnobValue(event.data1 - 0x10, event.outEv, Res)
-                        event.handled = True
-                    if self.Page == MackieCUPage_Free:
-                        i = event.data1 - 0x10
-                        self.ColT[i].Peak = self.ActivityMax
-                        event.data1 = self.ColT[i].BaseEventID + \
-                            int(self.ColT[i].KnobHeld)
-                        event.isIncrement = 1
-                        s = chr(0x7E + int(event.outEv < 0))
-                        self.SendMsg2(
-                            'Free knob ' + str(event.data1) + ': ' + s)
-                        device.processMIDICC(event)
-                        device.hardwareRefreshMixerTrack(self.ColT[i].TrackNum)
-                    else:
-                        self.SetKnobValue(event.data1 - 0x10, event.outEv, Res)
-                        event.handled = True
-                else:
-                    event.handled = False  # for extra CCs in emulators
-            else:
-                event.handled = False  # for extra CCs in emulators
-
-        #############################################################################################################################
-        #                                                                                                                           #
-        #   PITCH BEND (FADERS)                                                                                                     #
-        #                                                                                                                           #
-        #############################################################################################################################
-        elif event.midiId == midi.MIDI_PITCHBEND:
-            if debug:
-                print("Midi pitchbend")
-            if event.midiChan <= 8:
-                event.inEv = event.data1 + (event.data2 << 7)
-                event.outEv = (event.inEv << 16) // 16383
-                event.inEv -= 0x2000
-
-                if self.Page == MackieCUPage_Free:
-                    self.ColT[event.midiChan].Peak = self.ActivityMax
-                    self.FreeCtrlT[self.ColT[event.midiChan].TrackNum] = event.data1 + \
-                        (event.data2 << 7)
-                    device.hardwareRefreshMixerTrack(
-                        self.ColT[event.midiChan].TrackNum)
-                    event.data1 = self.ColT[event.midiChan].BaseEventID + 7
-                    event.midiChan = 0
-                    event.midiChanEx = event.midiChanEx & (not 0xF)
-                    self.SendMsg2('Free slider ' + str(event.data1) + ': ' +
-                                  ui.getHintValue(event.outEv, midi.FromMIDI_Max))
-                    device.processMIDICC(event)
-                elif self.ColT[event.midiChan].SliderEventID >= 0:
-                    # slider (mixer track volume)
-                    if self.ColT[event.midiChan].TrackNum >= 0:
-                        if (self.Page != MackieCUPage_EQ) and (self.Page != MackieCUPage_FX):
-                            if mixer.trackNumber != self.ColT[event.midiChan].TrackNum:
-                                mixer.setTrackNumber(
-                                    self.ColT[event.midiChan].TrackNum)
-                    event.handled = True
-                    mixer.automateEvent(self.ColT[event.midiChan].SliderEventID, self.AlphaTrack_SliderToLevel(
-                        event.inEv + 0x2000), midi.REC_MIDIController, self.SmoothSpeed)
-                    # hint
-                    n = mixer.getAutoSmoothEventValue(
-                        self.ColT[event.midiChan].SliderEventID)
-                    s = mixer.getEventIDValueString(
-                        self.ColT[event.midiChan].SliderEventID, n)
-                    if s != '':
-                        s = ': ' + s
-                    self.SendMsg2(self.ColT[event.midiChan].SliderName + s)
-
-        #############################################################################################################################
-        #                                                                                                                           #
-        #   MIDI NOTEON/OFF                                                                                                         #
-        #                                                                                                                           #
-        #############################################################################################################################
-        elif (event.midiId == midi.MIDI_NOTEON) | (event.midiId == midi.MIDI_NOTEOFF):  # NOTE
-            if debug:
-                print("midi note on or off")
-
-            if event.midiId == midi.MIDI_NOTEON:
-                if event.data2 > 0:
-                    if event.data1 in [0x68, 0x69, 0x70]:
-                        self.SliderHoldCount += -1 + (int(event.data2 > 0) * 2)
-
-                    # -------
-                    # MIXER
-                    # -------
-                    elif event.data1 == 0x3F:  # Mixer
-                        if self.Shift:
-                            if self.ShowTrackNumbers:
-                                self.ShowTrackNumbers = False
-                            else:
-                                self.ShowTrackNumbers = True
-                            self.UpdateTextDisplay()
-                        else:
-                            ui.showWindow(midi.widMixer)
-                            ui.setFocused(midi.widMixer)
-                            self.SendMsg2("The Mixer Window is Open")
-                    # ---------
-                    # CHANNEL
-                    # --------
-                    elif event.data1 == 0x40:  # Channel Rack
-                        if self.Shift:
-                            if ui.getFocused(5) == 0:
-                                channels.focusEditor(channels.getChannelIndex(channels.selectedChannel()))
-                                channels.showCSForm(channels.getChannelIndex(channels.selectedChannel(-1)))
-                            else:
-                                channels.focusEditor(channels.getChannelIndex(channels.selectedChannel()))
-                                channels.showCSForm(channels.getChannelIndex(channels.selectedChannel(-1)), 0)
-                        else:
-                            ui.showWindow(midi.widChannelRack)
-                            ui.setFocused(midi.widChannelRack)
-                            self.SendMsg2("The Channel Rack Window is Open")
-                    # -------
-                    # TEMPO
-                    # -------
-                    elif event.data1 == 0x41:
-                        transport.globalTransport(midi.FPT_TapTempo, 1)
-                        s = str(mixer.getCurrentTempo(True))[:-2]
-                        self.SendMsg2("Tempo: "+s)
-                    # --------
-                    # WINDOW 
-                    # --------
-                    elif event.data1 == 0x4c:
-                        ui.nextWindow()
-                        s = ui.getFocusedFormCaption()
-                        if s != "":
-                            self.SendMsg2('Current window: ' + s)
-
-
-                if (event.pmeFlags & midi.PME_System != 0):
-                    # F1..F8
-                    if self.Shift & (event.data1 in [0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D]):
-                        transport.globalTransport(midi.FPT_F1 - 0x36 +
-                                                  event.data1, int(event.data2 > 0) * 2, event.pmeFlags)
-                        event.data1 = 0xFF
-
-                    if self.Control & (event.data1 in [0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D]):
-                        ui.showWindow(midi.widPlaylist)
-                        ui.setFocused(midi.widPlaylist)
-                        transport.globalTransport(midi.FPT_Menu, int(
-                            event.data2 > 0) * 2, event.pmeFlags)
-                        time.sleep(0.1)
-                        f = int(1 + event.data1 - 0x36)
-                        for x in range(0, f):
-                            transport.globalTransport(midi.FPT_Down, int(
-                                event.data2 > 0) * 2, event.pmeFlags)
-                            time.sleep(0.01)
-                        time.sleep(0.1)
-                        transport.globalTransport(midi.FPT_Enter, int(
-                            event.data2 > 0) * 2, event.pmeFlags)
-                        event.data1 = 0xFF
-
-                    #---------------
-                    # MODE (METERS)
-                    #---------------
-                    if event.data1 == 0x34:
-                        if event.data2 > 0:
-                            if self.Shift:
-                                self.ExtenderPos = abs(self.ExtenderPos - 1)
-                                self.FirstTrackT[self.FirstTrack] = 1
-                                self.SetPage(self.Page)
-                                self.SendMsg2(
-                                    'Extender on ' + self.MackieCU_ExtenderPosT[self.ExtenderPos], 1500)
-                            else:
-                                self.MeterMode = (self.MeterMode + 1) % 2
-                                self.SendMsg2(
-                                    self.MackieCU_MeterModeNameT[self.MeterMode])
-                                self.UpdateMeterMode()
-                                device.dispatch(0, midi.MIDI_NOTEON +
-                                                (event.data1 << 8) + (event.data2 << 16))
-                                device.midiOutSysex(
-                                    bytes(bytearray([0xd1, 0, 0xF7])))
-                                device.midiOutSysex(
-                                    bytes(bytearray([0xd1, 16, 0xF7])))
-                    #-------------                
-                    # TIME FORMAT
-                    #-------------
-                    elif event.data1 == 0x35:
-                        if event.data2 > 0:
-                            ui.setTimeDispMin()
-                            if ui.getTimeDispMin():
-                                SendMsg2("Time display set to M:S:CS (Time)")
-                            else:
-                                SendMsg2("Time display set to B:S:T (Beats)")
-                    # --------------
-                    # SCRUB BUTTON
-                    # --------------
-                    elif event.data1 == 0x65:  # self.Scrub
-                        if event.data2 > 0:
-                            self.Scrub = not self.Scrub
-                            self.UpdateLEDs()
-
-                    # --------------
-                    # JOG SOURCES
-                    # --------------
-                    #elif event.data1 in [0x3E, 0x3F, 0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x48, 0x55, 0x64, 0x46, 0x4C]: (X-Touch specific?)
-                    elif event.data1 in [0x3E, 0x3F, 0x40, 0x41, 0x48, 0x64, 0x46, 0x4C]:
-                        # update jog source
-                        self.SliderHoldCount += -1 + (int(event.data2 > 0) * 2)
-                        if event.data1 in [0x64, 0x4C]:
-                            device.directFeedback(event)
-                        if event.data2 == 0:
-                            if self.JogSource == event.data1:
-                                self.SetJogSource(0)
-                        else:
-                            self.SetJogSource(event.data1)
-                            if event.data1 ==0x48: #markers
-                                ui.showWindow(midi.widPlaylist)
-                                ui.setFocused(midi.widPlaylist)
-                            event.outEv = 0
-                            self.Jog(event)  # for visual feedback
-
-                    # ---------------
-                    # ARROW BUTTONS
-                    # ---------------
-                    elif event.data1 in [0x60, 0x61, 0x62, 0x63]:
-                        if self.JogSource == 0x64:
-                            if event.data1 == 0x60:
-                                transport.globalTransport(
-                                    midi.FPT_VZoomJog + int(self.Shift), -1, event.pmeFlags)
-                            elif event.data1 == 0x61:
-                                transport.globalTransport(
-                                    midi.FPT_VZoomJog + int(self.Shift), 1, event.pmeFlags)
-                            elif event.data1 == 0x62:
-                                transport.globalTransport(
-                                    midi.FPT_HZoomJog + int(self.Shift), -1, event.pmeFlags)
-                            elif event.data1 == 0x63:
-                                transport.globalTransport(
-                                    midi.FPT_HZoomJog + int(self.Shift), 1, event.pmeFlags)
-
-                        elif self.JogSource == 0:
-                            transport.globalTransport(
-                                midi.FPT_Up - 0x60 + event.data1, int(event.data2 > 0) * 2, event.pmeFlags)
-                        else:
-                            if event.data2 > 0:
-                                event.inEv = ArrowStepT[event.data1 -
-                                                        0x60]
-                                event.outEv = event.inEv
-                                self.Jog(event)
-                    #------------
-                    # COUNTDOWN:
-                    #------------
-                    elif event.data1 == 0x58:
-                        if event.data2 == 0:
-                            transport.globalTransport(midi.FPT_CountDown, 1)
-                            if ui.isPrecountEnabled():
-                                SendMsg2("Count in enabled for recording")
-                            else:
-                                SendMsg2("Count in disabled for recording")
-                    #----------------            
-                    # PATTERN / SONG
-                    #----------------
-                    elif event.data1 == 0x5a:
-                        if event.data2 > 0:
-                            transport.globalTransport(midi.FPT_Loop, 1)
-                            Looper = transport.getLoopMode()
-                            if (Looper == midi.SM_Pat):
-                                self.SendMsg2("Pattern Mode")
-                            else:
-                                self.SendMsg2("Song Mode")
-                    #-------------------
-                    # CONTROL SMOOTHING
-                    #-------------------
-                    elif event.data1 == 0x33:
-                        if event.data2 > 0:
-                            self.SmoothSpeed = int(self.SmoothSpeed == 0) * 469
-                            self.UpdateLEDs()
-                            self.SendMsg2('Control smoothing ' +
-                                          OffOnStr[int(self.SmoothSpeed > 0)])
-
-                    # ------------------------------
-                    # CUT/COPY/PASTE/INSERT/DELETE
-                    # ------------------------------
-                    elif event.data1 in [0x36, 0x37, 0x38, 0x39, 0x3A]:
-                        transport.globalTransport(midi.FPT_Cut + event.data1 -
-                                                  0x36, int(event.data2 > 0) * 2, event.pmeFlags)
-                        if event.data2 > 0:
-                            self.SendMsg2(
-                                CutCopyMsgT[midi.FPT_Cut + event.data1 - 0x36 - 50])
-                    # -------------------
-                    # TOGGLE UNDO / REDO
-                    # -------------------
-                    elif event.data1 in [0x3C,0x3d]:
-                        if (transport.globalTransport(midi.FPT_Undo, int(event.data2 > 0) * 2, event.pmeFlags) == midi.GT_Global) & (event.data2 > 0):
-                            self.OnSendTempMsg(
-                                ui.getHintMsg() + ' (level ' + general.getUndoLevelHint() + ')')
-
-
-                    # --------
-                    # PATTERN
-                    # --------
-                        elif event.data1 == 0x3E:
-                            if event.data2 > 0:
-                                #if self.Shift:
-                                #    #open the piano roll:
-                                #    ui.hideWindow(midi.widPlaylist)
-                                #    ui.showWindow(midi.widPianoRoll)
-                                #    ui.setFocused(midi.widPianoRoll)
-                                #else:    
-                                if ui.getVisible(midi.widPlaylist):
-                                    ui.hideWindow(midi.widPlaylist)
-                                else:
-                                    ui.showWindow(midi.widPlaylist)
-                                    ui.setFocused(midi.widPlaylist)
-                                    sel = -1
-                                    for p in range(0, patterns.patternCount()-1):
-                                        if patterns.isPatternSelected(p):
-                                            sel = p
-                                            break
-                                    if sel == -1:
-                                        SendMsg2("Playlist Opened (use jog dial to navigate patterns)")
-
-                                    else:
-                                        SendMsg2("Pattern Selected:"+patterns.getPatternName(p)+" (use jog dial to navigate)")
-                                        patterns.selectPattern(p)
-                                # Ensure that we are in Pattern Mode:
-                                if transport.getLoopMode()==1:   
-                                    transport.globalTransport(midi.FPT_Loop, int(event.data2 > 0) * 2, event.pmeFlags)     
-
-
-
-                    # ---------------------------
-                    # FREE1 - UNMUTE ALL TRACKS
-                    # ---------------------------
-                    elif event.data1 == 0x42:
-                        if event.data2 > 0:
-                            if self.Shift:
-                                for m in range(0,  mixer.trackCount()):
-                                    if mixer.isTrackArmed(m):
-                                        mixer.armTrack(m)
-                                self.SendMsg2("All tracks disarmed")
-                            else:
-                                for m in range(0,  mixer.trackCount()):
-                                    if mixer.isTrackMuted(m):
-                                        mixer.muteTrack(m)
-                                self.SendMsg2("All tracks unmuted")
-
-                    # -----------------------------------------------------------
-                    # FREE2 - SELECT FIRST TRACK ON MIXER BANKING (DEFAULT OFF)
-                    # -----------------------------------------------------------
-                    elif event.data1 == 0x43:
-                        if event.data2 > 0:
-                            if self.MixerScroll:
-                                self.MixerScroll = False
-                                self.SendMsg2(
-                                    "Banking functionality reset to default")
-                            else:
-                                self.MixerScroll = True
-                                self.SendMsg2(
-                                    "Banking always selects and shows first track in the bank")
-
-                    # -----------------------------------------------
-                    # FREE3 - JOG DIAL ALWAYS CONTROLS THE PLAYLIST
-                    # -----------------------------------------------
-                    elif event.data1 == 0x44 and event.data2 > 0:  # shift f7 *****
-                        if event.data2 > 0:
-                            if self.DefaultJogToPlaylist:
-                                self.DefaultJogToPlaylist = False
-                                self.SendMsg2(
-                                    "Jog Dial functionality reset to default")
-                            else:
-                                self.DefaultJogToPlaylist = True
-                                self.SendMsg2(
-                                    "Jog Dial always controls the playlist")
-
-                    # ----------------------------------------------
-                    # FREE4 - DEFAULTING BANKING COLOURS FOR MIXER
-                    # ---------------------------------------------
-
-                    # Could add more options here?
-                    # Would be good to be able to invoke the new colour picker?
-                    elif event.data1 == 0x45:
-                        if event.data2 > 0:
-                            #Activate the mixer so we can see what is happening:
-                            ui.showWindow(midi.widMixer)
-                            ui.setFocused(midi.widMixer)
-                            s="Defaulted"
-                            if self.Shift:
-                                for m in range(0,  mixer.trackCount()): mixer.setTrackColor(m, -10261391)
-                            else:
-                                if self.colourOptions == 0:
-                                    s="Banking Optimised (with gradient fills)"
-                                    self.colourOptions = 1
-                                    for m in range(0,  mixer.trackCount()):
-                                        mixer.setTrackColor(m, TrackColours[m])
-                                        #self.setLinkedChannelColour(m,TrackColours[m])
-                                else:
-                                    self.colourOptions = 0
-                                    s="Banking Optimised (with solid colours)"
-                                    splitter = 0
-                                    color = BankingColours[splitter]
-                                    for m in range(0,  mixer.trackCount()):
-                                        mixer.setTrackColor(m, color)
-                                        if math.remainder(m, 8) == 0:
-                                            splitter = splitter+1
-                                            if splitter == 12:
-                                                splitter = 0
-                                            color = BankingColours[splitter]
-                            self.SendMsg2("Mixer colours:"+s)                
-
-                    # ---------
-                    # BROWSER
-                    # ---------
-                    elif event.data1 == 0x4a:
-                        ui.showWindow(midi.widBrowser)
-                        # ui.setFocused(midi.widBrowser)
-                        self.SendMsg2("Browser Window Open")
-
-                    # ------
-                    # MAIN
-                    # ------
-                    elif event.data1 == 0x4b:
-                        if event.data2 > 0:
-                                transport.globalTransport(midi.FPT_F11, 1) # Main song Window
-                                self.SendMsg2("Main Window Open")
-                                #ui.showWindow(midi.widChannelRack)
-                                #ui.setFocused(midi.widChannelRack)
-
-                    # ---------------------------
-                    # BANK UP / DOWN (8 tracks)
-                    # ---------------------------
-                    elif (event.data1 == 0x2E) | (event.data1 == 0x2F):  # mixer bank
-                        if event.data2 > 0:
-                            self.SetFirstTrack(
-                                self.FirstTrackT[self.FirstTrack] - 8 + int(event.data1 == 0x2F) * 16)
-                            device.dispatch(0, midi.MIDI_NOTEON +
-                                            (event.data1 << 8) + (event.data2 << 16))
-                            if self.MixerScroll:
-                                if self.ColT[event.midiChan].TrackNum >= 0:
-                                    if mixer.trackNumber != self.ColT[event.midiChan].TrackNum:
-                                        mixer.setTrackNumber(
-                                            self.ColT[event.midiChan].TrackNum, midi.curfxScrollToMakeVisible | midi.curfxMinimalLatencyUpdate)
-
-                            if (self.CurPluginID != -1):  # Selected Plugin
-                                if (event.data1 == 0x2E) & (self.PluginParamOffset >= 8):
-                                    self.PluginParamOffset -= 8
-                                elif (event.data1 == 0x2F) & (self.PluginParamOffset + 8 < plugins.getParamCount(mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset) - 8):
-                                    self.PluginParamOffset += 8
-                            else:  # No Selected Plugin
-                                if (event.data1 == 0x2E) & (self.CurPluginOffset >= 2):
-                                    self.CurPluginOffset -= 2
-                                elif (event.data1 == 0x2F) & (self.CurPluginOffset < 2):
-                                    self.CurPluginOffset += 2
-
-                    # ---------------------------
-                    # MOVE UP / DOWN (1 track)
-                    # ---------------------------
-                    elif (event.data1 == 0x30) | (event.data1 == 0x31):
-                        if event.data2 > 0:
-                            self.SetFirstTrack(
-                                self.FirstTrackT[self.FirstTrack] - 1 + int(event.data1 == 0x31) * 2)
-                            device.dispatch(
-                                0, midi.MIDI_NOTEON + (event.data1 << 8) + (event.data2 << 16))
-
-                    # ---------------------
-                    # FLIP FADERS & VPOTS
-                    # ---------------------
-                    elif event.data1 == 0x32:  # self.Flip
-                        if event.data2 > 0:
-                            self.Flip = not self.Flip
-                            device.dispatch(0, midi.MIDI_NOTEON +
-                                            (event.data1 << 8) + (event.data2 << 16))
-                            self.UpdateColT()
-                            self.UpdateLEDs()
-
-
-                    elif event.data1 in [0x28,  0x2A, 0x29, 0x2B, 0x2C, 0x2D]:  # self.Page
-                        self.SliderHoldCount += -1 + (int(event.data2 > 0) * 2)
-                        if event.data2 > 0:
-                            n = event.data1 - 0x28
-                            # print(event.data1)
-                            if event.data1 == 0x2B:
-                                self.SendMsg2(
-                                    'FX for track "'+mixer.getTrackName(mixer.trackNumber())+self.MackieCU_PageNameT[n])
-                            elif event.data1 == 0x2C:
-                                self.SendMsg2(
-                                    'EQ for track "'+mixer.getTrackName(mixer.trackNumber())+self.MackieCU_PageNameT[n])
-                            elif event.data1 == 42:
-                                self.SendMsg2(
-                                    'Sends for track "'+mixer.getTrackName(mixer.trackNumber())+self.MackieCU_PageNameT[n])
-                            else:
-                                self.SendMsg2(self.MackieCU_PageNameT[n])
-                            self.SetPage(n)
-                            device.dispatch(0, midi.MIDI_NOTEON +
-                                            (event.data1 << 8) + (event.data2 << 16))
-
-                    elif event.data1 == 0x54:  # self.Shift
-                        self.Shift = event.data2 > 0
-                        device.directFeedback(event)
-
-                    #elif event.data1 == 0x47:  # self.Option
-                    #    self.Option = event.data2 > 0
-                    #    device.directFeedback(event)
-                    #elif event.data1 == 0x49:  # self.Alt
-                    #    self.Alt = event.data2 > 0
-                    #    device.directFeedback(event)
-
-                    # ------
-                    # MENU
-                    # ------
-                    elif event.data1 == 0x51:  # menu (was self.Control)
-                        #    self.Control = event.data2 > 0
-                        #    device.directFeedback(event)
-                        self.SendMsg2("Use the arrow & enter keys to navigate the menu")
-                        transport.globalTransport(midi.FPT_Menu, int(
-                            event.data2 > 0) * 2, event.pmeFlags)
-                            
-                    # --------
-                    # EDISON
-                    # --------
-                    elif event.data1 ==0x55: # -1:  # open audio editor in current mixer track
-                        if event.data2 > 0:
-                            ui.launchAudioEditor(False, '', mixer.trackNumber(),
-                                                 'AudioLoggerTrack.fst', '')
-                            self.SendMsg2('Audio editor ready for track '+mixer.getTrackName(mixer.trackNumber()))
-
-
-                    # -----------
-                    # METRONOME
-                    # -----------
-                    elif event.data1 == 0x59:  # metronome/button self.Clicking
-                        if event.data2 > 0:
-                            if self.Shift:
-                                self.Clicking = not self.Clicking
-                                self.UpdateClicking()
-                                self.SendMsg2('Metronome self clicking is ' + OffOnStr[self.Clicking])
-                            else:
-                                transport.globalTransport(
-                                    midi.FPT_Metronome, 1, event.pmeFlags)
-                                # if (ui.isMetronomeEnabled):
-                                #    self.SendMsg2("Metronome is Enabled")
-                                # else:
-                                #    self.SendMsg2("Metronome is Disabled")
-
-                    elif event.data1 == -1:  # precount
-                        if event.data2 > 0:
-                            transport.globalTransport(
-                                midi.FPT_CountDown, 1, event.pmeFlags)
-
-                    # ---------
-                    # << & >>
-                    # ---------
-                    elif (event.data1 == 0x5B) | (event.data1 == 0x5C):
-                        if self.Shift:
-                            if event.data2 == 0:
-                                v2 = 1
-                            elif event.data1 == 0x5B:
-                                v2 = 0.5
-                            else:
-                                v2 = 2
-                            transport.setPlaybackSpeed(v2)
-                        else:
-                            transport.globalTransport(midi.FPT_Rewind + int(event.data1 ==
-                                                                            0x5C), int(event.data2 > 0) * 2, event.pmeFlags)
-                        device.directFeedback(event)
-
-                    # ------
-                    # STOP
-                    # ------
-                    elif event.data1 == 0x5D:
-                        transport.globalTransport(midi.FPT_Stop, int(
-                            event.data2 > 0) * 2, event.pmeFlags)
-
-                    # ------
-                    # PLAY
-                    # ------
-                    elif event.data1 == 0x5E:
-                        transport.globalTransport(midi.FPT_Play, int(
-                            event.data2 > 0) * 2, event.pmeFlags)
-                    # --------
-                    # RECORD
-                    # --------
-                    elif event.data1 == 0x5F:  # record
-                        transport.globalTransport(midi.FPT_Record, int(
-                            event.data2 > 0) * 2, event.pmeFlags)
-
-
-                    # -------------
-                    # SONG / LOOP
-                    # -------------
-                    elif event.data1 == 0x5A:  # song/loop
-                        transport.globalTransport(midi.FPT_Loop, int(event.data2 > 0) * 2, event.pmeFlags)
-                    # ------
-                    # SNAP
-                    # ------
-                    elif event.data1 == 0x4E:
-                        if self.Shift:
-                            if event.data2 > 0:
-                                transport.globalTransport(
-                                    midi.FPT_SnapMode, 1, event.pmeFlags)
-                            else:
-                                transport.globalTransport(midi.FPT_Snap, int(
-                                    event.data2 > 0) * 2, event.pmeFlags)
-
-                    # --------
-                    # ESCAPE
-                    # --------
-                    elif event.data1 == 0x52:
-                        if (self.Shift == False):
-                            transport.globalTransport(
-                                midi.FPT_Escape + int(self.Shift) * 2, int(event.data2 > 0) * 2, event.pmeFlags)
-                    # --------
-                    # ENTER
-                    # --------
-                    elif event.data1 == 0x53:
-                        transport.globalTransport(
-                            midi.FPT_Enter + int(self.Shift) * 2, int(event.data2 > 0) * 2, event.pmeFlags)
-
-                    # ------------
-                    # VPOT PUSH
-                    # ------------
-                    elif event.data1 in [0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27]:
-                        if self.Page == MackieCUPage_Free:
-                            i = event.data1 - 0x20
-                            self.ColT[i].KnobHeld = event.data2 > 0
-                            if event.data2 > 0:
-                                self.ColT[i].Peak = self.ActivityMax
-                                event.data1 = self.ColT[i].BaseEventID + 2
-                                event.outEv = 0
-                                event.isIncrement = 2
-                                self.SendMsg2(
-                                    'Free knob switch ' + str(event.data1))
-                                device.processMIDICC(event)
-                            device.hardwareRefreshMixerTrack(
-                                self.ColT[i].TrackNum)
-                            return
-                        elif event.data2 > 0:
-                            n = event.data1 - 0x20
-                            if self.Page == MackieCUPage_Sends:
-                                if mixer.setRouteTo(mixer.trackNumber(), self.ColT[n].TrackNum, -1) < 0:
-                                    self.SendMsg2('Cannot send to this track')
-                                else:
-                                    if mixer.getRouteSendActive(mixer.trackNumber(), self.ColT[n].TrackNum):
-                                        self.SendMsg2("VPOT set for send to " + mixer.getTrackName(self.ColT[n].TrackNum))
-                                    else:
-                                        self.SendMsg2("The "+mixer.getTrackName(self.ColT[n].TrackNum)+" VPOT has been reset")
-                                    mixer.afterRoutingChanged()
-                            else:
-                                if self.Page == MackieCUPage_EQ:
-                                    if event.data1 == 0x27: # "Reset All"
-                                        self.SetKnobValue(0, midi.MaxInt)
-                                        self.SetKnobValue(1, midi.MaxInt)
-                                        self.SetKnobValue(2, midi.MaxInt)
-                                        self.SetKnobValue(3, midi.MaxInt)
-                                        self.SetKnobValue(4, midi.MaxInt)
-                                        self.SetKnobValue(5, midi.MaxInt)
-                                        self.SetKnobValue(6, midi.MaxInt)
-                                        self.SetKnobValue(7, midi.MaxInt)
-                                        SendMsg2("All EQ levels reset")
-                                else:
-                                    self.SetKnobValue(n, midi.MaxInt)
-                                    if self.Page == MackieCUPage_FX:
-                                            SendMsg2("\\ Pending Functionality! \\")
-                    # -------------------
-                    # FREE HOLD BUTTONS
-                    # -------------------
-                    elif (event.data1 >= 0) & (event.data1 <= 0x1F):
-                        if self.Page == MackieCUPage_Free:
-                            i = event.data1 % 8
-                            self.ColT[i].Peak = self.ActivityMax
-                            event.data1 = self.ColT[i].BaseEventID + \
-                                3 + event.data1 // 8
-                            event.inEv = event.data2
-                            event.outEv = int(event.inEv > 0) * \
-                                midi.FromMIDI_Max
-                            self.SendMsg2('Free button ' + str(event.data1) +
-                                          ': ' + OffOnStr[event.outEv > 0])
-                            device.processMIDICC(event)
-                            device.hardwareRefreshMixerTrack(self.ColT[i].TrackNum)
-                            return
-
-
-                if (event.pmeFlags & midi.PME_System_Safe != 0):
-                    # shift options with f1 ..f8
-                    # F1..F8
-                    #if self.Shift & (event.data1 in [0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D]):
-                    #    transport.globalTransport(midi.FPT_F1 - 0x36 +
-                    #                              event.data1, int(event.data2 > 0) * 2, event.pmeFlags)
-                    #     event.data1 = 0xFF
-                    # -----------------------------------------------
-                    # LINK SELECTED CHANNELS TO CURRENT MIXER TRACK
-                    # -----------------------------------------------
-                    if event.data1 == 0x47:
-                        if event.data2 > 0:
-                            if self.Shift:
-                                mixer.linkTrackToChannel(
-                                    midi.ROUTE_StartingFromThis)
-                            else:
-                                mixer.linkTrackToChannel(midi.ROUTE_ToThis)
-                                self.SendMsg2(
-                                    "Chanel Track and Mixer Track now linked")
-                    # -----------
-                    # ITEM MENU
-                    # -----------
-                    elif event.data1 == 0x3B:
-                        transport.globalTransport(midi.FPT_ItemMenu, int(
-                            event.data2 > 0) * 2, event.pmeFlags)
-                        if event.data2 > 0:
-                            self.SendMsg2('Item Menu', 10)
-
- 
-                    # -------------------
-                    # IN / OUT / SELECT
-                    # -------------------
-                    elif event.data1 in [0x4D, 0x4E, 0x4F]:
-                        #Ensure the playlist is selected:
-                        ui.showWindow(midi.widPlaylist)
-                        ui.setFocused(midi.widPlaylist)
-                        if event.data1 == 0x4F:
-                            n = midi.FPT_Punch
-                        else:
-                            n = midi.FPT_PunchIn + event.data1 - 0x4D
-                        if event.data1 >= 0x4E:
-                            self.SliderHoldCount += -1 + \
-                                (int(event.data2 > 0) * 2)
-                        if not ((event.data1 == 0x4D) & (event.data2 == 0)):
-                            device.directFeedback(event)
-                        if (event.data1 >= 0x4E) & (event.data2 >= int(event.data1 == 0x4E)):
-                            if device.isAssigned():
-                                device.midiOutMsg(
-                                    (0x4D << 8) + midi.TranzPort_OffOnT[False])
-                        if transport.globalTransport(n, int(event.data2 > 0) * 2, event.pmeFlags) == midi.GT_Global:
-                            t = -1
-                            if n == midi.FPT_Punch:
-                                if event.data2 != 1:
-                                    t = int(event.data2 != 2)
-                            elif event.data2 > 0:
-                                t = int(n == midi.FPT_PunchOut)
-                            if t >= 0:
-                                self.SendMsg2(ui.getHintMsg())
-
-
-                    # -----------
-                    # ADD MARKER
-                    # -----------
-                    elif (event.data1 == 0x49): 
-                        if (transport.globalTransport(midi.FPT_AddMarker + int(self.Shift), int(event.data2 > 0) * 2, event.pmeFlags) == midi.GT_Global) & (event.data2 > 0):
-                            self.SendMsg2(ui.getHintMsg())
-
-                    # --------
-                    # SELECT
-                    # --------
-                    elif (event.data1 >= 0x18) & (event.data1 <= 0x1F):
-                        if event.data2 > 0:
-                            i = event.data1 - 0x18
-
-                            ui.showWindow(midi.widMixer)
-                            ui.setFocused(midi.widMixer)
-                            self.UpdateLEDs()
-                            mixer.setTrackNumber(
-                                self.ColT[i].TrackNum, midi.curfxScrollToMakeVisible | midi.curfxMinimalLatencyUpdate)
-
-                            if self.Control:  # Link channel to track
-                                mixer.linkTrackToChannel(midi.ROUTE_ToThis)
-                            # Show Full Trackname on second display:
-                            # EXPAND WITH CONTEXT?
-                            SendMsg2(mixer.getTrackName(self.ColT[i].TrackNum))
-                    # ------
-                    # SOLO
-                    # ------
-                    elif (event.data1 >= 0x8) & (event.data1 <= 0xF):  # solo
-                        if event.data2 > 0:
-                            i = event.data1 - 0x8
-                            self.ColT[i].solomode = midi.fxSoloModeWithDestTracks
-                            if self.Shift:
-                                Include(self.ColT[i].solomode,
-                                        midi.fxSoloModeWithSourceTracks)
-                            mixer.soloTrack(self.ColT[i].TrackNum,
-                                            midi.fxSoloToggle, self.ColT[i].solomode)
-                            mixer.setTrackNumber(
-                                self.ColT[i].TrackNum, midi.curfxScrollToMakeVisible)
-
-                    # ------
-                    # MUTE
-                    # ------
-                    elif (event.data1 >= 0x10) & (event.data1 <= 0x17):  # mute
-                        if event.data2 > 0:
-                            mixer.enableTrack(
-                                self.ColT[event.data1 - 0x10].TrackNum)
-
-                    elif (event.data1 >= 0x0) & (event.data1 <= 0x7):  # arm
-                        if event.data2 > 0:
-                            mixer.armTrack(self.ColT[event.data1].TrackNum)
-                            if mixer.isTrackArmed(self.ColT[event.data1].TrackNum):
-                                self.SendMsg2(mixer.getTrackName(
-                                    self.ColT[event.data1].TrackNum) + ' recording to ' + mixer.getTrackRecordingFileName(self.ColT[event.data1].TrackNum), 2500)
-                            else:
-                                self.SendMsg2(mixer.getTrackName(
-                                    self.ColT[event.data1].TrackNum) + ' unarmed')
-                    # ------
-                    # SAVE
-                    # ------
-                    elif event.data1 == 0x50:  # save/save new
-                        transport.globalTransport(
-                            midi.FPT_Save + int(self.Shift), int(event.data2 > 0) * 2, event.pmeFlags)
-                    event.handled = True
-                else:
-                    event.handled = False
-            else:
-                event.handled = False
-        if debug:
-            print('OnMidiMsg() '+str(event))
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  HANDLES KNOB FUNCTIONS                                                                                                   #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def SetKnobValue(self, Num, Value, Res=midi.EKRes):
-        if (self.ColT[Num].KnobEventID >= 0) & (self.ColT[Num].KnobMode < 4):
-            if Value == midi.MaxInt:
-                if self.Page == MackieCUPage_FX:
-                    if self.ColT[Num].KnobPressEventID >= 0:
-                        Value = channels.incEventValue(
-                            self.ColT[Num].KnobPressEventID, 0, midi.EKRes)
-                        channels.processRECEvent(
-                            self.ColT[Num].KnobPressEventID, Value, midi.REC_Controller)
-                        s = mixer.getEventIDName(
-                            self.ColT[Num].KnobPressEventID)
-                        self.SendMsg2(s)
-                    self.CurPluginID = Num
-                    self.PluginParamOffset = 0
-                    self.UpdateColT()
-                    self.UpdateLEDs()
-                    self.UpdateTextDisplay()
-                    return
-                else:
-                    mixer.automateEvent(
-                        self.ColT[Num].KnobResetEventID, self.ColT[Num].KnobResetValue, midi.REC_MIDIController, self.SmoothSpeed)
-            else:
-                mixer.automateEvent(
-                    self.ColT[Num].KnobEventID, Value, midi.REC_Controller, self.SmoothSpeed, 1, Res)
-            # hint
-            n = mixer.getAutoSmoothEventValue(self.ColT[Num].KnobEventID)
-            s = mixer.getEventIDValueString(self.ColT[Num].KnobEventID, n)
-            if s != '':
-                s = ': ' + s
-            self.SendMsg2(self.ColT[Num].KnobName + s)
-        if debug:
-            print('SetKnobValue()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  UPDATE BUTTON LEDS                                                                                                       #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def UpdateLEDs(self):
-
-        if device.isAssigned():
-            # stop
-            device.midiOutNewMsg(
-                (0x5D << 8) + midi.TranzPort_OffOnT[transport.isPlaying() == midi.PM_Stopped], 0)
-            # loop
-            LoopMode = transport.getLoopMode()
-            device.midiOutNewMsg((0x5A << 8) +
-                                 midi.TranzPort_OffOnT[LoopMode == midi.SM_Pat], 1)
-            # record
-            r = transport.isRecording()
-            device.midiOutNewMsg(
-                (0x5F << 8) + midi.TranzPort_OffOnT[r], 2)
-            # SMPTE/BEATS
-            device.midiOutNewMsg(
-                (0x71 << 8) + midi.TranzPort_OffOnT[ui.getTimeDispMin()], 3)
-            device.midiOutNewMsg(
-                (0x72 << 8) + midi.TranzPort_OffOnT[not ui.getTimeDispMin()], 4)
-            # self.Page
-            for m in range(0,  6):
-                device.midiOutNewMsg(
-                    ((0x28 + m) << 8) + midi.TranzPort_OffOnT[m == self.Page], 5 + m)
-            # changed flag
-            device.midiOutNewMsg(
-                (0x50 << 8) + midi.TranzPort_OffOnT[general.getChangedFlag() > 0], 11)
-            # metronome
-            device.midiOutNewMsg(
-                (0x59 << 8) + midi.TranzPort_OffOnT[general.getUseMetronome()], 12)
-            # rec precount
-            device.midiOutNewMsg(
-                (0x58 << 8) + midi.TranzPort_OffOnT[general.getPrecount()], 13)
-            # self.Scrub
-            device.midiOutNewMsg((0x65 << 8) +
-                                 midi.TranzPort_OffOnT[self.Scrub], 15)
-            # use RUDE SOLO to show if any track is armed for recording
-            b = 0
-            for m in range(0,  mixer.trackCount()):
-                if mixer.isTrackArmed(m):
-                    b = 1 + int(r)
-                    break
-
-            device.midiOutNewMsg(
-                (0x73 << 8) + midi.TranzPort_OffOnBlinkT[b], 16)
-            # smoothing
-            device.midiOutNewMsg(
-                (0x33 << 8) + midi.TranzPort_OffOnT[self.SmoothSpeed > 0], 17)
-            # self.Flip
-            device.midiOutNewMsg(
-                (0x32 << 8) + midi.TranzPort_OffOnT[self.Flip], 18)
-            # focused windows
-            device.midiOutNewMsg(
-                (0x45 << 8) + midi.TranzPort_OffOnT[ui.getFocused(midi.widBrowser)], 20)
-            device.midiOutNewMsg((0x3E << 8) +
-                                 midi.TranzPort_OffOnT[ui.getFocused(midi.widPlaylist)], 21)
-            BusLed = ui.getFocused(midi.widMixer) & (
-                self.ColT[0].TrackNum >= 100)
-            OutputLed = ui.getFocused(midi.widMixer) & (
-                self.ColT[0].TrackNum >= 0) & (self.ColT[0].TrackNum <= 1)
-            InputLed = ui.getFocused(midi.widMixer) & (
-                not OutputLed) & (not BusLed)
-            device.midiOutNewMsg((0x3F << 8) +
-                                 midi.TranzPort_OffOnT[InputLed], 22)
-            device.midiOutNewMsg((0x41 << 8) +
-                                 midi.TranzPort_OffOnT[ui.getFocused(midi.widChannelRack)], 23)
-            device.midiOutNewMsg((0x43 << 8) +
-                                 midi.TranzPort_OffOnT[BusLed], 24)
-            device.midiOutNewMsg(
-                (0x44 << 8) + midi.TranzPort_OffOnT[OutputLed], 25)
-
-            # device.midiOutNewMsg((0x4B << 8) + midi.TranzPort_OffOnT[ui.getFocused(midi.widChannelRack)], 21)
-        if debug:
-            print('UpdateLEDs()')
-
-
-
-# -------------------------------------------------------------------------------------------------------------------------------
-# PROCEDURES
-# -------------------------------------------------------------------------------------------------------------------------------
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    # TRACK SELECTION                                                                                                           #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def TrackSel(self, Index, Step):
-        Index = 2 - Index
-        device.baseTrackSelect(Index, Step)
-        if Index == 0:
-            # print(channels.channelNumber)
-            s = channels.getChannelName(channels.channelNumber())
-            self.SendMsg2('Selected Channel: ' + s)
-        elif Index == 1:
-            self.SendMsg2('Selected Mixer track: ' +
-                          mixer.getTrackName(mixer.trackNumber()))
-        elif Index == 2:
-            #if self.Shift:
-            #    #open the piano roll:
-            #    ui.hideWindow(midi.widPlaylist)
-            #    ui.showWindow(midi.widPianoRoll)
-            #    ui.setFocused(midi.widPianoRoll)
-            #else:
-            s = patterns.getPatternName(patterns.patternNumber())
-            self.SendMsg2('Selected Pattern: ' + s)
-            if transport.getLoopMode()==1:   
-            # Ensure that we are in Pattern Mode:
-                transport.globalTransport(midi.FPT_Loop,2) 
-                patterns.selectPattern(patterns.patternNumber()) 
-
-        if debug:
-            print('TrackSel() '+str(Index) + " " + str(Step))
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    # PRINCIPAL JOG DIAL OPERATIONS                                                                                             #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def Jog(self, event):
-        print("JOG SOURCE ="+str(self.JogSource))
-        if self.JogSource == 0:
-            transport.globalTransport(
-                midi.FPT_Jog + int(self.Shift ^ self.Scrub), event.outEv, event.pmeFlags)  # relocate
-        elif self.JogSource == 0x46:
-            transport.globalTransport(
-                midi.FPT_MoveJog, event.outEv, event.pmeFlags)
-            self.SendMsg2(
-                "Hold using JogDial to move selected item in playlist")
-        elif self.JogSource == 0x48:
-            if self.Shift:
-                s = 'Marker selection'
-            else:
-                ui.showWindow(midi.widPlaylist)
-                ui.setFocused(midi.widPlaylist)
-                s = 'Hold MARK while using Jog Dial to navigate markers'
-            if event.outEv != 0:
-                if transport.globalTransport(midi.FPT_MarkerJumpJog + int(self.Shift), event.outEv, event.pmeFlags) == midi.GT_Global:
-                    s = ui.getHintMsg()
-            self.SendMsg2(s)
-
-        elif self.JogSource == 0x3D:
-            if event.outEv == 0:
-                s = 'Undo history'
-            elif transport.globalTransport(midi.FPT_UndoJog, event.outEv, event.pmeFlags) == midi.GT_Global:
-                s = ui.GetHintMsg()
-            self.OnSendTempMsg(
-                self.ArrowsStr + s + ' (level ' + general.getUndoLevelHint() + ')', 500)
-
-        elif self.JogSource == 0x64:
-            if event.outEv != 0:
-                transport.globalTransport(
-                    midi.FPT_HZoomJog + int(self.Shift), event.outEv, event.pmeFlags)
-
-        elif self.JogSource == 0x4C:
-
-            if event.outEv != 0:
-                transport.globalTransport(
-                    midi.FPT_WindowJog, event.outEv, event.pmeFlags)
-            # Application.ProcessMessages
-            s = ui.getFocusedFormCaption()
-            if s != "":
-                self.SendMsg2('Current window: ' + s)
-
-        elif (self.JogSource == 0x3F) & (event.outEv == 0):
-            self.SetFirstTrack(mixer.trackNumber())
-            ui.showWindow(midi.widMixer)
-            ui.setFocused(midi.widMixer)
-
-        elif (self.JogSource == 0x3E) | (self.JogSource == 0x3F):
-            self.TrackSel(self.JogSource -
-                          0x3E, event.outEv)
-            if self.JogSource == 0x3E:
-                ui.showWindow(midi.widPlaylist)
-                ui.setFocused(midi.widPlaylist)
-            elif self.JogSource == 0x3F:
-                ui.showWindow(midi.widMixer)
-                ui.setFocused(midi.widMixer)
-
-        #elif self.JogSource == 0x41:
-        #    ui.showWindow(midi.widChannelRack)
-        #    ui.setFocused(midi.widChannelRack)
-        #    self.TrackSel(2, event.outEv)
-
-        elif (self.JogSource == 0x44):
-            ui.showWindow(midi.widMixer)
-            ui.setFocused(midi.widMixer)
-            self.SetFirstTrack(0 + event.outEv)
-
-        elif (self.JogSource == 0x43):
-            ui.showWindow(midi.widMixer)
-            ui.setFocused(midi.widMixer)
-            x = 125
-            while (x > 0):
-                trackName = mixer.getTrackName(x)
-                x -= 1
-                if trackName.startswith('Insert '):
-                    break
-            self.SetFirstTrack(x+2)
-
-        elif self.JogSource == 0x4a:
-            ui.showWindow(midi.widBrowser)
-            ui.setFocused(midi.widBrowser)
-            self.SendMsg2("Browser Window")
-            print("browser Wind")
-
-        elif self.JogSource == 0x41:
-
-            if event.outEv != 0:
-                channels.processRECEvent(midi.REC_Tempo, channels.incEventValue(midi.REC_Tempo, event.outEv, midi.EKRes),
-                                         midi.PME_RECFlagsT[int(event.pmeFlags & midi.PME_LiveInput != 0)] & (not midi.REC_FromMIDI))
-            self.SendMsg2('Tempo: ' +
-                          mixer.getEventIDValueString(midi.REC_Tempo, mixer.getCurrentTempo()))
-
-        #elif self.JogSource in [0x42, 0x43, 0x44, 0x45]:
-        #    # CC
-        #    event.data1 = 390 + self.JogSource - 0x42
-
-        #    if event.outEv != 0:
-        #        event.isIncrement = 1
-        #        s = chr(0x7E + int(event.outEv < 0))
-        #        self.SendMsg2('Free jog ' +
-        #                      str(event.data1) + ': ' + s)
-        #        device.processMIDICC(event)
-        #        return
-        #    else:
-        #        self.SendMsg2('Free jog ' + str(event.data1))
-        self.UpdateLEDs()
-        if debug:
-            print('JOG() '+str(event))
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #   SEND A MESSAGE TO THE FIRST DISPLAY                                                                                     #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def SendMsg(self, Msg, Row=0, Display=1):
-        if Display == 1:
-            sysex = self.LCD1 + bytearray(Msg, 'utf-8')
-            sysex.append(0xF7)
-            device.midiOutSysex(bytes(sysex))
-        elif Display == 2:
-            sysex = bytearray([0xF0, 0x00, 0x00, 0x67, 0x15, 0x13, (self.LastMsgLen + 1)
-                               * Row]) + bytearray(Msg.ljust(self.LastMsgLen + 1, ' '), 'utf-8')
-            sysex.append(0xF7)
-            device.midiOutSysex(bytes(sysex))
-        elif Display == 3:
-            ui.setHintMsg(Msg)
-        if debug:
-            print('SendMsg()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #   SEND A MESSAGE TO THE SECOND DISPLAY                                                                                    #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def SendMsg2(self, Msg, Duration=1000):
-        self.SendMsg('  '+Msg.ljust(54, ' '), 0, 2)
-        if debug:
-            print('SendMsg2() '+Msg)
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #   UPDATE THE TIME DISPLAY                                                                                                 #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def SendTimeMsg(self, Msg):
-        TempMsg = bytearray(10)
-        for n in range(0, len(Msg)):
-            TempMsg[n] = ord(Msg[n])
-
-        if device.isAssigned():
-            # send chars that have changed
-            for m in range(0, min(len(self.LastTimeMsg), len(TempMsg))):
-                if self.LastTimeMsg[m] != TempMsg[m]:
-                    device.midiOutMsg(midi.MIDI_CONTROLCHANGE +
-                                      ((0x49 - m) << 8) + ((TempMsg[m]) << 16))
-
-        self.LastTimeMsg = TempMsg
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  Called for short MIDI out messages sent from MIDI Out plugin.                                                            #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def SendAssignmentMsg(self, Msg):
-        if (len(Msg) < 3):
-            Msg = ' ' + Msg
-
-        device.midiOutMsg(midi.MIDI_CONTROLCHANGE +
-                          ((0x4B) << 8) + (ord(Msg[1]) << 16))
-        device.midiOutMsg(midi.MIDI_CONTROLCHANGE +
-                          ((0x4A) << 8) + (ord(Msg[2]) << 16))
-        if debug:
-            print('SendAssignmentMsg() '+str(Msg))
-
-    def UpdateTempMsg(self):
-
-        self.SendMsg(self.TempMsgT[int(self.TempMsgCount != 0)])
-        if debug:
-            print('UpdateTempMsg()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  HANDLES PRINCIPAL LOGIC FOR DISPLAYING DATA ON DISPLAYS                                                                  #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def UpdateTextDisplay(self):
-        s1 = ''
-        s2 = ''
-        s3 = '  '
-        ch = "CH"
-        master = 'MASTER '
-        EffectsExist = False
-        if self.Page == MackieCUPage_Free:
-            ch = "FR"
-        elif self.Page == MackieCUPage_FX:
-            ch = "FX"
-        elif self.Page == MackieCUPage_EQ:
-            ch = "EQ"
-        for m in range(0, len(self.ColT) - 1):
-            s = ''
-            sa = ''
-            sa2 = ''
-            if self.Page == MackieCUPage_Free:
-                s = '  ' + utils.Zeros(self.ColT[m].TrackNum + 1, 2, ' ')
-                ch = "FR"
-                master = "FR08   "
-            elif self.Page == MackieCUPage_FX and self.CurPluginID == -1:
-                ch = "FX"
-                master = "FX08   "
-                if plugins.isValid(mixer.trackNumber(), m):
-                    EffectsExist = True
-                    #s = DisplayName(plugins.getPluginName(self.ColT[m].TrackNum,m))
-                    t = (plugins.getPluginName(mixer.trackNumber(), m)).split()
-                    s = t[0][0:6]
-                    if len(t) == 3:
-                        # otherwise we can miss important aspects of the plugin like version number
-                        t[1] = t[1]+t[2]
-                    if len(t) >= 2:
-                        sa = t[1][0:6].title()
-                    elif (len(t) == 1 and len(t[0]) > 6):
-                        sa = t[0][6:]
-                        if len(sa) == 1:  # This just looks ugly so instead:
-                            s = t[0][0:5]
-                            sa = t[0][5:]
-                    else:
-                        sa = "       "
-                else:
-                    s = "   \\   "  # invalid
-                    sa = "   \\   "
-                if self.ColT[m].TrackNum > 99:
-                    sa2 = ch[1]+str(self.ColT[m].TrackNum).zfill(2)+'  '
-                else:
-                    sa2 = 'ch'+str(self.ColT[m].TrackNum).zfill(2)+'  '
-            elif self.Page == MackieCUPage_FX and self.CurPluginID > -1:  # plugin params
-                t = self.ColT[m].TrackName.split()
-                if len(t) > 0:
-                    print(t)
-                    s = t[0][0:6]
-                    if len(t) == 3:
-                        # otherwise we can miss important aspects of the param
-                        t[1] = t[1]+t[2]
-                    if len(t) >= 2:
-                        sa = t[1][0:6].title()
-                    elif (len(t) == 1 and len(t[0]) > 6):
-                        sa = t[0][6:]
-                        if len(sa) == 1:  # This just looks ugly so instead:
-                            s = t[0][0:5]
-                            sa = t[0][5:]
-                    else:
-                        sa = "       "
-                else:
-                    s = "      "
-                    sa = "      "
-            else:
-                if self.ShowTrackNumbers:
-                    s = mixer.getTrackName(self.ColT[m].TrackNum, 6)
-                    sa = '   '+str(self.ColT[m].TrackNum)+' '
-                else:
-                    t = mixer.getTrackName(self.ColT[m].TrackNum, 12).split()
-                    if len(t) > 0:
-                        print(t)
-                        s = t[0][0:6]
-                        if len(t) == 3:
-                            # otherwise we can miss important aspects of the name
-                            t[1] = t[1]+t[2]
-                        if len(t) >= 2:
-                            sa = t[1][0:6].title()
-                        elif (len(t) == 1 and len(t[0]) > 6):
-                            sa = t[0][6:]
-                            # This just looks ugly so instead:
-                            if len(sa) == 1:
-                                s = t[0][0:5]
-                                sa = t[0][5:]
-                        else:
-                            sa = "       "
-                    else:
-                        s = "      "
-                        sa = "      "
-
-            if self.ColT[m].TrackNum > 99:
-                sa2 = ch[1]+str(self.ColT[m].TrackNum).zfill(2)+'  '
-            else:
-                sa2 = ch+str(self.ColT[m].TrackNum).zfill(2)+'  '
-            for n in range(1, 7 - len(s) + 1):
-                s = s + ' '
-            for n in range(1, 7 - len(sa) + 1):
-                sa = sa + ' '
-            s1 = s1 + s
-            s2 = s2 + sa
-            s3 = s3 + sa2
-            if self.Page == MackieCUPage_Free:
-                if self.FreeText == 0:
-                    # Good for all (most) Roland Zenology Instruments
-                    self.SendMsg2("(Zenology Instruments)")
-                    s2 = "Cutoff  Reso   Attack Release Vibrato Decay Sust  Level"
-                elif self.FreeText == 1:
-                    self.SendMsg2("(Common Synth Parameters)")
-                    s2 = "Cutoff  Reso   Attack  Decay  Sustain Release Vib Level"  
-                elif self.FreeText == 2:
-                    self.SendMsg2("(Generic Parameters)")
-                    s2 = "Param1 Param2 Param3 Param4 Param5 Param6 Param7 Param8"  
-                else:
-                    self.SendMsg2("Blank")
-                    s2 = "                                                       "  # Or maybe just blank?
-            if self.Page == MackieCUPage_EQ:
-                s1 = "  Low    Med    High   Low    Med   High           Reset"
-                s2 = "  Freq   Freq   Freq   Width  Width Width           All "
-        self.SendMsg(s1+s2)
-        if (self.ColT[m].TrackNum < 9):
-            self.SendMsg(s3[0:105] + master, 1, 2)
-        else:
-            self.SendMsg(
-                s3[0:105] + 'BNK'+str(math.ceil(self.ColT[m].TrackNum/8)-1).zfill(2), 1, 2)
-        if debug:
-            print('UpdateTextDisplay()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  HANDLES UPDATING OF CHANNEL STRIPS FOR ASSIGNMENT SENDS, FX AND FREE                                                     #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def UpdateMixer_Sel(self):
-
-        if self.Page != MackieCUPage_Free:
-            if device.isAssigned():
-                for m in range(0, len(self.ColT) - 1):
-                    device.midiOutNewMsg(((0x18 + m) << 8) +
-                                         midi.TranzPort_OffOnT[self.ColT[m].TrackNum == mixer.trackNumber()], self.ColT[m].LastValueIndex + 4)
-
-            if self.Page in [MackieCUPage_Sends, MackieCUPage_FX]:
-                self.UpdateColT()
-        if debug:
-            print('UpdateMixer_Sel()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  PRINCIPAL FUNCTION RESPONSIBLE FOR UPDATINGCOLUMNS                                                                       #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def UpdateCol(self, Num):
-
-        data1 = 0
-        data2 = 0
-        baseID = 0
-        center = 0
-        b = False
-
-        if device.isAssigned():
-            if self.Page == MackieCUPage_Free:
-                baseID = midi.EncodeRemoteControlID(
-                    device.getPortNumber(), 0, self.ColT[Num].BaseEventID)
-                # slider
-                m = self.FreeCtrlT[self.ColT[Num].TrackNum]
-                device.midiOutNewMsg(midi.MIDI_PITCHBEND + Num + ((m & 0x7F)
-                                                                  << 8) + ((m >> 7) << 16), self.ColT[Num].LastValueIndex + 5)
-                if Num < 8:
-                    # ring
-                    d = mixer.remoteFindEventValue(
-                        baseID + int(self.ColT[Num].KnobHeld))
-                    if d >= 0:
-                        m = 1 + round(d * 10)
-                    else:
-                        m = int(self.ColT[Num].KnobHeld) * (11 + (2 << 4))
-                    device.midiOutNewMsg(
-                        midi.MIDI_CONTROLCHANGE + ((0x30 + Num) << 8) + (m << 16), self.ColT[Num].LastValueIndex)
-                    # buttons
-                    for n in range(0, 4):
-                        d = mixer.remoteFindEventValue(baseID + 3 + n)
-                        if d >= 0:
-                            b = d >= 0.5
-                        else:
-                            b = False
-
-                        device.midiOutNewMsg(
-                            ((n * 8 + Num) << 8) + midi.TranzPort_OffOnT[b], self.ColT[Num].LastValueIndex + 1 + n)
-            else:
-                sv = mixer.getEventValue(self.ColT[Num].SliderEventID)
-
-                if Num < 8:
-                    # V-Pot
-                    center = self.ColT[Num].KnobCenter
-                    if self.ColT[Num].KnobEventID >= 0:
-                        m = mixer.getEventValue(
-                            self.ColT[Num].KnobEventID, midi.MaxInt, False)
-                        if center < 0:
-                            if self.ColT[Num].KnobResetEventID == self.ColT[Num].KnobEventID:
-                                center = int(
-                                    m != self.ColT[Num].KnobResetValue)
-                            else:
-                                center = int(
-                                    sv != self.ColT[Num].KnobResetValue)
-
-                        if self.ColT[Num].KnobMode < 2:
-                            print("knobmode<2")
-                            data1 = 1 + round(m * (10 / midi.FromMIDI_Max))
-                        else:
-                            data1 = round(m * (11 / midi.FromMIDI_Max))
-                        if self.ColT[Num].KnobMode > 3:
-                            print("knobmode>3")
-                            data1 = (center << 6)
-                        else:
-                            data1 = data1 + \
-                                (self.ColT[Num].KnobMode << 4) + (center << 6)
-                    else:
-                        data1 = 0
-
-                        if self.Page == MackieCUPage_FX:
-                            # Plugin Parameter Value
-                            paramValue = plugins.getParamValue(int(
-                                Num + self.PluginParamOffset), mixer.trackNumber(), int(self.CurPluginID + self.CurPluginOffset))
-                            data1 = int(paramValue)
-                            self.SendMsg2("To Do \\:-) ")
-                            # TODO fix when getParamValue starts working
-
-                    device.midiOutNewMsg(midi.MIDI_CONTROLCHANGE + ((0x30 + Num) << 8) + (data1 << 16), self.ColT[Num].LastValueIndex)
-
-                    # arm, solo, mute
-                    device.midiOutNewMsg(((0x00 + Num) << 8) + midi.TranzPort_OffOnBlinkT[int(mixer.isTrackArmed(
-                        self.ColT[Num].TrackNum)) * (1 + int(transport.isRecording()))], self.ColT[Num].LastValueIndex + 1)
-                    device.midiOutNewMsg(((0x08 + Num) << 8) + midi.TranzPort_OffOnT[mixer.isTrackSolo(
-                        self.ColT[Num].TrackNum)], self.ColT[Num].LastValueIndex + 2)
-                    device.midiOutNewMsg(((0x10 + Num) << 8) + midi.TranzPort_OffOnT[not mixer.isTrackEnabled(
-                        self.ColT[Num].TrackNum)], self.ColT[Num].LastValueIndex + 3)
-
-                # slider
-                data1 = self.AlphaTrack_LevelToSlider(sv)
-                data2 = data1 & 127
-                data1 = data1 >> 7
-                device.midiOutNewMsg(midi.MIDI_PITCHBEND + Num + (data2 << 8) +
-                                     (data1 << 16), self.ColT[Num].LastValueIndex + 5)
-
-            Dirty = False
-        if debug:
-            print('UpdateCol()')
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  PRINCIPAL PROCEDURE FOR HANDLING INTERNAL COLUMN LIST                                                                    #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def UpdateColT(self):
-
-        f = self.FirstTrackT[self.FirstTrack]
-        CurID = mixer.getTrackPluginId(mixer.trackNumber(), 0)
-        for m in range(0, len(self.ColT)):
-            if self.Page == MackieCUPage_Free:
-                # free controls
-                if m == 8:
-                    self.ColT[m].TrackNum = MackieCU_nFreeTracks
-                else:
-                    self.ColT[m].TrackNum = (f + m) % MackieCU_nFreeTracks
-
-                self.ColT[m].KnobName = 'Knob ' + \
-                    str(self.ColT[m].TrackNum + 1)
-                self.ColT[m].SliderName = 'Slider ' + \
-                    str(self.ColT[m].TrackNum + 1)
-
-                self.ColT[m].BaseEventID = self.FreeEventID + \
-                    self.ColT[m].TrackNum * 8  # first virtual CC
-            else:
-                self.ColT[m].KnobPressEventID = -1
-                ch = 'CH'+str(self.ColT[m].TrackNum).zfill(2) + ' - '
-
-                # mixer
-                if m == 8:
-                    self.ColT[m].TrackNum = -2
-                    self.ColT[m].BaseEventID = midi.REC_MainVol
-                    self.ColT[m].SliderEventID = self.ColT[m].BaseEventID
-                    self.ColT[m].SliderName = 'Master Volume'
-                else:
-                    self.ColT[m].TrackNum = midi.TrackNum_Master + \
-                        ((f + m) % mixer.trackCount())
-                    self.ColT[m].BaseEventID = mixer.getTrackPluginId(
-                        self.ColT[m].TrackNum, 0)
-                    self.ColT[m].SliderEventID = self.ColT[m].BaseEventID + \
-                        midi.REC_Mixer_Vol
-                    s = ch+mixer.getTrackName(self.ColT[m].TrackNum)
-                    self.ColT[m].SliderName = s + ' - Volume'
-
-                    self.ColT[m].KnobEventID = -1
-                    self.ColT[m].KnobResetEventID = -1
-                    self.ColT[m].KnobResetValue = midi.FromMIDI_Max >> 1
-                    self.ColT[m].KnobName = ''
-                    self.ColT[m].KnobMode = 1  # parameter, pan, volume, off
-                    self.ColT[m].KnobCenter = -1
-
-                    self.ColT[m].TrackName = ''
-
-                    if self.Page == MackieCUPage_Pan:
-                        self.ColT[m].KnobEventID = self.ColT[m].BaseEventID + \
-                            midi.REC_Mixer_Pan
-                        self.ColT[m].KnobResetEventID = self.ColT[m].KnobEventID
-                        self.ColT[m].KnobName = mixer.getTrackName(
-                            self.ColT[m].TrackNum) + ' - ' + 'Panning'
-                    elif self.Page == MackieCUPage_Stereo:
-                        self.ColT[m].KnobEventID = self.ColT[m].BaseEventID + \
-                            midi.REC_Mixer_SS
-                        self.ColT[m].KnobResetEventID = self.ColT[m].KnobEventID
-                        self.ColT[m].KnobName = mixer.getTrackName(
-                            self.ColT[m].TrackNum) + ' - ' + 'Separation'
-                    elif self.Page == MackieCUPage_Sends:
-                        self.ColT[m].KnobEventID = CurID + \
-                            midi.REC_Mixer_Send_First + self.ColT[m].TrackNum
-                        s = mixer.getEventIDName(self.ColT[m].KnobEventID)
-                        self.ColT[m].KnobName = s
-                        self.ColT[m].KnobResetValue = round(
-                            12800 * midi.FromMIDI_Max / 16000)
-                        self.ColT[m].KnobCenter = mixer.getRouteSendActive(
-                            mixer.trackNumber(), self.ColT[m].TrackNum)
-                        if self.ColT[m].KnobCenter == 0:
-                            self.ColT[m].KnobMode = 4
-                        else:
-                            self.ColT[m].KnobMode = 2
-                    elif self.Page == MackieCUPage_FX:
-                        if self.CurPluginID == -1:  # Plugin not selected
-                            self.ColT[m].CurID = mixer.getTrackPluginId(
-                                mixer.trackNumber(), m + self.CurPluginOffset)
-                            self.ColT[m].KnobEventID = self.ColT[m].CurID + \
-                                midi.REC_Plug_MixLevel
-                            s = mixer.getEventIDName(self.ColT[m].KnobEventID)
-                            self.ColT[m].KnobName = s
-                            self.ColT[m].KnobResetValue = midi.FromMIDI_Max
-
-                            IsValid = mixer.isTrackPluginValid(
-                                mixer.trackNumber(), m + self.CurPluginOffset)
-                            IsEnabledAuto = mixer.isTrackAutomationEnabled(
-                                mixer.trackNumber(), m + self.CurPluginOffset)
-                            if IsValid:
-                                self.ColT[m].KnobMode = 2
-                                #self.ColT[m].KnobEventID = self.ColT[m].CurID + midi.REC_Plug
-                                #self.ColT[m].KnobPressEventID = self.ColT[m].CurID + midi.REC_Plug_Mute
-
-                                self.ColT[m].TrackName = plugins.getPluginName(mixer.trackNumber(), m + self.CurPluginOffset)
-                            else:
-                                self.ColT[m].KnobMode = 4
-                            self.ColT[m].KnobCenter = int(IsValid & IsEnabledAuto)
-                        else:  # Plugin selected
-                            self.ColT[m].CurID = mixer.getTrackPluginId(
-                                mixer.trackNumber(), m + self.CurPluginOffset)
-                            if m + self.PluginParamOffset < plugins.getParamCount(mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset):
-                                self.ColT[m].TrackName = plugins.getParamName(m + self.PluginParamOffset, mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset)
-                                #print("plugin Param:"+self.ColT[m].TrackName)
-                                #print("plugin value:"+str(plugins.getParamValue(m + self.PluginParamOffset, mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset)))
-                                #print(plugins.getParamValue(m + self.PluginParamOffset, mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset))
-                                #plugins.setParamValue(0,m + self.PluginParamOffset, mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset)
-                            self.ColT[m].KnobMode = 2
-                            self.ColT[m].KnobEventID = -1
-                            print(self.ColT[m].TrackName)
-
-                    elif self.Page == MackieCUPage_EQ:
-                        if m < 3:
-                            # gain & freq
-                            self.ColT[m].SliderEventID = CurID + \
-                                midi.REC_Mixer_EQ_Gain + m
-                            self.ColT[m].KnobResetEventID = self.ColT[m].SliderEventID
-                            s = mixer.getEventIDName(
-                                self.ColT[m].SliderEventID)
-                            self.ColT[m].SliderName = s
-                            self.ColT[m].KnobEventID = CurID + \
-                                midi.REC_Mixer_EQ_Freq + m
-                            s = mixer.getEventIDName(self.ColT[m].KnobEventID)
-                            self.ColT[m].KnobName = s
-                            self.ColT[m].KnobResetValue = midi.FromMIDI_Max >> 1
-                            self.ColT[m].KnobCenter = -2
-                            self.ColT[m].KnobMode = 0
-                        else:
-                            if m < 6:
-                                # Q
-                                self.ColT[m].SliderEventID = CurID + \
-                                    midi.REC_Mixer_EQ_Q + m - 3
-                                self.ColT[m].KnobResetEventID = self.ColT[m].SliderEventID
-                                s = mixer.getEventIDName(
-                                    self.ColT[m].SliderEventID)
-                                self.ColT[m].SliderName = s
-                                self.ColT[m].KnobEventID = self.ColT[m].SliderEventID
-                                self.ColT[m].KnobName = self.ColT[m].SliderName
-                                self.ColT[m].KnobResetValue = 17500
-                                self.ColT[m].KnobCenter = -1
-                                self.ColT[m].KnobMode = 2
-                            else:
-                                self.ColT[m].SliderEventID = -1
-                                self.ColT[m].KnobEventID = -1
-                                self.ColT[m].KnobMode = 4
-
-                    # self.Flip knob & slider
-                    if self.Flip:
-                        self.ColT[m].KnobEventID, self.ColT[m].SliderEventID = utils.SwapInt(
-                            self.ColT[m].KnobEventID, self.ColT[m].SliderEventID)
-                        s = self.ColT[m].SliderName
-                        self.ColT[m].SliderName = self.ColT[m].KnobName
-                        self.ColT[m].KnobName = s
-                        self.ColT[m].KnobMode = 2
-                        if not (self.Page in [MackieCUPage_Sends, MackieCUPage_FX, MackieCUPage_EQ]):
-                            self.ColT[m].KnobCenter = -1
-                            self.ColT[m].KnobResetValue = round(
-                                12800 * midi.FromMIDI_Max / 16000)
-                            self.ColT[m].KnobResetEventID = self.ColT[m].KnobEventID
-
-            self.ColT[m].LastValueIndex = 48 + m * 6
-            self.ColT[m].Peak = 0
-            self.ColT[m].ZPeak = False
-            self.UpdateCol(m)
-        if debug:
-            print('UpdateColT()')
-
-    def SetJogSource(self, Value):
-
-        self.JogSource = Value
-        if debug:
-            print('SetJogSource()')
-
-    def OnWaitingForInput(self):
-
-        self.SendTimeMsg('..........')
-        if debug:
-            print('OnWaitingForInput()')
-
-    def UpdateClicking(self):  # switch self.Clicking for transport buttons
-
-        if device.isAssigned():
-            device.midiOutSysex(
-                bytes([0xF0, 0x00, 0x00, 0x66, 0x14, 0x0A, int(self.Clicking), 0xF7]))
-        if debug:
-            print('UpdateClicking()')
-    # set backlight timeout (0 should switch off immediately, but doesn't really work well)
-
-    def SetBackLight(self, Minutes):
-        if device.isAssigned():
-            device.midiOutSysex(bytes([0xF0, 0x00, 0x00, 0x66, 0x14, 0x0B, Minutes, 0xF7]))
-        if debug:
-            print('SetBackLight()')
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  HANDLES THE DISPLAY METERS                                                                                                #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def UpdateMeterMode(self):
-
-        # force vertical (activity) meter mode for free controls self.Page
-        if self.Page == MackieCUPage_Free:
-            self.CurMeterMode = 1
-        else:
-            self.CurMeterMode = self.MeterMode
-
-        if device.isAssigned():
-            # clear peak indicators
-            for m in range(0, len(self.ColT) - 1):
-                device.midiOutMsg(midi.MIDI_CHANAFTERTOUCH +
-                                  (0xF << 8) + (m << 12))
-            # disable all meters
-            for m in range(0, 8):
-                device.midiOutSysex(
-                    bytes([0xF0, 0x00, 0x00, 0x66, 0x14, 0x20, m, 0, 0xF7]))
-
-
-        # reset stuff
-        if self.CurMeterMode > 0:
-            self.TempMsgCount = -1
-        else:
-            self.TempMsgCount = 500 // 48 + 1
-
-        # $D for horizontal, $E for vertical meters
-        self.MeterMax = 0xD + int(self.CurMeterMode == 1)
-        self.ActivityMax = 0xD - int(self.CurMeterMode == 1) * 6
-
-        if device.isAssigned():
-            # device.midiOutSysex(bytes(bytearray([0xd1, 0xD, 0xF7])))
-            # device.midiOutSysex(bytes(bytearray([0xd1, 0xD+16, 0xF7])))
-            # horizontal/vertical meter mode
-            device.midiOutSysex(
-                bytes([0xF0, 0x00, 0x00, 0x66, 0x14, 0x21, int(self.CurMeterMode > 0), 0xF7]))
-
-            # enable all meters
-            if self.CurMeterMode == 2:
-                n = 1
-            else:
-                n = 1 + 2
-            for m in range(0, 8):
-                device.midiOutSysex(bytes([0xF0, 0x00, 0x00, 0x66, 0x14, 0x20, m, n, 0xF7]))
- 
-        if debug:
-            print('UpdateMeterMode()')
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  HANDLES ASSIGNMENT SELECTION (PLUS CRUDE EXTENDER POSITIONING)                                                            #
-    #                                                                                                                           #
-    #############################################################################################################################
-
-    def SetPage(self, Value):
-        oldPage = self.Page
-        self.Page = Value
-
-        self.FirstTrack = int(self.Page == MackieCUPage_Free)
-        receiverCount = device.dispatchReceiverCount()
-        if receiverCount == 0:
-            self.SetFirstTrack(self.FirstTrackT[self.FirstTrack])
-        elif self.Page == oldPage:
-            if self.ExtenderPos == ExtenderLeft:
-                for n in range(0, receiverCount):
-                    device.dispatch(n, midi.MIDI_NOTEON + (0x7F << 8) +
-                                    (self.FirstTrackT[self.FirstTrack] + (n * 8) << 16))
-                self.SetFirstTrack(
-                    self.FirstTrackT[self.FirstTrack] + receiverCount * 8)
-            elif self.ExtenderPos == ExtenderRight:
-                self.SetFirstTrack(self.FirstTrackT[self.FirstTrack])
-                for n in range(0, receiverCount):
-                    device.dispatch(n, midi.MIDI_NOTEON + (0x7F << 8) +
-                                    (self.FirstTrackT[self.FirstTrack] + ((n + 1) * 8) << 16))
-
-        if self.Page == MackieCUPage_Free:
-
-            BaseID = midi.EncodeRemoteControlID(
-                device.getPortNumber(), 0, self.FreeEventID + 7)
-            for n in range(0,  len(self.FreeCtrlT)):
-                d = mixer.remoteFindEventValue(BaseID + n * 8, 1)
-                if d >= 0:
-                    self.FreeCtrlT[n] = min(round(d * 16384), 16384)
-            # Toggle options for  Free Controls Text
-            if self.Shift:
-                if self.FreeText == 0:
-                    self.FreeText = 1
-                elif self.FreeText == 1:
-                    self.FreeText = 2
-                elif self.FreeText == 2:
-                        self.FreeText = -1
-                else:
-                    self.FreeText = 0
-
-        if (oldPage == MackieCUPage_Free) | (self.Page == MackieCUPage_Free):
-            self.UpdateMeterMode()
-
-        self.CurPluginID = -1
-        self.CurPluginOffset = 0
-
-        self.UpdateColT()
-        self.UpdateLEDs()
-        self.UpdateTextDisplay()
-        if debug:
-            print('SetPage() '+str(Value))
-
-    #############################################################################################################################
-    #                                                                                                                           #
-    #  SETS UP THE FIRST TRACK AFTER TRACK RELATED MOVEMENT OPERATIONS ARE CARRIED OUT                                          #
-    #                                                                                                                           #
-    #############################################################################################################################
-    def SetFirstTrack(self, Value):
-
-        if self.Page == MackieCUPage_Free:
-            self.FirstTrackT[self.FirstTrack] = (
-                Value + MackieCU_nFreeTracks) % MackieCU_nFreeTracks
-            s = utils.Zeros(self.FirstTrackT[self.FirstTrack] + 1, 2, ' ')
-        else:
-            self.FirstTrackT[self.FirstTrack] = (
-                Value + mixer.trackCount()) % mixer.trackCount()
-            s = utils.Zeros(self.FirstTrackT[self.FirstTrack], 2, ' ')
-        self.UpdateColT()
-        self.SendAssignmentMsg(s)
-        device.hardwareRefreshMixerTrack(-1)
-        if debug:
-            print('SetFirstTrack() '+str(Value))
-
-
-MackieCU = TMackieCU()
-
-
-def OnInit():
-    MackieCU.OnInit()
-
-
-def OnDeInit():
-    MackieCU.OnDeInit()
-
-
-def OnDirtyMixerTrack(SetTrackNum):
-    MackieCU.OnDirtyMixerTrack(SetTrackNum)
-
-
-def OnRefresh(Flags):
-    MackieCU.OnRefresh(Flags)
-
-
-def OnMidiMsg(event):
-    MackieCU.OnMidiMsg(event)
-
-
-def SendMsg2(Msg, Duration=1000):
-    MackieCU.SendMsg2(Msg, Duration)
-
-
-def OnUpdateBeatIndicator(Value):
-    MackieCU.OnUpdateBeatIndicator(Value)
-
-
-def OnUpdateMeters():
-    MackieCU.OnUpdateMeters()
-
-
-def OnIdle():
-    MackieCU.OnIdle()
-
-
-def OnWaitingForInput():
-    MackieCU.OnWaitingForInput()
+# name=ICON QCON Pro X
+# url= https://forum.image-line.com/viewtopic.php?f=1994&t=254916#p1607888
+# supportedDevices=ICON QCON Pro X
+# Based on the ImageLine default Mackie script (refactored for the ICON QCON Pro X)
+#
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Includes the following additional features:
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Support for the second screen
+# Support for the Stereo Master Meters
+# Support for the FL Studio Overlay (firmware 2)
+# Option to always default Jog Dial to the playlist (song pointer)
+# Option to display Track Numbers (default) or expanded TrackNames over 2 rows on the first screen
+# Dynamic Channel (Track) numbers shown on second screen
+# Dynamic Bank numbers shown on second screen
+# Full selected Track name shown on second screen
+# Current assignment information shown on second screen
+# All temporary messages defaulted to the second screen 
+# Added options for Mixer Colouring (+reset to default)
+# Added feedback (where possible) for all operations onto the second screen
+# Added support to reset all tracks to "un-muted" (with a single operation)
+# Added support to disarm all tracks (with a single operation)
+# Added 4 options for "Free Control" parameter naming choices
+# Added comment headers to asist with script readability
+# Added parameter value nanmesfor EQ Assignment (relating to default FL Studio Mixer parametric EQ)
+# Option added for EQ Assignment to "Reset all"
+
+import array
+import bisect
+import time
+import arrangement
+import channels
+import device
+import general
+import launchMapPages
+import math
+import midi
+import mixer
+import patterns
+import playlist
+import plugins
+import re
+import struct
+import transport
+import ui
+import utils
+try:
+    import threading
+except ImportError:
+    threading = None
+try:
+    import cProfile
+    import pstats
+except ImportError:
+    cProfile = None
+
+MackieCU_KnobOffOnT = [(midi.MIDI_CONTROLCHANGE + (1 << 6)) << 16,
+                       midi.MIDI_CONTROLCHANGE + ((0xB + (2 << 4) + (1 << 6)) << 16)]
+MackieCU_nFreeTracks = 64
+
+# -----------------
+# STATIC VARIABLES
+# -----------------
+# Mackie CU pages
+MackieCUPage_Pan = 0
+MackieCUPage_Stereo = 1
+MackieCUPage_Sends = 2
+MackieCUPage_FX = 3
+MackieCUPage_EQ = 4
+MackieCUPage_Free = 5
+
+# extenders (FL's receivers of this script) sit left or right of this unit; each unit has UnitStrips channel strips
+ExtenderLeft = 0
+ExtenderRight = 1
+UnitStrips = 8
+UnitPlaceNote = 0x7F  # dispatched to an extender with the first track of its strips as velocity
+
+# OnMidiMsg dispatch stages (one table per stage & page, keyed by (midiId, data1))
+Dispatch_CC = 0  # control changes on channel 0
+Dispatch_Press = 1  # note presses, served before the system buttons
+Dispatch_System = 2  # notes flagged PME_System
+Dispatch_Safe = 3  # notes flagged PME_System_Safe
+Dispatch_Count = 4
+
+# armed track index reconciliation: tracks re-checked per sweep step & seconds between steps
+ArmSweepChunk = 8
+ArmSweepInterval = 0.25
+
+# mixer scenes: with SceneKeys on, Shift+F1..F8 recall a scene and holding the key for SceneHoldTime seconds stores it
+# (off by default, so Shift+F1..F8 still go to FL Studio as F1..F8)
+SceneKeys = False
+SceneCount = 8
+SceneHoldTime = 1.0
+Scene_Mute = 1
+Scene_Solo = 2
+Scene_Arm = 4
+
+# output scheduler: priority classes, highest first, & bytes that may be sent per OnIdle tick (about 20 ms, so roughly
+# 50 KB/s: well inside what a USB-MIDI port carries, but kept down so a burst never stalls the unit's own processing)
+OutPrio_LED = 0  # LEDs, time display & settings
+OutPrio_Fader = 1
+OutPrio_Ring = 2
+OutPrio_Meter = 3
+OutPrio_LCD = 4
+OutPrio_Count = 5
+OutTickBudget = 1024
+Out_Msg = 0
+Out_NewMsg = 1
+Out_Sysex = 2
+Out_Dispatch = 3  # to an extender's script (Slot is the receiver)
+
+# diagnostics page (Shift+SMPTE/Beats): callback timings go into fixed histogram buckets (upper edges in microseconds,
+# anything slower lands in a last overflow bucket) & the second display is redrawn at most every DiagRefresh seconds
+DiagBucketT = (25, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000)
+DiagRefresh = 1.0
+(Diag_MidiMsg, Diag_Idle, Diag_Refresh, Diag_Meters, Diag_ColT) = range(5)
+DiagNameT = ('Mi', 'Id', 'Rf', 'Mt', 'Co')  # OnMidiMsg, OnIdle, OnRefresh, OnUpdateMeters, UpdateColT
+
+# LCD framebuffers: characters per display (2 rows of 56) & largest gap of unchanged characters resent to join two runs
+LCDSize = 112
+LCDRowLen = 56
+LCDMergeGap = 8
+
+# temporary message priorities (second display, top row); a message is only hidden by one of the same or higher priority
+TempMsgPrio_Hint = 0  # values shown while turning knobs, moving faders & jogging
+TempMsgPrio_Info = 1  # feedback for a button press
+TempMsgPrio_Alert = 2  # something that could not be done
+TempMsgPrio_Count = 3
+
+# channel meters: frames per second sent to the unit & seconds before an unchanged level is sent again
+MeterFPS = 30
+MeterKeepAlive = 0.25
+
+# meter scale & ballistics: dB at which each segment (1..MeterTop) lights, linear steps in the dB lookup table,
+# seconds a peak is held before it falls, PPM fall (segments per second) & VU averaging time (seconds)
+Meter_PPM = 0
+Meter_VU = 1
+MeterBallistics = Meter_PPM
+MeterDBT = (-60, -50, -40, -30, -24, -20, -14, -10, -8, -6, -4, -2, 0)
+MeterLUTSize = 4096
+MeterPeakHold = 0.5
+MeterPPMFall = 8
+MeterVUTime = 0.3
+MeterTop = 0xD
+MeterSetClip = 0xE  # overload segment, latched until cleared
+MeterClearClip = 0xF
+SysexEnd = bytes([0xF7])
+
+# names on the first display are shortened to two rows of this many characters per strip
+AbbrevLen = 6
+AbbrevCacheSize = 256
+
+# plugin parameter names are loaded (and prefetched) this many at a time, one page per row of V-Pots
+PluginPageSize = 8
+
+OffOnStr = ('off', 'on')
+ArrowStepT = [2, -2, -1, 1]
+CutCopyMsgT = ('Cut', 'Copy', 'Paste', 'Insert', 'Delete')  # FPT_Cut..FPT_Delete
+MasterPeak = 0
+# mixer colour schemes (FREE4), built by TMackiePalette. Colours are FL's signed ARGB ints; banks are tracks 1-8, 9-16...
+Palette_Default = 0
+Palette_Gradient = 1  # each bank a base colour lightening towards white over its 8 tracks
+Palette_Solid = 2  # each bank one colour
+PaletteDefaultColour = -10261391
+PaletteGradientFade = 9  # each gradient step covers 1/PaletteGradientFade of the way to white
+PaletteGradientBaseT = (0x000000, 0xFC28FF, 0x0606F1, 0xFF7900, 0xD90007, 0x003503, 0x305AAF, 0x2E0001, 0xEEEC00)
+BankingColours = [-22508, -15461356, -14397697, -60167, -98028, -1768, -8126692, -14617601, -2479873, -54171, -52992, -98028]
+# ---------
+# TRACING
+# ---------
+# Set TraceSubsystems (e.g. TraceSub_Midi | TraceSub_Display) to record into the trace ring buffer, then call
+# Trace.Dump() from the script output window (or set TraceFileName to have OnDeInit write it to a file).
+TraceLevel_Off = 0
+TraceLevel_Info = 1  # callbacks & state changes
+TraceLevel_Verbose = 2  # every display / LED / column refresh
+
+TraceSub_Script = 1 << 0
+TraceSub_Midi = 1 << 1
+TraceSub_Display = 1 << 2
+TraceSub_LEDs = 1 << 3
+TraceSub_Mixer = 1 << 4
+TraceSub_Jog = 1 << 5
+
+TraceSubsystems = 0
+TraceLevel = TraceLevel_Info
+TraceSize = 1024
+TraceFileName = ''
+
+# ---------
+# SESSION CAPTURE
+# ---------
+# Set CaptureFileName to record every incoming MIDI message and the OnIdle, OnRefresh, OnDirtyMixerTrack,
+# OnUpdateMeters & OnUpdateBeatIndicator callbacks from OnInit on; OnDeInit writes the log (or call Capture.Save()).
+# It is replayed against the script with flsim/replay.py. Recording stops when the log reaches CaptureSize bytes.
+CaptureFileName = ''
+CaptureSize = 1 << 22
+CaptureMagic = b'QCAP\x01'
+
+# capture record kinds; every record starts with the microseconds since the previous one and the kind
+(Cap_MidiMsg, Cap_Idle, Cap_Refresh, Cap_DirtyMixerTrack, Cap_UpdateMeters, Cap_BeatIndicator) = range(6)
+
+# ---------
+# PROFILER
+# ---------
+# On the diagnostics page SMPTE/Beats starts a cProfile session over every callback FL makes into the script. It
+# stops by itself after ProfileTime seconds, or earlier once the profiled callbacks have taken ProfileBudget seconds
+# in total (profiling included), and the ProfileTop functions by own time are written to ProfileFileName.
+ProfileTime = 10
+ProfileBudget = 1.0
+ProfileTop = 30
+ProfileFileName = 'QCONProX_profile.txt'
+
+# trace event codes (index into TraceEventNameT)
+TraceEventNameT = ('OnInit', 'OnDeInit', 'OnDirtyMixerTrack', 'OnRefresh', 'OnSendTempMsg', 'OnUpdateBeatIndicator',
+                   'OnMidiMsg', 'OnWaitingForInput', 'SetKnobValue', 'UpdateLEDs', 'TrackSel', 'Jog', 'SendMsg',
+                   'SendMsg2', 'SendAssignmentMsg', 'UpdateTempMsg', 'UpdateTextDisplay', 'UpdateMixer_Sel', 'UpdateCol',
+                   'UpdateColT', 'SetJogSource', 'UpdateClicking', 'SetBackLight', 'UpdateMeterMode', 'SetPage',
+                   'SetFirstTrack', 'Resync', 'LEDRates', 'LCDWrite', 'MeterRates', 'Abbrev', 'Output')
+(TE_OnInit, TE_OnDeInit, TE_OnDirtyMixerTrack, TE_OnRefresh, TE_OnSendTempMsg, TE_OnUpdateBeatIndicator,
+ TE_OnMidiMsg, TE_OnWaitingForInput, TE_SetKnobValue, TE_UpdateLEDs, TE_TrackSel, TE_Jog, TE_SendMsg,
+ TE_SendMsg2, TE_SendAssignmentMsg, TE_UpdateTempMsg, TE_UpdateTextDisplay, TE_UpdateMixer_Sel, TE_UpdateCol,
+ TE_UpdateColT, TE_SetJogSource, TE_UpdateClicking, TE_SetBackLight, TE_UpdateMeterMode, TE_SetPage,
+ TE_SetFirstTrack, TE_Resync, TE_LEDRates, TE_LCDWrite, TE_MeterRates, TE_Abbrev, TE_Output) = range(len(TraceEventNameT))
+
+##########################
+# CLASS FOR TRACING
+##########################
+
+class TTrace:
+    # Call sites test 'Trace.Mask & TraceSub_x' (or VerboseMask) before calling Rec, so a disabled subsystem costs
+    # one AND per call. Entries are kept as raw (timestamp, code, args) tuples and only turned into text on Dump.
+    def __init__(self, Size):
+        self.Size = Size
+        self.RingT = [None] * Size
+        self.Pos = 0
+        self.Count = 0
+        self.LevelT = {}
+        self.Mask = 0
+        self.VerboseMask = 0
+
+    def SetLevel(self, Subsystems, Level):
+        for n in range(0, 16):
+            if Subsystems & (1 << n):
+                self.LevelT[1 << n] = Level
+        self.Mask = 0
+        self.VerboseMask = 0
+        for Sub in self.LevelT:
+            if self.LevelT[Sub] >= TraceLevel_Info:
+                self.Mask |= Sub
+            if self.LevelT[Sub] >= TraceLevel_Verbose:
+                self.VerboseMask |= Sub
+
+    def Rec(self, Code, *Args):
+        self.RingT[self.Pos] = (time.perf_counter(), Code, Args)
+        self.Pos = (self.Pos + 1) % self.Size
+        self.Count += 1
+
+    def Clear(self):
+        self.RingT = [None] * self.Size
+        self.Pos = 0
+        self.Count = 0
+
+    def Entries(self):
+        # oldest first
+        return [e for e in self.RingT[self.Pos:] + self.RingT[:self.Pos] if e is not None]
+
+    def Lines(self, Entries=None):
+        if Entries is None:
+            Entries = self.Entries()
+        Result = []
+        if len(Entries) > 0:
+            t0 = Entries[0][0]
+            for t, Code, Args in Entries:
+                Result.append('{:10.3f} ms  {:<22} {}'.format((t - t0) * 1000, TraceEventNameT[Code], ' '.join(repr(a) for a in Args)))
+        return Result
+
+    def Dump(self, FileName=''):
+        # to the script console, or to FileName from a background thread so the MIDI thread never waits on the disk
+        Entries = self.Entries()
+        if FileName == '':
+            for s in self.Lines(Entries):
+                print(s)
+        elif threading is None:
+            self.WriteFile(FileName, Entries)
+        else:
+            threading.Thread(target=self.WriteFile, args=(FileName, Entries)).start()
+
+    def WriteFile(self, FileName, Entries):
+        with open(FileName, 'w') as f:
+            f.write('\n'.join(self.Lines(Entries)) + '\n')
+
+
+Trace = TTrace(TraceSize)
+
+##########################
+# CLASS FOR SESSION CAPTURE
+##########################
+
+class TCapture:
+    # Records what FL hands the script at the module level callbacks as packed binary records, so a session can be
+    # fed back into the script off line (flsim/replay.py). The log is only written out on Save, never from the callbacks.
+    HeadS = struct.Struct('<IB')  # microseconds since the previous record, kind
+    FormatT = (struct.Struct('<IBBBBBH'),  # Cap_MidiMsg (11 bytes): midiId, midiChan, data1, data2, pmeFlags
+               HeadS,  # Cap_Idle (5 bytes)
+               struct.Struct('<IBI'),  # Cap_Refresh: flags
+               struct.Struct('<IBh'),  # Cap_DirtyMixerTrack: track (-1 for all)
+               HeadS,  # Cap_UpdateMeters
+               struct.Struct('<IBB'))  # Cap_BeatIndicator: value
+
+    def __init__(self):
+        self.Active = False
+        self.LogT = bytearray()
+        self.Time = 0
+        self.Dropped = 0
+
+    def Start(self):
+        self.LogT = bytearray(CaptureMagic)
+        self.Time = time.perf_counter()
+        self.Dropped = 0
+        self.Active = True
+
+    def Rec(self, Kind, *Args):
+        if len(self.LogT) >= CaptureSize:
+            self.Dropped += 1
+            return
+        Now = time.perf_counter()
+        self.LogT += self.FormatT[Kind].pack(min(round((Now - self.Time) * 1000000), 0xFFFFFFFF), Kind, *Args)
+        self.Time = Now
+
+    def Save(self, FileName=''):
+        # like Trace.Dump, the file is written from a background thread
+        if FileName == '':
+            FileName = CaptureFileName
+        if threading is None:
+            self.WriteFile(FileName, bytes(self.LogT))
+        else:
+            threading.Thread(target=self.WriteFile, args=(FileName, bytes(self.LogT))).start()
+
+    def WriteFile(self, FileName, Data):
+        with open(FileName, 'wb') as f:
+            f.write(Data)
+
+
+Capture = TCapture()
+
+##########################
+# CLASS FOR THE PROFILER
+##########################
+
+class TProfiler:
+    # While Active, the module level callbacks run through Run(), which only profiles the call itself, so whatever
+    # FL does between callbacks is not counted. The statistics are turned into text and written from a background
+    # thread once the session is over.
+    def __init__(self):
+        self.Active = False
+        self.Prof = None
+        self.OnDone = None
+        self.StartTime = 0
+        self.Spent = 0.0
+        self.Calls = 0
+        self.Cancelled = False
+
+    def Start(self, OnDone=None):
+        # OnDone(Text) is told how the session ended; returns False if cProfile is not available
+        if cProfile is None:
+            return False
+        self.Prof = cProfile.Profile()
+        self.OnDone = OnDone
+        self.StartTime = time.perf_counter()
+        self.Spent = 0.0
+        self.Calls = 0
+        self.Cancelled = False
+        self.Active = True
+        return True
+
+    def Cancel(self):
+        # may be called from inside a profiled callback, so the session ends when that call returns
+        self.Cancelled = True
+
+    def Run(self, Fn, *Args):
+        Start = time.perf_counter()
+        try:
+            return self.Prof.runcall(Fn, *Args)
+        finally:
+            Now = time.perf_counter()
+            self.Spent += Now - Start
+            self.Calls += 1
+            if self.Cancelled:
+                self.Stop('cancelled')
+            elif self.Spent >= ProfileBudget:
+                self.Stop('budget used')
+            elif Now - self.StartTime >= ProfileTime:
+                self.Stop('done')
+
+    def Stop(self, Reason='stopped'):
+        if not self.Active:
+            return
+        self.Active = False
+        Header = 'QCON Pro X profile, {}: {} callbacks in {:.1f} s, {:.0f} ms spent in them\n'.format(
+            Reason, self.Calls, time.perf_counter() - self.StartTime, self.Spent * 1000)
+        if threading is None:
+            self.WriteFile(ProfileFileName, self.Prof, Header)
+        else:
+            threading.Thread(target=self.WriteFile, args=(ProfileFileName, self.Prof, Header)).start()
+        if self.OnDone is not None:
+            self.OnDone('Profile ' + Reason + ', ' + str(self.Calls) + ' callbacks: ' + ProfileFileName)
+
+    def WriteFile(self, FileName, Prof, Header):
+        with open(FileName, 'w') as f:
+            f.write(Header)
+            pstats.Stats(Prof, stream=f).sort_stats('tottime').print_stats(ProfileTop)
+
+
+Profiler = TProfiler()
+
+##################################
+# CLASS FOR THE MESSAGE CODEC
+##################################
+
+class TMackieCodec:
+    # Every message the script sends over and over is built once here, so the hot paths only index a table instead of
+    # shifting and adding a new int (or building a new bytes) per message: LEDs, meters (and their queue keys), time
+    # digits, V-Pot rings for every ring value (KnobMode and center are part of it), 14 bit fader positions, the meter
+    # mode sysex and the header plus offset byte of every LCD write.
+    def __init__(self):
+        self.LEDT = [{Value: (Note << 8) + Value for Value in midi.TranzPort_OffOnBlinkT} for Note in range(0, 128)]
+        self.MeterT = [[midi.MIDI_CHANAFTERTOUCH + (Value << 8) + (Num << 12) for Value in range(0, 16)] for Num in range(0, 8)]
+        self.MasterMeterT = [[bytes([0xD1, Value + (Side << 4), 0xF7]) for Value in range(0, 16)] for Side in range(0, 2)]
+        self.MeterKeyT = [((Num, False), (Num, True)) for Num in range(0, 10)]
+        self.DigitT = [[midi.MIDI_CONTROLCHANGE + ((0x49 - n + 0x0C * int(n >= 10)) << 8) + (c << 16) for c in range(0, 128)] for n in range(0, 12)]
+        self.DigitKeyT = [('Digit', n) for n in range(0, 12)]
+        self.RingT = [[midi.MIDI_CONTROLCHANGE + ((0x30 + Num) << 8) + (Value << 16) for Value in range(0, 128)] for Num in range(0, 8)]
+        # one table for all strips; the channel is added by Fader()
+        self.FaderT = [midi.MIDI_PITCHBEND + ((Value & 0x7F) << 8) + ((Value >> 7) << 16) for Value in range(0, 0x4000)]
+        self.MeterModeT = [[self.Command(0x20, Num, Mode) for Mode in range(0, 4)] for Num in range(0, 8)]
+        self.CommandT = {}
+
+    def Command(self, *Data):
+        return bytes([0xF0, 0x00, 0x00, 0x66, 0x14] + list(Data) + [0xF7])
+
+    def Setting(self, Cmd, Value):
+        # the unit settings (0x0A clicking, 0x0B backlight, 0x0C touch, 0x21 meter orientation) are cached as they are first sent
+        Msg = self.CommandT.get((Cmd, Value))
+        if Msg is None:
+            Msg = self.Command(Cmd, Value)
+            self.CommandT[(Cmd, Value)] = Msg
+        return Msg
+
+    def LED(self, Note, Value):
+        Msg = self.LEDT[Note].get(Value)
+        if Msg is None:
+            Msg = (Note << 8) + Value
+        return Msg
+
+    def Fader(self, Num, Value):
+        # a free slider stored at full scale reads back as 16384
+        if Value > 0x3FFF:
+            Value = 0x3FFF
+        return self.FaderT[Value] + Num
+
+    def LCDPrefixes(self, Header):
+        # header plus offset byte for every offset, so a write is just prefix + characters + F7
+        return [bytes(Header) + bytes([Offset]) for Offset in range(0, LCDSize)]
+
+
+Codec = TMackieCodec()
+
+##################################
+# CLASS FOR THE OUTPUT SCHEDULER
+##################################
+
+class TMackieOutput:
+    # Everything sent to the unit is queued here by priority class (OutPrio_*) and sent from Drain() at the end of each
+    # callback, highest class first, within a byte budget refilled by OutTickBudget every OnIdle tick, so a full LCD
+    # redraw waits behind LED feedback instead of in front of it. A message queued under the Key of one still waiting
+    # replaces it (and moves to the back, so it cannot be overtaken by anything queued in between); Key None never does.
+    def __init__(self):
+        self.QueueT = [{} for n in range(0, OutPrio_Count)]  # key -> (kind, message, slot, time queued, bytes)
+        self.Count = 0  # messages waiting in all classes, so an empty Drain costs nothing
+        self.Budget = OutTickBudget
+        self.Unique = 0
+        self.SentT = [0] * OutPrio_Count  # bytes sent per class
+        self.CoalescedT = [0] * OutPrio_Count  # messages replaced before they were sent
+        self.LatencyT = [0.0] * OutPrio_Count  # longest wait per class (seconds) since the last UpdateRates
+        self.MsgSent = 0  # messages of any kind
+        self.SysexSent = 0  # bytes sent as sysex
+        self.MaxDepth = 0
+        self.BytesPerSec = 0
+        self.RateTime = 0
+        self.RateSent = 0
+
+    def Queue(self, Prio, Key, Kind, Msg, Slot, Size):
+        Q = self.QueueT[Prio]
+        if Key is None:
+            # a key of its own, which no LED note, strip number or other keyed message can ever equal
+            self.Unique += 1
+            Key = ('Once', self.Unique)
+        elif Q.pop(Key, None) is not None:
+            self.CoalescedT[Prio] += 1
+            self.Count -= 1
+        Q[Key] = (Kind, Msg, Slot, time.perf_counter(), Size)
+        self.Count += 1
+
+    def Msg(self, Prio, Key, Msg):
+        self.Queue(Prio, Key, Out_Msg, Msg, 0, 3)
+
+    def NewMsg(self, Prio, Key, Msg, Slot):
+        self.Queue(Prio, Key, Out_NewMsg, Msg, Slot, 3)
+
+    def Sysex(self, Prio, Key, Data):
+        self.Queue(Prio, Key, Out_Sysex, Data, 0, len(Data))
+
+    def Dispatch(self, Prio, Key, Receiver, Msg):
+        self.Queue(Prio, Key, Out_Dispatch, Msg, Receiver, 3)
+
+    def Depth(self):
+        return self.Count
+
+    def Refill(self):
+        # once per OnIdle tick; an overdrawn budget (a message may take it below 0) is paid back first
+        self.Budget = min(self.Budget + OutTickBudget, OutTickBudget)
+
+    def Drain(self, All=False):
+        if self.Count == 0:
+            return
+        if self.Count > self.MaxDepth:
+            self.MaxDepth = self.Count
+        Now = time.perf_counter()
+        for Prio in range(0, OutPrio_Count):
+            Q = self.QueueT[Prio]
+            while (len(Q) > 0) & ((self.Budget > 0) | All):
+                Kind, Msg, Slot, Queued, Size = Q.pop(next(iter(Q)))
+                self.Count -= 1
+                if Kind == Out_Msg:
+                    device.midiOutMsg(Msg)
+                elif Kind == Out_NewMsg:
+                    device.midiOutNewMsg(Msg, Slot)
+                elif Kind == Out_Dispatch:
+                    device.dispatch(Slot, Msg)
+                else:
+                    device.midiOutSysex(Msg)
+                    self.SysexSent += Size
+                self.MsgSent += 1
+                self.Budget -= Size
+                self.SentT[Prio] += Size
+                if Now - Queued > self.LatencyT[Prio]:
+                    self.LatencyT[Prio] = Now - Queued
+
+    def Clear(self):
+        for Q in self.QueueT:
+            Q.clear()
+        self.Count = 0
+
+    def UpdateRates(self, Now):
+        if Now - self.RateTime >= 1:
+            Sent = sum(self.SentT)
+            self.BytesPerSec = round((Sent - self.RateSent) / (Now - self.RateTime))
+            self.RateTime = Now
+            self.RateSent = Sent
+            if Trace.Mask & TraceSub_Midi:
+                # bytes per second, deepest queue, longest wait per class (ms), messages coalesced per class so far
+                Trace.Rec(TE_Output, self.BytesPerSec, self.MaxDepth, [round(t * 1000, 1) for t in self.LatencyT],
+                          list(self.CoalescedT))
+            self.MaxDepth = self.Depth()
+            for n in range(0, OutPrio_Count):
+                self.LatencyT[n] = 0.0
+
+Output = TMackieOutput()
+Trace.SetLevel(TraceSubsystems, TraceLevel)
+
+#################################
+# CLASS FOR COLUMN RELATED ITEMS
+#################################
+
+class TMackieCol:
+    def __init__(self):
+        self.TrackNum = 0
+        self.BaseEventID = 0
+        self.KnobEventID = 0
+        self.KnobPressEventID = 0
+        self.KnobResetEventID = 0
+        self.KnobResetValue = 0
+        self.KnobMode = 0 #[0=default], [1=parameter, pan, volume, off],[2=self.Flip],[3=centered?],[4=?]
+        self.KnobCenter = 0
+        self.SliderEventID = 0
+        self.SliderName = ""
+        self.KnobName = ""
+        self.LastValueIndex = 0
+        self.Dirty = False
+        self.KnobHeld = False
+        self.Key = None  # what the column was last built from (see UpdateColT)
+
+##################################
+# CLASS FOR LED SHADOW STATE
+##################################
+
+class TMackieLEDs:
+    # Shadow copy of every button LED (keyed by note number) so that only state transitions go out on the wire.
+    # Values are the TranzPort_OffOnT / TranzPort_OffOnBlinkT entries (note-on status + velocity).
+    def __init__(self):
+        self.StateT = [-1 for n in range(128)]
+        self.Sent = 0
+        self.Saved = 0
+        self.SentPerSec = 0
+        self.SavedPerSec = 0
+        self.RateTime = 0
+        self.RateSent = 0
+        self.RateSaved = 0
+
+    def Set(self, Note, Value):
+        if self.StateT[Note] == Value:
+            self.Saved += 1
+        else:
+            self.StateT[Note] = Value
+            self.Sent += 1
+            Output.Msg(OutPrio_LED, Note, Codec.LED(Note, Value))
+
+    def Feedback(self, event):
+        # echoes the button's own note (what device.directFeedback did), queued like any LED so that a Set of the same
+        # note later in the callback replaces it instead of going out after it
+        Value = midi.MIDI_NOTEON + (event.data2 << 16)
+        self.StateT[event.data1] = Value
+        Output.Msg(OutPrio_LED, event.data1, Codec.LED(event.data1, Value))
+
+    def Resync(self):
+        # forget what the unit shows; the next refresh resends every LED
+        for n in range(0, len(self.StateT)):
+            self.StateT[n] = -1
+
+    def UpdateRates(self, Now):
+        if Now - self.RateTime >= 1:
+            Elapsed = Now - self.RateTime
+            self.SentPerSec = round((self.Sent - self.RateSent) / Elapsed)
+            self.SavedPerSec = round((self.Saved - self.RateSaved) / Elapsed)
+            if Trace.Mask & TraceSub_LEDs:
+                Trace.Rec(TE_LEDRates, self.SentPerSec, self.SavedPerSec)
+            self.RateTime = Now
+            self.RateSent = self.Sent
+            self.RateSaved = self.Saved
+
+##################################
+# CLASS FOR THE ARMED TRACK INDEX
+##################################
+
+class TMackieArmedTracks:
+    # Set of armed mixer tracks, kept up to date from OnDirtyMixerTrack. A slow round-robin sweep (Sweep, from OnIdle)
+    # re-checks ArmSweepChunk tracks every ArmSweepInterval seconds in case a notification was missed.
+    def __init__(self):
+        self.ArmedT = set()
+        self.SweepPos = 0
+        self.SweepTime = 0
+
+    def Update(self, Track):
+        if mixer.isTrackArmed(Track):
+            self.ArmedT.add(Track)
+        else:
+            self.ArmedT.discard(Track)
+
+    def Rebuild(self):
+        self.ArmedT.clear()
+        for m in range(0, mixer.trackCount()):
+            if mixer.isTrackArmed(m):
+                self.ArmedT.add(m)
+        self.SweepPos = 0
+
+    def Sweep(self, Now):
+        if Now - self.SweepTime < ArmSweepInterval:
+            return
+        self.SweepTime = Now
+        Count = mixer.trackCount()
+        if self.SweepPos >= Count:
+            self.SweepPos = 0
+            for m in [m for m in self.ArmedT if m >= Count]:
+                self.ArmedT.discard(m)
+        for m in range(self.SweepPos, min(self.SweepPos + ArmSweepChunk, Count)):
+            self.Update(m)
+        self.SweepPos += ArmSweepChunk
+
+    def Any(self):
+        return len(self.ArmedT) > 0
+
+    def DisarmAll(self):
+        # returns the number of tracks that were disarmed
+        n = 0
+        for m in sorted(self.ArmedT):
+            if mixer.isTrackArmed(m):
+                mixer.armTrack(m)
+                n += 1
+        self.ArmedT.clear()
+        return n
+
+##################################
+# CLASS FOR THE LCD FRAMEBUFFERS
+##################################
+
+class TMackieLCD:
+    # Framebuffer for one 2 x 56 character display. Write() only changes TargetT; Flush() compares it with ShownT (what
+    # the unit shows) and sends each changed run of characters as its own offset write. Runs closer together than
+    # LCDMergeGap are sent as one write, as a new sysex would cost more than resending the unchanged characters between them.
+    def __init__(self, Header):
+        self.Header = bytearray(Header)
+        self.PrefixT = Codec.LCDPrefixes(Header)
+        self.TargetT = bytearray(b' ' * LCDSize)
+        self.ShownT = bytearray(LCDSize)
+        self.Sent = 0  # characters sent
+        self.Saved = 0  # characters that did not need to be sent
+        self.Writes = 0  # sysex messages sent
+
+    def Write(self, Offset, Msg):
+        Data = bytearray(Msg, 'ascii', 'replace')[0:max(0, LCDSize - Offset)]
+        self.TargetT[Offset:Offset + len(Data)] = Data
+
+    def Flush(self):
+        Target = self.TargetT
+        Shown = self.ShownT
+        if Target == Shown:
+            return
+        n = 0
+        Start = -1
+        End = -1
+        while n < LCDSize:
+            if Target[n] != Shown[n]:
+                if (Start >= 0) & (n - End > LCDMergeGap):
+                    self.SendRun(Start, End)
+                    Start = -1
+                if Start < 0:
+                    Start = n
+                End = n + 1
+            n += 1
+        if Start >= 0:
+            self.SendRun(Start, End)
+        self.ShownT[:] = Target
+
+    def SendRun(self, Start, End):
+        Output.Sysex(OutPrio_LCD, None, self.PrefixT[Start] + self.TargetT[Start:End] + SysexEnd)
+        self.Writes += 1
+        self.Sent += End - Start
+        if Trace.VerboseMask & TraceSub_Display:
+            Trace.Rec(TE_LCDWrite, self.Header[5], Start, End - Start)
+
+    def Resync(self):
+        # the unit's contents are unknown, so every character differs from ShownT on the next flush
+        for n in range(0, LCDSize):
+            self.ShownT[n] = 0
+
+##################################
+# CLASS FOR TEMPORARY MESSAGES
+##################################
+
+class TMackieTempMsg:
+    # Top row of the second display. Keeps the persistent text (BaseMsg) and the latest message of each priority level
+    # with its expiry time. The row shows the highest priority message that has not expired, or BaseMsg once all have.
+    def __init__(self):
+        self.BaseMsg = ''
+        self.MsgT = ['' for n in range(TempMsgPrio_Count)]
+        self.ExpireT = [0 for n in range(TempMsgPrio_Count)]
+        self.Dirty = True
+
+    def SetBase(self, Msg):
+        if self.BaseMsg != Msg:
+            self.BaseMsg = Msg
+            self.Dirty = True
+
+    def Add(self, Msg, Duration, Priority, Now):
+        self.MsgT[Priority] = Msg
+        self.ExpireT[Priority] = Now + Duration / 1000
+        self.Dirty = True
+
+    def Clear(self):
+        for n in range(0, TempMsgPrio_Count):
+            self.ExpireT[n] = 0
+        self.Dirty = True
+
+    def Expire(self, Now):
+        for n in range(0, TempMsgPrio_Count):
+            if (self.ExpireT[n] != 0) & (self.ExpireT[n] <= Now):
+                self.ExpireT[n] = 0
+                self.Dirty = True
+
+    def Text(self):
+        for n in range(TempMsgPrio_Count - 1, -1, -1):
+            if self.ExpireT[n] != 0:
+                return self.MsgT[n]
+        return self.BaseMsg
+
+##################################
+# CLASS FOR THE CHANNEL METERS
+##################################
+
+class TMackieMeters:
+    # Meter levels for the 8 strips and the stereo master (entries Count and Count + 1). Read() (from OnUpdateMeters)
+    # fetches all peaks in one go and keeps the highest one seen since the last frame; Frame() (from OnIdle) runs at most
+    # FPS times a second, turns each peak into a segment with the lookup table, applies the ballistics and only sends
+    # levels that changed. An unchanged level is resent every MeterKeepAlive seconds, as the unit lets its meters fall
+    # by themselves.
+    def __init__(self, Count):
+        self.Count = Count
+        self.LUT = self.BuildLUT()
+        self.PeakT = [0 for n in range(Count + 2)]  # highest peak since the last frame (1 = 0 dB)
+        self.LevelT = [0 for n in range(Count + 2)]  # activity level (segments) since the last frame
+        self.ShowT = [0 for n in range(Count + 2)]  # level after ballistics (segments)
+        self.HoldT = [0 for n in range(Count + 2)]  # time the shown level last rose
+        self.ClipT = [False for n in range(Count + 2)]
+        self.SentT = [-1 for n in range(Count + 2)]
+        self.SentTimeT = [0 for n in range(Count + 2)]
+        self.FPS = MeterFPS
+        self.Ballistics = MeterBallistics
+        self.FrameTime = 0
+        self.Sent = 0
+        self.Suppressed = 0
+        self.SentPerSec = 0
+        self.SuppressedPerSec = 0
+        self.RateTime = 0
+        self.RateSent = 0
+        self.RateSuppressed = 0
+
+    def BuildLUT(self):
+        # segment for each of MeterLUTSize + 1 linear peak steps between 0 and 1 (0 dB)
+        LUT = bytearray(MeterLUTSize + 1)
+        for i in range(1, MeterLUTSize + 1):
+            dB = 20 * math.log10(i / MeterLUTSize)
+            n = 0
+            while (n < len(MeterDBT)) and (dB >= MeterDBT[n]):
+                n += 1
+            LUT[i] = n
+        return LUT
+
+    def Read(self, ColT):
+        PeakT = self.PeakT
+        for m in range(0, self.Count):
+            Peak = mixer.getTrackPeaks(ColT[m].TrackNum, 0)
+            if Peak > PeakT[m]:
+                PeakT[m] = Peak
+        for m in range(0, 2):
+            Peak = mixer.getTrackPeaks(MasterPeak, m)
+            if Peak > PeakT[self.Count + m]:
+                PeakT[self.Count + m] = Peak
+
+    def Activity(self, Num, Level):
+        if Num < self.Count:  # the master strip has no meter
+            self.LevelT[Num] = max(self.LevelT[Num], Level)
+
+    def Reset(self, Num):
+        if Num < self.Count:
+            self.PeakT[Num] = 0
+            self.LevelT[Num] = 0
+            self.ShowT[Num] = 0
+            self.SentT[Num] = -1
+            if self.ClipT[Num]:
+                self.ClipT[Num] = False
+                self.Send(Num, MeterClearClip)
+
+    def ClearClips(self):
+        for m in range(0, len(self.ClipT)):
+            self.ClipT[m] = False
+            self.Send(m, MeterClearClip)
+
+    def Send(self, Num, Value):
+        # the overload flag is separate from the level on the unit, so it is queued under its own key
+        Key = Codec.MeterKeyT[Num][Value >= MeterSetClip]
+        if Num < self.Count:
+            Output.Msg(OutPrio_Meter, Key, Codec.MeterT[Num][Value])
+        else:
+            Output.Sysex(OutPrio_Meter, Key, Codec.MasterMeterT[Num - self.Count][Value])
+
+    def Frame(self, Now, Max):
+        Elapsed = Now - self.FrameTime
+        if Elapsed < 1 / self.FPS:
+            return
+        self.FrameTime = Now
+        LUT = self.LUT
+        VU = self.Ballistics == Meter_VU
+        Fall = MeterPPMFall * Elapsed
+        Rise = min(1, Elapsed / MeterVUTime)
+        for m in range(0, len(self.PeakT)):
+            i = int(self.PeakT[m] * MeterLUTSize)
+            self.PeakT[m] = 0
+            if i >= MeterLUTSize:
+                i = MeterLUTSize
+                if not self.ClipT[m]:
+                    self.ClipT[m] = True
+                    self.Send(m, MeterSetClip)
+            Target = max(LUT[i], self.LevelT[m])
+            self.LevelT[m] = 0
+            # ballistics (PPM: instant rise & steady fall, VU: both averaged), falling only after MeterPeakHold
+            Show = self.ShowT[m]
+            if Target > Show:
+                if VU:
+                    Show += (Target - Show) * Rise
+                else:
+                    Show = Target
+                self.HoldT[m] = Now
+            elif (Target < Show) & (Now - self.HoldT[m] >= MeterPeakHold):
+                if VU:
+                    Show += (Target - Show) * Rise
+                else:
+                    Show = max(Target, Show - Fall)
+            self.ShowT[m] = Show
+            n = min(int(Show + 0.5), Max, MeterTop)
+            if (n == self.SentT[m]) & ((n == 0) | (Now - self.SentTimeT[m] < MeterKeepAlive)):
+                self.Suppressed += 1
+                continue
+            self.Send(m, n)
+            self.SentT[m] = n
+            self.SentTimeT[m] = Now
+            self.Sent += 1
+
+    def Resync(self):
+        for m in range(0, len(self.SentT)):
+            self.SentT[m] = -1
+            if self.ClipT[m]:
+                self.Send(m, MeterSetClip)
+
+    def UpdateRates(self, Now):
+        if Now - self.RateTime >= 1:
+            Elapsed = Now - self.RateTime
+            self.SentPerSec = round((self.Sent - self.RateSent) / Elapsed)
+            self.SuppressedPerSec = round((self.Suppressed - self.RateSuppressed) / Elapsed)
+            if Trace.Mask & TraceSub_Display:
+                Trace.Rec(TE_MeterRates, self.SentPerSec, self.SuppressedPerSec)
+            self.RateTime = Now
+            self.RateSent = self.Sent
+            self.RateSuppressed = self.Suppressed
+
+##################################
+# CLASS FOR THE 7-SEGMENT DISPLAYS
+##################################
+
+class TMackieDigits:
+    # The 10 digit time display (CC 0x49 down to 0x40) and the 2 digit assignment display (CC 0x4B, 0x4A). ShownT holds
+    # what the unit shows, so only changed digits are sent. SetTime() only builds the time code when the bar/step/tick
+    # tuple changes; the bar part is kept until the bar changes and steps & ticks come from tables built once.
+    def __init__(self):
+        self.ShownT = bytearray(12)  # time digits 0..9, assignment digits 10 & 11
+        self.NewT = bytearray(12)
+        self.TimeKey = None
+        self.BarKey = None
+        self.BarStr = b''
+        self.DigitT = [bytes(utils.Zeros_Strict(n, 2), 'ascii') for n in range(100)]
+        self.TickT = [bytes(utils.Zeros_Strict(n, 3), 'ascii') for n in range(1000)]
+        self.Sent = 0
+        self.Saved = 0
+
+    def SetTime(self, Bar, Step, Tick, MinMode):
+        Key = (Bar, Step, Tick, MinMode)
+        if Key == self.TimeKey:
+            self.Saved += 10
+            return
+        self.TimeKey = Key
+        if (Bar, MinMode) != self.BarKey:
+            self.BarKey = (Bar, MinMode)
+            if not MinMode:
+                s = utils.Zeros_Strict(Bar, 3, ' ')
+            elif Bar == -midi.MaxInt:
+                s = '-   0'
+            else:
+                h, m = utils.DivModU(abs(Bar), 60)
+                s = utils.Zeros_Strict((h * 100 + m) * utils.SignOf(Bar), 5, ' ')
+            self.BarStr = bytes(s, 'ascii')
+        New = self.NewT
+        if MinMode:
+            # HHH.MM.SS.CC_
+            New[0:5] = self.BarStr
+            New[5:7] = self.DigitT[abs(Step) % 100]
+            New[7:9] = self.DigitT[Tick % 100]
+            New[9] = 0x20
+        else:
+            # BBB.BB.__.TTT
+            New[0:3] = self.BarStr
+            New[3:5] = self.DigitT[abs(Step) % 100]
+            New[5:7] = b'  '
+            New[7:10] = self.TickT[Tick % 1000]
+        self.Send(0, 10)
+
+    def SetTimeStr(self, Msg):
+        self.TimeKey = None
+        New = self.NewT
+        for n in range(0, 10):
+            if n < len(Msg):
+                New[n] = ord(Msg[n])
+            else:
+                New[n] = 0
+        self.Send(0, 10)
+
+    def SetAssignment(self, Msg):
+        if len(Msg) < 3:
+            Msg = ' ' + Msg
+        self.NewT[10] = ord(Msg[1])
+        self.NewT[11] = ord(Msg[2])
+        self.Send(10, 12)
+
+    def Send(self, Start, End):
+        New = self.NewT
+        Shown = self.ShownT
+        Assigned = device.isAssigned()
+        for n in range(Start, End):
+            if New[n] != Shown[n]:
+                Shown[n] = New[n]
+                if Assigned:
+                    Output.Msg(OutPrio_LED, Codec.DigitKeyT[n], Codec.DigitT[n][New[n] & 0x7F])
+                    self.Sent += 1
+            else:
+                self.Saved += 1
+
+    def Resync(self):
+        # an impossible digit value, so the next update sends every digit again
+        for n in range(0, len(self.ShownT)):
+            self.ShownT[n] = 0x80
+
+##################################
+# CLASS FOR THE NAME CACHE
+##################################
+
+class TMackieNames:
+    # Cache for mixer track names and event ID names. Event names are stored with the tracks they depend on (e.g. a
+    # send's name includes both tracks), so Invalidate() (from OnDirtyMixerTrack) only drops what that track affects.
+    def __init__(self):
+        self.TrackT = {}  # (track, max length) -> name
+        self.EventT = {}  # event ID -> name
+        self.OwnerT = {}  # track -> event IDs whose names depend on it
+        self.Hits = 0
+        self.Misses = 0
+
+    def Track(self, Track, Len=0):
+        Name = self.TrackT.get((Track, Len))
+        if Name is None:
+            self.Misses += 1
+            if Len > 0:
+                Name = mixer.getTrackName(Track, Len)
+            else:
+                Name = mixer.getTrackName(Track)
+            self.TrackT[(Track, Len)] = Name
+        else:
+            self.Hits += 1
+        return Name
+
+    def EventID(self, ID, *Tracks):
+        Name = self.EventT.get(ID)
+        if Name is None:
+            self.Misses += 1
+            Name = mixer.getEventIDName(ID)
+            self.EventT[ID] = Name
+            for Track in Tracks:
+                self.OwnerT.setdefault(Track, set()).add(ID)
+        else:
+            self.Hits += 1
+        return Name
+
+    def Invalidate(self, Track):
+        for Len in [Len for (t, Len) in self.TrackT if t == Track]:
+            del self.TrackT[(Track, Len)]
+        for ID in self.OwnerT.pop(Track, ()):
+            self.EventT.pop(ID, None)
+
+    def Clear(self):
+        self.TrackT.clear()
+        self.EventT.clear()
+        self.OwnerT.clear()
+
+##################################
+# CLASS FOR LCD NAME ABBREVIATION
+##################################
+
+class TMackieAbbrev:
+    # Shortens plugin, parameter and track names to the two AbbrevLen rows a strip has on the first display. A single
+    # word is split over both rows (or at its camel-case humps, e.g. FabFilter); otherwise the first word goes on the
+    # top row and the rest are joined camel-case below it. A trailing version (2, v3, 1.5, II) is kept whole at the end
+    # of the bottom row. Words that don't fit lose their inner lowercase vowels from the right, then the longest word
+    # is cut. Results are kept in a small LRU table, since the same names are redrawn over and over.
+    VowelRE = re.compile('[aeiou]')
+
+    def __init__(self, Size=AbbrevCacheSize):
+        self.MemoT = {}  # name -> (top, bottom), oldest first
+        self.Size = Size
+        self.Hits = 0
+        self.Misses = 0
+
+    def Get(self, Name):
+        Rows = self.MemoT.pop(Name, None)
+        if Rows is None:
+            self.Misses += 1
+            Rows = self.Abbrev(Name)
+            if Trace.VerboseMask & TraceSub_Display:
+                Trace.Rec(TE_Abbrev, Name + ' -> ' + Rows[0] + '|' + Rows[1])
+            if len(self.MemoT) >= self.Size:
+                del self.MemoT[next(iter(self.MemoT))]
+        else:
+            self.Hits += 1
+        self.MemoT[Name] = Rows
+        return Rows
+
+    def Abbrev(self, Name):
+        Words = Name.split()
+        if len(Words) == 0:
+            return ('', '')
+        Version = ''
+        if (len(Words) > 1) and self.IsVersion(Words[-1]):
+            Version = Words.pop()[0:AbbrevLen - 1]
+        if len(Words) == 1:
+            Word = Words[0]
+            Tail = len(Word) - AbbrevLen
+            if Tail <= 0:
+                return (Word, Version)
+            Humps = self.Humps(Word)
+            if len(Humps) > 1:
+                Top, Rest = Humps[0], Humps[1:]
+            elif (Version != '') & ((Tail == 1) | (Tail > AbbrevLen - len(Version))):
+                Top, Rest = Word, []  # squeezed onto the top row, leaving the bottom one to the version
+            elif Tail == 1:  # a single letter left over looks odd, so split one earlier
+                Top, Rest = Word[0:AbbrevLen - 1], [Word[AbbrevLen - 1:]]
+            else:
+                Top, Rest = Word[0:AbbrevLen], [Word[AbbrevLen:]]
+        else:
+            Top, Rest = Words[0], [w[0].upper() + w[1:] for w in Words[1:]]
+        return (self.Fit([Top], AbbrevLen), self.Fit(Rest, AbbrevLen - len(Version)) + Version)
+
+    def IsVersion(self, Word):
+        if (Word[0:1] in 'vV') & (len(Word) > 1):
+            Word = Word[1:]
+        if Word.replace('.', '').isdigit():
+            return True
+        return (len(Word) <= 4) & (Word.strip('IVX') == '')
+
+    def Humps(self, Word):
+        # FabFilter -> Fab, Filter (runs of capitals such as EQ stay together)
+        if Word[1:] == Word[1:].lower():
+            return [Word]
+        HumpT = []
+        Start = 0
+        for n in range(1, len(Word)):
+            if Word[n].isupper() & Word[n - 1].islower():
+                HumpT.append(Word[Start:n])
+                Start = n
+        HumpT.append(Word[Start:])
+        return HumpT
+
+    def Fit(self, Words, Len):
+        Total = sum(map(len, Words))
+        if Total <= Len:
+            return ''.join(Words)
+        Words = [w if w.isalnum() else (''.join(c for c in w if c.isalnum()) or w) for w in Words]
+        if len(Words) == 1:
+            return self.DropVowels(Words[0], len(Words[0]) - Len)[0:Len]
+        # inner lowercase vowels go first, one at a time from the longest word that still has one (the last vowel of a
+        # word first), so work out how many each word loses and then drop them in one go
+        LenT = [len(w) for w in Words]
+        LeftT = [sum(map(w[1:].count, 'aeiou')) for w in Words]
+        DropT = [0] * len(Words)
+        Total = sum(LenT)
+        while Total > Len:
+            Best = -1
+            for n in range(0, len(Words)):
+                if (LeftT[n] > 0) and ((Best < 0) or (LenT[n] > LenT[Best])):
+                    Best = n
+            if Best < 0:
+                break
+            LenT[Best] -= 1
+            LeftT[Best] -= 1
+            DropT[Best] += 1
+            Total -= 1
+        Words = [self.DropVowels(Words[n], DropT[n]) for n in range(0, len(Words))]
+        while Total > Len:
+            Best = 0
+            for n in range(1, len(Words)):
+                if len(Words[n]) > len(Words[Best]):
+                    Best = n
+            if len(Words[Best]) <= 1:
+                break
+            Words[Best] = Words[Best][:-1]
+            Total -= 1
+        return ''.join(Words)[0:Len]
+
+    def DropVowels(self, Word, Count):
+        # the last Count inner lowercase vowels, found by removing the first ones from the word reversed (less its first letter)
+        if Count <= 0:
+            return Word
+        return Word[0] + self.VowelRE.sub('', Word[:0:-1], Count)[::-1]
+
+##################################
+# CLASS FOR THE PLUGIN METADATA
+##################################
+
+class TMackiePlugin:
+    def __init__(self, Valid, Name):
+        self.Valid = Valid
+        self.Name = Name
+        self.ParamCount = -1  # not asked for yet
+        self.PageT = {}  # page -> names of its PluginPageSize parameters
+
+
+class TMackiePlugins:
+    # Metadata for the plugins in the mixer slots, per (track, slot), dropped per track from OnDirtyMixerTrack. Parameter
+    # names are loaded one page (PluginPageSize) at a time when first shown; the pages either side are then queued and
+    # fetched from OnIdle (Prefetch), so paging through a large plugin does not stall the surface.
+    def __init__(self):
+        self.SlotT = {}
+        self.PendingT = []  # (track, slot, page) still to prefetch
+        self.Hits = 0
+        self.Misses = 0
+
+    def Get(self, Track, Slot):
+        Info = self.SlotT.get((Track, Slot))
+        if Info is None:
+            self.Misses += 1
+            Valid = plugins.isValid(Track, Slot)
+            if Valid:
+                Info = TMackiePlugin(True, plugins.getPluginName(Track, Slot))
+            else:
+                Info = TMackiePlugin(False, '')
+            self.SlotT[(Track, Slot)] = Info
+        else:
+            self.Hits += 1
+        return Info
+
+    def ParamCount(self, Track, Slot):
+        Info = self.Get(Track, Slot)
+        if Info.ParamCount < 0:
+            if Info.Valid:
+                Info.ParamCount = plugins.getParamCount(Track, Slot)
+            else:
+                Info.ParamCount = 0
+        return Info.ParamCount
+
+    def ParamName(self, Index, Track, Slot):
+        Page = Index // PluginPageSize
+        Info = self.Get(Track, Slot)
+        Names = Info.PageT.get(Page)
+        if Names is None:
+            Names = self.LoadPage(Info, Track, Slot, Page)
+            for n in [Page - 1, Page + 1]:
+                if (n >= 0) & (n * PluginPageSize < Info.ParamCount) & (not (n in Info.PageT)):
+                    self.PendingT.append((Track, Slot, n))
+        return Names[Index % PluginPageSize]
+
+    def LoadPage(self, Info, Track, Slot, Page):
+        Count = self.ParamCount(Track, Slot)
+        Names = ['' for n in range(PluginPageSize)]
+        for n in range(0, PluginPageSize):
+            if Page * PluginPageSize + n < Count:
+                Names[n] = plugins.getParamName(Page * PluginPageSize + n, Track, Slot)
+        Info.PageT[Page] = Names
+        return Names
+
+    def Prefetch(self):
+        # one page per call
+        while len(self.PendingT) > 0:
+            Track, Slot, Page = self.PendingT.pop()
+            Info = self.SlotT.get((Track, Slot))
+            if (Info is not None) and (not (Page in Info.PageT)):
+                self.LoadPage(Info, Track, Slot, Page)
+                return
+
+    def Invalidate(self, Track):
+        for Key in [Key for Key in self.SlotT if Key[0] == Track]:
+            del self.SlotT[Key]
+
+    def Clear(self):
+        self.SlotT.clear()
+        self.PendingT = []
+
+##################################
+# CLASS FOR BULK OPERATIONS
+##################################
+
+class TMackieBulk:
+    # Operations over many tracks or parameters at once. Each reads the current state once, keeps only what differs from
+    # the wanted state and changes just that in one pass, returning the number changed so the caller can show a single
+    # summary instead of a hint per item.
+    def UnmuteAll(self):
+        MutedT = [m for m in range(0, mixer.trackCount()) if mixer.isTrackMuted(m)]
+        for m in MutedT:
+            mixer.muteTrack(m)
+        return len(MutedT)
+
+    def ResetEvents(self, EventT, Speed=0):
+        # EventT holds (event ID, value) pairs; an event listed twice is only looked at once
+        SeenT = set()
+        ChangeT = []
+        for ID, Value in EventT:
+            if (ID >= 0) & (not (ID in SeenT)):
+                SeenT.add(ID)
+                if mixer.getEventValue(ID) != Value:
+                    ChangeT.append((ID, Value))
+        for ID, Value in ChangeT:
+            mixer.automateEvent(ID, Value, midi.REC_MIDIController, Speed)
+        return len(ChangeT)
+
+##################################
+# CLASS FOR THE MIXER PALETTE
+##################################
+
+class TMackiePalette:
+    # Builds the colour of every mixer track for a scheme (cached per scheme & track count) and applies it by writing
+    # only the tracks whose colour differs, so switching schemes costs one setTrackColor (and undo step) per change.
+    # The master takes the first banking colour; bank b uses PaletteGradientBaseT[b] or BankingColours[b + 1], wrapping.
+    def __init__(self):
+        self.SchemeT = {}  # (scheme, track count) -> colours
+
+    def Get(self, Scheme, Count):
+        ColourT = self.SchemeT.get((Scheme, Count))
+        if ColourT is None:
+            ColourT = [self.Colour(Scheme, m) for m in range(0, Count)]
+            self.SchemeT[(Scheme, Count)] = ColourT
+        return ColourT
+
+    def Colour(self, Scheme, Track):
+        if Scheme == Palette_Default:
+            return PaletteDefaultColour
+        if Track == 0:
+            return BankingColours[0]
+        Bank = (Track - 1) // 8
+        if Scheme == Palette_Solid:
+            return BankingColours[(Bank + 1) % len(BankingColours)]
+        Base = PaletteGradientBaseT[Bank % len(PaletteGradientBaseT)]
+        Step = (Track - 1) % 8
+        RGB = 0
+        for Shift in [16, 8, 0]:
+            c = (Base >> Shift) & 0xFF
+            RGB |= (c + (0xFF - c) * Step // PaletteGradientFade) << Shift
+        return RGB - 0x1000000  # alpha 0xFF, as a signed int
+
+    def Apply(self, Scheme):
+        # returns the number of tracks changed
+        ColourT = self.Get(Scheme, mixer.trackCount())
+        n = 0
+        for m in range(0, len(ColourT)):
+            if (mixer.getTrackColor(m) & 0xFFFFFF) != (ColourT[m] & 0xFFFFFF):
+                mixer.setTrackColor(m, ColourT[m])
+                n += 1
+        return n
+
+##################################
+# CLASS FOR MIXER SCENES
+##################################
+
+class TMackieScene:
+    # One stored mixer state: per track, mute/solo/arm bits plus the volume & pan event values
+    def __init__(self, Count):
+        self.Count = Count
+        self.FlagT = bytearray(Count)
+        self.VolT = array.array('i', [0]) * Count
+        self.PanT = array.array('i', [0]) * Count
+
+
+class TMackieScenes:
+    # SceneCount stored mixer states (Shift+F1..F8: tap to recall, hold for SceneHoldTime to store). Capture reads every
+    # track once; Recall compares with the live state and only writes what differs (through Bulk for volume & pan).
+    # Solo is restored before mute, as soloing in FL mutes the other tracks.
+    def __init__(self):
+        self.SlotT = [None] * SceneCount
+        self.DownT = [0] * SceneCount  # when each key went down (0: not held)
+
+    def Flags(self, Track):
+        return int(mixer.isTrackMuted(Track)) * Scene_Mute + int(mixer.isTrackSolo(Track)) * Scene_Solo + \
+            int(mixer.isTrackArmed(Track)) * Scene_Arm
+
+    def Capture(self, Num):
+        Count = mixer.trackCount()
+        Scene = TMackieScene(Count)
+        for m in range(0, Count):
+            Scene.FlagT[m] = self.Flags(m)
+            ID = mixer.getTrackPluginId(m, 0)
+            Scene.VolT[m] = mixer.getEventValue(ID + midi.REC_Mixer_Vol)
+            Scene.PanT[m] = mixer.getEventValue(ID + midi.REC_Mixer_Pan)
+        self.SlotT[Num] = Scene
+        return Count
+
+    def Recall(self, Num, Bulk, Speed=0):
+        # returns the number of changes made, or -1 if nothing is stored in the slot
+        Scene = self.SlotT[Num]
+        if Scene is None:
+            return -1
+        Count = min(Scene.Count, mixer.trackCount())
+        n = 0
+        LiveT = [self.Flags(m) for m in range(0, Count)]
+        # solo (unsolo first, so the soloed set ends up as stored)
+        for Want in [0, Scene_Solo]:
+            for m in range(0, Count):
+                if (((LiveT[m] ^ Scene.FlagT[m]) & Scene_Solo) != 0) & ((Scene.FlagT[m] & Scene_Solo) == Want):
+                    mixer.soloTrack(m, int(Want > 0), midi.fxSoloModeWithDestTracks)
+                    n += 1
+        if n > 0:
+            LiveT = [self.Flags(m) for m in range(0, Count)]
+        for m in range(0, Count):
+            Diff = LiveT[m] ^ Scene.FlagT[m]
+            if Diff & Scene_Mute:
+                mixer.muteTrack(m)
+                n += 1
+            if Diff & Scene_Arm:
+                mixer.armTrack(m)
+                n += 1
+        EventT = []
+        for m in range(0, Count):
+            ID = mixer.getTrackPluginId(m, 0)
+            EventT.append((ID + midi.REC_Mixer_Vol, Scene.VolT[m]))
+            EventT.append((ID + midi.REC_Mixer_Pan, Scene.PanT[m]))
+        return n + Bulk.ResetEvents(EventT, Speed)
+
+##################################
+# CLASS FOR INPUT COALESCING
+##################################
+
+class TMackieInput:
+    # Fader and V-Pot movement gathered over a frame (between two OnIdle calls). Per event only the latest fader level
+    # and the summed V-Pot increment are kept, so a fast fader throw costs one automateEvent per strip per frame and the
+    # hint is written once, for the control moved last. Any other input applies what is pending first, keeping the order.
+    def __init__(self):
+        self.FaderT = {}  # event ID -> [name, level, track to select or -1]
+        self.KnobT = {}  # event ID -> [name, summed increment]
+        self.Last = None  # (event ID, name) moved last
+        self.Received = 0
+        self.Applied = 0
+
+    def Fader(self, EventID, Name, Value, Track):
+        self.FaderT[EventID] = [Name, Value, Track]
+        self.Last = (EventID, Name)
+        self.Received += 1
+
+    def Knob(self, EventID, Name, Delta):
+        Entry = self.KnobT.get(EventID)
+        if Entry is None:
+            self.KnobT[EventID] = [Name, Delta]
+        else:
+            Entry[1] += Delta
+        self.Last = (EventID, Name)
+        self.Received += 1
+
+    def Pending(self):
+        return self.Last is not None
+
+    def Coalesces(self, event):
+        # fader moves and V-Pot turns (the input gathered here)
+        if event.midiId == midi.MIDI_PITCHBEND:
+            return event.midiChan <= 8
+        return (event.midiId == midi.MIDI_CONTROLCHANGE) & (event.midiChan == 0) & (0x10 <= event.data1 < 0x18)
+
+    def Apply(self, Speed):
+        # returns (event ID, name) of the control moved last, for the hint
+        for ID, (Name, Value, Track) in self.FaderT.items():
+            if (Track >= 0) and (mixer.trackNumber() != Track):
+                mixer.setTrackNumber(Track)
+            mixer.automateEvent(ID, Value, midi.REC_MIDIController, Speed)
+        for ID, (Name, Delta) in self.KnobT.items():
+            if Delta != 0:
+                # an increment is Value * Res, so the summed increment goes in as Res
+                mixer.automateEvent(ID, 1 if Delta > 0 else -1, midi.REC_Controller, Speed, 1, abs(Delta))
+        self.Applied += len(self.FaderT) + len(self.KnobT)
+        Last = self.Last
+        self.FaderT.clear()
+        self.KnobT.clear()
+        self.Last = None
+        return Last
+
+##################################
+# CLASS FOR THE MOTOR FADERS
+##################################
+
+class TMackieFaders:
+    # Position feedback for the motor faders, per strip (8 + master). Positions are only sent when they change, and
+    # not at all while a fader is touched (notes 0x68..0x70), as the motor would fight the hand; on release the
+    # current position is sent once whatever was sent before.
+    def __init__(self, Count):
+        self.TouchT = [False] * Count
+        self.SentT = [-1] * Count  # last message sent per strip
+        self.Sent = 0
+        self.Suppressed = 0
+
+    def Touched(self, Num):
+        return self.TouchT[Num]
+
+    def Touch(self, Num, On):
+        self.TouchT[Num] = On
+
+    def Send(self, Num, Value, Force=False):
+        # Value is the 14 bit fader position
+        if self.TouchT[Num]:
+            self.Suppressed += 1
+            return
+        Msg = Codec.Fader(Num, Value)
+        if Force | (Msg != self.SentT[Num]):
+            Output.Msg(OutPrio_Fader, Num, Msg)
+            self.SentT[Num] = Msg
+            self.Sent += 1
+
+    def Resync(self):
+        for n in range(0, len(self.SentT)):
+            self.SentT[n] = -1
+
+##################################
+# CLASS FOR THE SURFACE TOPOLOGY
+##################################
+
+class TMackieUnits:
+    # The surface is this unit plus the extenders FL lists as receivers of this script, side by side, UnitStrips strips
+    # each, as one column model: FirstTrackT holds the first track of the leftmost strip & every unit shows its own
+    # strips from there. An extender runs its own script, which can only be reached through device.dispatch, so it
+    # is given its absolute position rather than being sent each bank / move button: one message per unit, queued under
+    # one key per unit (a burst of bank moves only sends the last position) and only when the position changed, so
+    # all units move in the same Drain as this unit's strips.
+    def __init__(self):
+        self.Count = 0  # extenders
+        self.Pos = ExtenderLeft
+        self.PlacedT = []  # first track last sent to each extender
+
+    def Update(self):
+        Count = device.dispatchReceiverCount()
+        if Count != self.Count:
+            self.Count = Count
+            self.PlacedT = [-1] * Count
+
+    def Width(self):
+        return UnitStrips * (self.Count + 1)
+
+    def Offset(self, Unit):
+        # first strip of a unit within the surface; Unit -1 is this one
+        if Unit < 0:
+            return UnitStrips * self.Count * int(self.Pos == ExtenderLeft)
+        return UnitStrips * (Unit + int(self.Pos == ExtenderRight))
+
+    def Place(self, First, Wrap):
+        for n in range(0, self.Count):
+            Track = (First + self.Offset(n)) % Wrap
+            if Track != self.PlacedT[n]:
+                self.PlacedT[n] = Track
+                Output.Dispatch(OutPrio_LED, ('Unit', n), n, midi.MIDI_NOTEON + (UnitPlaceNote << 8) + (Track << 16))
+
+    def Mirror(self, event):
+        # buttons that every extender follows (page, flip, meter mode); these toggle, so they are never coalesced
+        for n in range(0, self.Count):
+            Output.Dispatch(OutPrio_LED, None, n, midi.MIDI_NOTEON + (event.data1 << 8) + (event.data2 << 16))
+
+    def Resync(self):
+        self.Update()
+        self.PlacedT = [-1] * self.Count
+
+##################################
+# CLASS FOR THE DIAGNOSTICS PAGE
+##################################
+
+class TMackieDiag:
+    # Callback timings are recorded from the start, one bucket increment per call (see DiagBucketT), so the page
+    # already covers the lag that made someone open it. While it is shown the second display gets p50 / p99 per
+    # callback on the top row and the worst times plus MIDI in / out messages and sysex bytes per second on the
+    # bottom row (PROF while a profiling session runs). Percentiles are the upper edge of their bucket, in ms.
+    def __init__(self):
+        self.Active = False
+        self.Reset()
+
+    def Reset(self):
+        self.CountT = [[0] * (len(DiagBucketT) + 1) for n in range(0, len(DiagNameT))]
+        self.MaxT = [0.0] * len(DiagNameT)
+        self.RenderTime = 0
+        self.MidiIn = 0
+        self.MidiOut = Output.MsgSent
+        self.Sysex = Output.SysexSent
+
+    def Time(self, Num, Start):
+        Elapsed = time.perf_counter() - Start
+        self.CountT[Num][bisect.bisect_left(DiagBucketT, Elapsed * 1000000)] += 1
+        if Elapsed > self.MaxT[Num]:
+            self.MaxT[Num] = Elapsed
+
+    def Percentile(self, Num, P):
+        CountT = self.CountT[Num]
+        Left = sum(CountT) * P
+        for n in range(0, len(DiagBucketT)):
+            Left -= CountT[n]
+            if Left <= 0:
+                return min(DiagBucketT[n] / 1000000, self.MaxT[Num])
+        return self.MaxT[Num]
+
+    def Ms(self, Seconds):
+        # 3 characters: .05 / 1.2 / 120 (ms)
+        ms = Seconds * 1000
+        if ms < 0.995:
+            return '.' + str(round(ms * 100)).zfill(2)
+        elif ms < 9.95:
+            return '{:.1f}'.format(ms)
+        elif ms < 999.5:
+            return '{:>3}'.format(round(ms))
+        return '>1s'
+
+    def Rate(self, Count, Elapsed):
+        # 4 characters
+        r = round(Count / Elapsed)
+        if r < 10000:
+            return '{:>4}'.format(r)
+        return '{:>3}k'.format(min(999, round(r / 1000)))
+
+    def Render(self, Now):
+        # returns the two rows of the page, or None if it is not time to redraw yet
+        Elapsed = Now - self.RenderTime
+        if Elapsed < DiagRefresh:
+            return None
+        Top = ' '.join('{} {}/{}'.format(DiagNameT[n], self.Ms(self.Percentile(n, 0.5)), self.Ms(self.Percentile(n, 0.99)))
+                       for n in range(0, len(DiagNameT)))
+        Bottom = 'max ' + ' '.join(self.Ms(t) for t in self.MaxT)
+        if self.RenderTime > 0:
+            Bottom += '  in {} out {} sx {}'.format(self.Rate(self.MidiIn, Elapsed), self.Rate(Output.MsgSent - self.MidiOut, Elapsed),
+                                                      self.Rate(Output.SysexSent - self.Sysex, Elapsed))
+        if Profiler.Active:
+            Bottom += ' PROF'
+        self.RenderTime = Now
+        self.MidiIn = 0
+        self.MidiOut = Output.MsgSent
+        self.Sysex = Output.SysexSent
+        return Top.ljust(LCDRowLen)[0:LCDRowLen] + Bottom.ljust(LCDRowLen)[0:LCDRowLen]
+
+##################################
+# CLASS FOR GENERAL FUNCTIONALITY
+##################################
+
+class TMackieCU():
+    def __init__(self):
+        self.LastMsgLen = 0x37
+        self.Shift = False
+        self.Control = False
+        self.Option = False
+        self.Alt = False
+        self.JogSource = 0
+        self.SliderHoldCount = 0
+        self.FirstTrack = 0
+        self.FirstTrackT = [0, 0]
+        self.ColT = [0 for x in range(9)]
+        for x in range(0, 9):
+            self.ColT[x] = TMackieCol()
+        self.FreeCtrlT = [0 for x in range(
+            MackieCU_nFreeTracks - 1 + 2)]  # 64+1 sliders
+        self.Clicking = False
+        self.Scrub = False
+        self.Flip = False
+        self.MeterMode = 1  # enabled!
+        self.CurMeterMode = 0
+        self.Page = 0
+        self.SmoothSpeed = 0
+        self.MeterMax = 0
+        self.ActivityMax = 0
+        self.DefaultJogToPlaylist = False
+        self.MixerScroll = False
+        self.MackieCU_PageNameT = ('Panning                          (press VPOTS to reset)', 'Stereo Separation               (press VPOTS to reset)', '" - press VPOTS to enable',
+                                   '" - turn VPOTS to adjust', '" - press VPOTS to reset',  '(Free Controls)')
+        self.MackieCU_MeterModeNameT = ('Meters Disabled', 'Meters Enabled')
+        self.MackieCU_ExtenderPosT = ('left', 'right')
+        self.FreeEventID = 400
+        self.ArrowsStr = chr(0x7F) + chr(0x7E) + chr(0x32)
+        self.AlphaTrack_SliderMax = round(13072 * 16000 / 12800)
+        self.CurPluginID = -1
+        self.CurPluginOffset = 0
+        self.PluginParamOffset = 0
+        self.LCD1 = TMackieLCD([0xF0, 0x00, 0x00, 0x66, 0x14, 0x12])
+        self.LCD2 = TMackieLCD([0xF0, 0x00, 0x00, 0x67, 0x15, 0x13])
+        self.TempMsg = TMackieTempMsg()
+        self.MasterPeak = 0
+        self.Msg1 = ''
+        self.Msg2 = ''
+        self.ShowTrackNumbers = True
+        self.FreeText = 0  # Zenology - change to 1 (generic) or -1 (blank)
+        self.colourOptions = 0
+        self.DispatchT = []
+        self.PageDispatchT = None
+        self.MidiIdT = {}
+        self.LEDs = TMackieLEDs()
+        self.Armed = TMackieArmedTracks()
+        self.Meters = TMackieMeters(8)
+        self.Digits = TMackieDigits()
+        self.Names = TMackieNames()
+        self.Plugins = TMackiePlugins()
+        self.Abbrev = TMackieAbbrev()
+        self.Bulk = TMackieBulk()
+        self.Palette = TMackiePalette()
+        self.Scenes = TMackieScenes()
+        self.Input = TMackieInput()
+        self.Faders = TMackieFaders(9)
+        self.Units = TMackieUnits()
+        self.Diag = TMackieDiag()
+        self.WasAssigned = False
+
+# -------------------------------------------------------------------------------------------------------------------------------
+# FUNCTIONS:
+# -------------------------------------------------------------------------------------------------------------------------------
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  CALLED FROM UPDATECOL TO RETURN SLIDER / LEVEL VALUEDS                                                                   #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def AlphaTrack_LevelToSlider(self, Value, Max=midi.FromMIDI_Max):
+        return round(Value / Max * self.AlphaTrack_SliderMax)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  CALLED FROM UPDATECOL TO RETURN SLIDER / LEVEL VALUEDS                                                                   #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def AlphaTrack_SliderToLevel(self, Value, Max=midi.FromMIDI_Max):
+        return min(round(Value / self.AlphaTrack_SliderMax * Max), Max)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  CURRENT POSITION OF A MOTOR FADER (AS UPDATECOL SENDS IT)                                                                #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def FaderPos(self, Num):
+        if self.Page == MackieCUPage_Free:
+            return self.FreeCtrlT[self.ColT[Num].TrackNum]
+        return self.AlphaTrack_LevelToSlider(mixer.getEventValue(self.ColT[Num].SliderEventID))
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  FORGET WHAT THE UNIT SHOWS AND SEND EVERYTHING AGAIN (E.G. AFTER THE DEVICE HAS BEEN RECONNECTED)                        #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def Resync(self):
+        self.LEDs.Resync()
+        for m in range(0, len(self.ColT)):
+            self.ColT[m].Key = None
+        self.LCD1.Resync()
+        self.LCD2.Resync()
+        self.TempMsg.Dirty = True
+        self.Meters.Resync()
+        self.Digits.Resync()
+        self.Faders.Resync()
+        self.Units.Resync()
+        if Trace.Mask & TraceSub_Script:
+            Trace.Rec(TE_Resync)
+        self.UpdateColT()
+        self.UpdateMixer_Sel()
+        self.UpdateLEDs()
+        self.UpdateTextDisplay()
+        self.Flush()
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  SEND WHATEVER THIS CALLBACK CHANGED ON THE DISPLAYS (CALLED AT THE END OF EACH CALLBACK)                                 #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def ApplyInput(self):
+        Last = self.Input.Apply(self.SmoothSpeed)
+        if Last is not None:
+            # hint
+            n = mixer.getAutoSmoothEventValue(Last[0])
+            s = mixer.getEventIDValueString(Last[0], n)
+            if s != '':
+                s = ': ' + s
+            self.SendMsg2(Last[1] + s, 1000, TempMsgPrio_Hint)
+
+    def Flush(self):
+        if self.TempMsg.Dirty:
+            self.UpdateTempMsg()
+        Output.Drain()
+        # the framebuffers hold the newest text, so they are only turned into sysex once there is room to send it
+        if (Output.Budget > 0) & (len(Output.QueueT[OutPrio_LCD]) == 0):
+            self.LCD1.Flush()
+            self.LCD2.Flush()
+            Output.Drain()
+
+# --------------------------------------------------------------------------------------------------------------------------------
+# EVENTS:
+# --------------------------------------------------------------------------------------------------------------------------------
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  Called when the script has been started.                                                                                 #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnInit(self):
+
+        self.FirstTrackT[0] = 1
+        self.FirstTrack = 0
+        self.SmoothSpeed = 469
+        self.Clicking = True
+
+        device.setHasMeters()
+        self.Digits.Resync()
+        self.BuildDispatch()
+        self.LEDs.Resync()
+        self.LCD1.Resync()
+        self.LCD2.Resync()
+        self.WasAssigned = device.isAssigned()
+        self.Armed.Rebuild()
+
+        for m in range(0, len(self.FreeCtrlT)):
+            self.FreeCtrlT[m] = 8192  # default free faders to center
+        if device.isAssigned():
+            Output.Sysex(OutPrio_LED, None, Codec.Setting(0x0C, 1))
+        self.SetBackLight(2)  # backlight timeout to 2 minutes
+        self.UpdateClicking()
+        self.UpdateMeterMode()
+        self.SetPage(self.Page)
+        self.SendMsg(chr(32)*112)
+        self.Flush()
+        if Trace.Mask & TraceSub_Script:
+            Trace.Rec(TE_OnInit)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  	Called before the script will be stopped.                                                                               #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnDeInit(self):
+
+        if device.isAssigned():
+            for m in range(0, 8):
+                Output.Sysex(OutPrio_Meter, None, Codec.MeterModeT[m][0])
+            self.Meters.Send(8, 0)
+            self.Meters.Send(9, 0)
+
+            if ui.isClosing():
+                # self.SendMsg(chr(32)*112)
+                self.SendMsg(
+                    "Your QCON Pro X script version is 0.8                   (Please check on www.gadgeteer.home.blog for updates).   ")
+                # self.SendMsg2(chr(32)*112)
+                self.SendMsg2(ui.getProgTitle() + ' session closed at ' +
+                              time.ctime(time.time()), 0)
+                self.SendMsg('', 1, 2)
+            else:
+                self.SendMsg('', 1)
+
+            self.SendAssignmentMsg('   ')
+            self.Flush()
+            # the script is stopping, so whatever is still queued goes now
+            self.LCD1.Flush()
+            self.LCD2.Flush()
+            Output.Drain(True)
+        if (Trace.Mask != 0) & (TraceFileName != ''):
+            Trace.Dump(TraceFileName)
+        if Trace.Mask & TraceSub_Script:
+            Trace.Rec(TE_OnDeInit)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  	Called on mixer track(s) change, 'index' indicates track index of track that changed or -1 when all tracks changed.     #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnDirtyMixerTrack(self, SetTrackNum):
+        # on the sends, FX & EQ pages every column also depends on the selected track
+        Sel = (self.Page in [MackieCUPage_Sends, MackieCUPage_FX, MackieCUPage_EQ]) & (SetTrackNum == mixer.trackNumber())
+        for m in range(0, len(self.ColT)):
+            if (self.ColT[m].TrackNum == SetTrackNum) | (SetTrackNum == -1):
+                self.ColT[m].Dirty = True
+                self.ColT[m].Key = None
+            elif Sel:
+                self.ColT[m].Key = None
+        if SetTrackNum == -1:
+            self.Armed.Rebuild()
+            self.Names.Clear()
+            self.Plugins.Clear()
+        elif SetTrackNum >= 0:
+            self.Armed.Update(SetTrackNum)
+            self.Names.Invalidate(SetTrackNum)
+            self.Plugins.Invalidate(SetTrackNum)
+        if Trace.VerboseMask & TraceSub_Script:
+            Trace.Rec(TE_OnDirtyMixerTrack, SetTrackNum)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  Called when something changed that the script might want to respond to.                                                  #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnRefresh(self, flags):
+        Start = time.perf_counter()
+        if flags & midi.HW_Dirty_Mixer_Sel:
+            self.UpdateMixer_Sel()
+
+        if flags & midi.HW_Dirty_Mixer_Display:
+            self.UpdateTextDisplay()
+            self.UpdateColT()
+
+        if flags & midi.HW_Dirty_Mixer_Controls:
+            for n in range(0, len(self.ColT)):
+                if self.ColT[n].Dirty:
+                    self.UpdateCol(n)
+
+        # LEDs
+        if flags & midi.HW_Dirty_LEDs:
+            self.UpdateLEDs()
+        self.Flush()
+        self.Diag.Time(Diag_Refresh, Start)
+        if Trace.VerboseMask & TraceSub_Script:
+            Trace.Rec(TE_OnRefresh, flags)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   SEND A MESSAGE TO THE SECOND DISPLAY (USSUALLY RAISED BY FL STUDIO)                                                     #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnSendTempMsg(self, Msg, Duration=1000):
+        if Trace.Mask & TraceSub_Display:
+            Trace.Rec(TE_OnSendTempMsg, Msg)
+        self.SendMsg2(Msg, Duration, TempMsgPrio_Hint)
+        self.Flush()
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  Called when the beat indicator has changes.                                                                              #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnUpdateBeatIndicator(self, Value):
+
+        if device.isAssigned():
+            self.LEDs.Set(0x5E, midi.TranzPort_OffOnT[Value > 0])
+        self.Flush()
+        if Trace.VerboseMask & TraceSub_LEDs:
+            Trace.Rec(TE_OnUpdateBeatIndicator, Value)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  Called when peak meters needs to be updated                                                                              #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnUpdateMeters(self):
+        Start = time.perf_counter()
+        if self.CurMeterMode == 1:
+            if self.Page != MackieCUPage_Free:
+                self.Meters.Read(self.ColT)
+        self.Diag.Time(Diag_Meters, Start)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  CALLED BY FL WHENEVER IT IS NOT BUSY \\:-)                                                                                     #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnIdle(self):
+        # -----------------------------------------
+        # RESEND EVERYTHING WHEN THE UNIT RETURNS
+        # -----------------------------------------
+        Assigned = device.isAssigned()
+        if Assigned & (not self.WasAssigned):
+            self.Resync()
+        self.WasAssigned = Assigned
+        Now = time.perf_counter()
+        Output.Refill()
+        Output.UpdateRates(Now)
+        self.LEDs.UpdateRates(Now)
+        self.Meters.UpdateRates(Now)
+        self.Armed.Sweep(Now)
+        self.Plugins.Prefetch()
+        # ------------------------------------------------
+        # APPLY THE FADER & V-POT INPUT OF THIS FRAME
+        # ------------------------------------------------
+        if self.Input.Pending():
+            self.ApplyInput()
+        # ----------------
+        # REFRESH METERS
+        # ---------------
+        if Assigned:
+            self.Meters.Frame(Now, self.MeterMax)
+        # -------------------------
+        # UPDATE THE TIME DISPLAY
+        # -------------------------
+        self.Digits.SetTime(playlist.getVisTimeBar(), playlist.getVisTimeStep(), playlist.getVisTimeTick(), ui.getTimeDispMin())
+        # ----------------------------------------------------------------------
+        # EXPIRE TEMPORARY MESSAGES (NOT WHILE A FADER IS HELD OR A MENU IS OPEN)
+        # ----------------------------------------------------------------------
+        if (self.SliderHoldCount <= 0) & (not ui.isInPopupMenu()):
+            self.TempMsg.Expire(Now)
+        if self.Diag.Active:
+            Page = self.Diag.Render(Now)
+            if Page is not None:
+                self.LCD2.Write(0, Page)
+        self.Flush()
+        self.Diag.Time(Diag_Idle, Now)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  BUILDS THE OnMidiMsg DISPATCH TABLES (CALLED ONCE FROM OnInit)                                                           #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def RegisterHandler(self, Stage, Data1T, Handler, Pages=None):
+        # Data1T lists the CC / note numbers that Handler serves; Pages limits it to some assignment pages (default: all)
+        if Stage == Dispatch_CC:
+            MidiId = midi.MIDI_CONTROLCHANGE
+        else:
+            MidiId = midi.MIDI_NOTEON
+        if Pages is None:
+            Pages = range(0, len(self.DispatchT))
+        for p in Pages:
+            for n in Data1T:
+                self.DispatchT[p][Stage][(MidiId, n)] = Handler
+
+    def BuildDispatch(self):
+        self.DispatchT = [[{} for s in range(0, Dispatch_Count)] for p in range(0, MackieCUPage_Free + 1)]
+        NotFree = range(0, MackieCUPage_Free)
+        Free = [MackieCUPage_Free]
+
+        # control change (channel 0)
+        self.RegisterHandler(Dispatch_CC, [0x3C], self.HandleJogDial)
+        self.RegisterHandler(Dispatch_CC, range(0x10, 0x18), self.HandleKnob, NotFree)
+        self.RegisterHandler(Dispatch_CC, range(0x10, 0x18), self.HandleFreeKnob, Free)
+
+        # note presses handled ahead of the system buttons
+        self.RegisterHandler(Dispatch_Press, [0x3F], self.HandleMixer)
+        self.RegisterHandler(Dispatch_Press, [0x40], self.HandleChannelRack)
+        self.RegisterHandler(Dispatch_Press, [0x41], self.HandleTempo)
+        self.RegisterHandler(Dispatch_Press, [0x4C], self.HandleWindow)
+
+        # system buttons (PME_System)
+        self.RegisterHandler(Dispatch_System, [0x34], self.HandleMeterMode)
+        self.RegisterHandler(Dispatch_System, [0x35], self.HandleTimeFormat)
+        self.RegisterHandler(Dispatch_System, [0x65], self.HandleScrub)
+        self.RegisterHandler(Dispatch_System, [0x3E, 0x3F, 0x40, 0x41, 0x48, 0x64, 0x46, 0x4C], self.HandleJogSource)
+        self.RegisterHandler(Dispatch_System, [0x60, 0x61, 0x62, 0x63], self.HandleArrows)
+        self.RegisterHandler(Dispatch_System, [0x58], self.HandleCountDown)
+        self.RegisterHandler(Dispatch_System, [0x5A], self.HandlePatternSong)
+        self.RegisterHandler(Dispatch_System, [0x33], self.HandleSmoothing)
+        self.RegisterHandler(Dispatch_System, [0x36, 0x37, 0x38, 0x39, 0x3A], self.HandleCutCopy)
+        self.RegisterHandler(Dispatch_System, [0x3C, 0x3D], self.HandleUndo)
+        self.RegisterHandler(Dispatch_System, [0x42], self.HandleFree1)
+        self.RegisterHandler(Dispatch_System, [0x43], self.HandleFree2)
+        self.RegisterHandler(Dispatch_System, [0x44], self.HandleFree3)
+        self.RegisterHandler(Dispatch_System, [0x45], self.HandleFree4)
+        self.RegisterHandler(Dispatch_System, [0x4A], self.HandleBrowser)
+        self.RegisterHandler(Dispatch_System, [0x4B], self.HandleMain)
+        self.RegisterHandler(Dispatch_System, [0x2E, 0x2F], self.HandleBank)
+        self.RegisterHandler(Dispatch_System, [0x30, 0x31], self.HandleMove)
+        self.RegisterHandler(Dispatch_System, [0x32], self.HandleFlip)
+        self.RegisterHandler(Dispatch_System, [0x28, 0x29, 0x2A, 0x2B, 0x2C, 0x2D], self.HandlePageSelect)
+        self.RegisterHandler(Dispatch_System, [0x54], self.HandleShift)
+        self.RegisterHandler(Dispatch_System, range(0x68, 0x71), self.HandleFaderTouch)
+        self.RegisterHandler(Dispatch_System, [0x51], self.HandleMenu)
+        self.RegisterHandler(Dispatch_System, [0x55], self.HandleEdison)
+        self.RegisterHandler(Dispatch_System, [0x59], self.HandleMetronome)
+        self.RegisterHandler(Dispatch_System, [0x5B, 0x5C], self.HandleRewindForward)
+        self.RegisterHandler(Dispatch_System, [0x5D], self.HandleStop)
+        self.RegisterHandler(Dispatch_System, [0x5E], self.HandlePlay)
+        self.RegisterHandler(Dispatch_System, [0x5F], self.HandleRecord)
+        self.RegisterHandler(Dispatch_System, [0x4E], self.HandleSnap)
+        self.RegisterHandler(Dispatch_System, [0x52], self.HandleEscape)
+        self.RegisterHandler(Dispatch_System, [0x53], self.HandleEnter)
+        self.RegisterHandler(Dispatch_System, range(0x20, 0x28), self.HandleFreeKnobPush, Free)
+        self.RegisterHandler(Dispatch_System, range(0x20, 0x28), self.HandleKnobPush, [MackieCUPage_Pan, MackieCUPage_Stereo, MackieCUPage_FX])
+        self.RegisterHandler(Dispatch_System, range(0x20, 0x28), self.HandleSendsKnobPush, [MackieCUPage_Sends])
+        self.RegisterHandler(Dispatch_System, [0x27], self.HandleEQResetAll, [MackieCUPage_EQ])
+        self.RegisterHandler(Dispatch_System, range(0x00, 0x20), self.HandleFreeButton, Free)
+
+        # system safe buttons (PME_System_Safe)
+        self.RegisterHandler(Dispatch_Safe, [0x47], self.HandleLinkChannel)
+        self.RegisterHandler(Dispatch_Safe, [0x3B], self.HandleItemMenu)
+        self.RegisterHandler(Dispatch_Safe, [0x4D, 0x4E, 0x4F], self.HandlePunch)
+        self.RegisterHandler(Dispatch_Safe, [0x49], self.HandleAddMarker)
+        self.RegisterHandler(Dispatch_Safe, range(0x18, 0x20), self.HandleSelect)
+        self.RegisterHandler(Dispatch_Safe, range(0x08, 0x10), self.HandleSolo)
+        self.RegisterHandler(Dispatch_Safe, range(0x10, 0x18), self.HandleMute)
+        self.RegisterHandler(Dispatch_Safe, range(0x00, 0x08), self.HandleArm)
+        self.RegisterHandler(Dispatch_Safe, [0x50], self.HandleSave)
+
+        self.MidiIdT = {midi.MIDI_CONTROLCHANGE: self.OnControlChange,
+                        midi.MIDI_PITCHBEND: self.OnPitchBend,
+                        midi.MIDI_NOTEON: self.OnNote,
+                        midi.MIDI_NOTEOFF: self.OnNote}
+        self.PageDispatchT = self.DispatchT[self.Page]
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  Called for all MIDI messages that were not handled by OnMidiIn.       .                                                  #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnMidiMsg(self, event):
+        Start = time.perf_counter()
+        self.Diag.MidiIn += 1
+        if Trace.Mask & TraceSub_Midi:
+            Trace.Rec(TE_OnMidiMsg, event.midiId, event.midiChan, event.data1, event.data2)
+
+        if self.Input.Pending() and (not self.Input.Coalesces(event)):
+            self.ApplyInput()
+        Handler = self.MidiIdT.get(event.midiId)
+        if Handler is not None:
+            Handler(event)
+        self.Flush()
+        self.Diag.Time(Diag_MidiMsg, Start)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   CONTROL CHANGE                                                                                                          #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnControlChange(self, event):
+        if self.DefaultJogToPlaylist:
+            ui.setFocused(midi.widPlaylist)
+        if (event.midiChan == 0):
+            event.inEv = event.data2
+            if event.inEv >= 0x40:
+                event.outEv = -(event.inEv - 0x40)
+            else:
+                event.outEv = event.inEv
+            Handler = self.PageDispatchT[Dispatch_CC].get((event.midiId, event.data1))
+            if Handler is not None:
+                Handler(event)
+            else:
+                event.handled = False  # for extra CCs in emulators
+        else:
+            event.handled = False  # for extra CCs in emulators
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   PITCH BEND (FADERS)                                                                                                     #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnPitchBend(self, event):
+        if event.midiChan <= 8:
+            event.inEv = event.data1 + (event.data2 << 7)
+            event.outEv = (event.inEv << 16) // 16383
+            event.inEv -= 0x2000
+
+            if self.Page == MackieCUPage_Free:
+                self.Meters.Activity(event.midiChan, self.ActivityMax)
+                self.FreeCtrlT[self.ColT[event.midiChan].TrackNum] = event.data1 + \
+                    (event.data2 << 7)
+                device.hardwareRefreshMixerTrack(
+                    self.ColT[event.midiChan].TrackNum)
+                event.data1 = self.ColT[event.midiChan].BaseEventID + 7
+                event.midiChan = 0
+                event.midiChanEx = event.midiChanEx & (not 0xF)
+                self.SendMsg2('Free slider ' + str(event.data1) + ': ' +
+                              ui.getHintValue(event.outEv, midi.FromMIDI_Max))
+                device.processMIDICC(event)
+            elif self.ColT[event.midiChan].SliderEventID >= 0:
+                # slider (mixer track volume), applied with the rest of the frame's input from OnIdle
+                Track = -1
+                if self.ColT[event.midiChan].TrackNum >= 0:
+                    if (self.Page != MackieCUPage_EQ) and (self.Page != MackieCUPage_FX):
+                        Track = self.ColT[event.midiChan].TrackNum
+                event.handled = True
+                self.Input.Fader(self.ColT[event.midiChan].SliderEventID, self.ColT[event.midiChan].SliderName,
+                                 self.AlphaTrack_SliderToLevel(event.inEv + 0x2000), Track)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   MIDI NOTEON/OFF                                                                                                         #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def OnNote(self, event):
+        if event.midiId == midi.MIDI_NOTEON:
+            if event.data2 > 0:
+                Handler = self.PageDispatchT[Dispatch_Press].get((event.midiId, event.data1))
+                if Handler is not None:
+                    Handler(event)
+
+            if (event.pmeFlags & midi.PME_System != 0):
+                # F1..F8
+                if SceneKeys & (event.data1 in [0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D]):
+                    if self.Shift | (self.Scenes.DownT[(event.data1 - 0x36) % SceneCount] > 0):
+                        self.HandleScene(event)
+                        event.data1 = 0xFF
+                if self.Shift & (event.data1 in [0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D]):
+                    transport.globalTransport(midi.FPT_F1 - 0x36 +
+                                              event.data1, int(event.data2 > 0) * 2, event.pmeFlags)
+                    event.data1 = 0xFF
+
+                if self.Control & (event.data1 in [0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B, 0x3C, 0x3D]):
+                    ui.showWindow(midi.widPlaylist)
+                    ui.setFocused(midi.widPlaylist)
+                    transport.globalTransport(midi.FPT_Menu, int(
+                        event.data2 > 0) * 2, event.pmeFlags)
+                    time.sleep(0.1)
+                    f = int(1 + event.data1 - 0x36)
+                    for x in range(0, f):
+                        transport.globalTransport(midi.FPT_Down, int(
+                            event.data2 > 0) * 2, event.pmeFlags)
+                        time.sleep(0.01)
+                    time.sleep(0.1)
+                    transport.globalTransport(midi.FPT_Enter, int(
+                        event.data2 > 0) * 2, event.pmeFlags)
+                    event.data1 = 0xFF
+
+                # a handler returns True when it has fully consumed the event (free controls)
+                Handler = self.PageDispatchT[Dispatch_System].get((event.midiId, event.data1))
+                if Handler is not None:
+                    if Handler(event):
+                        return
+
+            if (event.pmeFlags & midi.PME_System_Safe != 0):
+                Handler = self.PageDispatchT[Dispatch_Safe].get((event.midiId, event.data1))
+                if Handler is not None:
+                    Handler(event)
+                event.handled = True
+            else:
+                event.handled = False
+        else:
+            event.handled = False
+
+# -------------------------------------------------------------------------------------------------------------------------------
+# MIDI HANDLERS (REGISTERED IN BuildDispatch):
+# -------------------------------------------------------------------------------------------------------------------------------
+
+    # ----------
+    # JOG DIAL
+    # ----------
+    def HandleJogDial(self, event):
+        self.Jog(event)
+        event.handled = True
+
+    # -------
+    # KNOBS
+    # -------
+    def HandleKnob(self, event):
+        r = utils.KnobAccelToRes2(event.outEv)  # todo outev signof
+        Res = r * (1 / (40 * 2.5))
+        # as SetKnobValue, but summed over the frame and applied from OnIdle
+        Num = event.data1 - 0x10
+        if (self.ColT[Num].KnobEventID >= 0) & (self.ColT[Num].KnobMode < 4):
+            self.Input.Knob(self.ColT[Num].KnobEventID, self.ColT[Num].KnobName, event.outEv * Res)
+        event.handled = True
+        if Trace.VerboseMask & TraceSub_Mixer:
+            Trace.Rec(TE_SetKnobValue, Num, event.outEv)
+
+    def HandleFreeKnob(self, event):
+        i = event.data1 - 0x10
+        self.Meters.Activity(i, self.ActivityMax)
+        event.data1 = self.ColT[i].BaseEventID + \
+            int(self.ColT[i].KnobHeld)
+        event.isIncrement = 1
+        s = chr(0x7E + int(event.outEv < 0))
+        self.SendMsg2(
+            'Free knob ' + str(event.data1) + ': ' + s)
+        device.processMIDICC(event)
+        device.hardwareRefreshMixerTrack(self.ColT[i].TrackNum)
+
+    # -------------
+    # FADER TOUCH
+    # -------------
+    def HandleFaderTouch(self, event):
+        Num = event.data1 - 0x68
+        Touch = event.data2 > 0
+        if Touch != self.Faders.Touched(Num):
+            self.SliderHoldCount += -1 + (int(Touch) * 2)
+            self.Faders.Touch(Num, Touch)
+            if (not Touch) & device.isAssigned():
+                # the fader's movement has been applied (see OnMidiMsg), so this is where the track ended up
+                self.Faders.Send(Num, self.FaderPos(Num), True)
+
+    # -------
+    # MIXER
+    # -------
+    def HandleMixer(self, event):
+        if self.Shift:
+            if self.ShowTrackNumbers:
+                self.ShowTrackNumbers = False
+            else:
+                self.ShowTrackNumbers = True
+            self.UpdateTextDisplay()
+        else:
+            ui.showWindow(midi.widMixer)
+            ui.setFocused(midi.widMixer)
+            self.SendMsg2("The Mixer Window is Open")
+
+    # ---------
+    # CHANNEL
+    # --------
+    def HandleChannelRack(self, event):
+        if self.Shift:
+            if ui.getFocused(5) == 0:
+                channels.focusEditor(channels.getChannelIndex(channels.selectedChannel()))
+                channels.showCSForm(channels.getChannelIndex(channels.selectedChannel(-1)))
+            else:
+                channels.focusEditor(channels.getChannelIndex(channels.selectedChannel()))
+                channels.showCSForm(channels.getChannelIndex(channels.selectedChannel(-1)), 0)
+        else:
+            ui.showWindow(midi.widChannelRack)
+            ui.setFocused(midi.widChannelRack)
+            self.SendMsg2("The Channel Rack Window is Open")
+
+    # -------
+    # TEMPO
+    # -------
+    def HandleTempo(self, event):
+        transport.globalTransport(midi.FPT_TapTempo, 1)
+        s = str(mixer.getCurrentTempo(True))[:-2]
+        self.SendMsg2("Tempo: "+s)
+
+    # --------
+    # WINDOW
+    # --------
+    def HandleWindow(self, event):
+        ui.nextWindow()
+        s = ui.getFocusedFormCaption()
+        if s != "":
+            self.SendMsg2('Current window: ' + s)
+
+    #---------------
+    # MODE (METERS)
+    #---------------
+    def HandleMeterMode(self, event):
+        if event.data2 > 0:
+            if self.Shift:
+                self.Units.Pos = abs(self.Units.Pos - 1)
+                self.FirstTrackT[self.FirstTrack] = 1
+                self.SetPage(self.Page)
+                self.SendMsg2(
+                    'Extender on ' + self.MackieCU_ExtenderPosT[self.Units.Pos], 1500)
+            else:
+                self.MeterMode = (self.MeterMode + 1) % 2
+                self.SendMsg2(
+                    self.MackieCU_MeterModeNameT[self.MeterMode])
+                self.UpdateMeterMode()
+                self.Units.Mirror(event)
+                self.Meters.Send(8, 0)
+                self.Meters.Send(9, 0)
+
+    #-------------
+    # TIME FORMAT
+    #-------------
+    def HandleTimeFormat(self, event):
+        if event.data2 > 0:
+            if self.Shift:
+                self.ShowDiag(not self.Diag.Active)
+                return
+            elif self.Diag.Active:
+                self.ToggleProfile()
+                return
+            ui.setTimeDispMin()
+            if ui.getTimeDispMin():
+                self.SendMsg2("Time display set to M:S:CS (Time)")
+            else:
+                self.SendMsg2("Time display set to B:S:T (Beats)")
+
+    def ShowDiag(self, On):
+        # the second display is left to the diagnostics page (see SendMsg) until it is switched off again
+        self.Diag.Active = On
+        self.Diag.RenderTime = 0
+        if not On:
+            self.TempMsg.Dirty = True
+            self.UpdateTextDisplay()
+
+    def ToggleProfile(self):
+        if Profiler.Active:
+            Profiler.Cancel()
+        elif not Profiler.Start(self.ProfileDone):
+            self.SendMsg('cProfile is not available', 0, 3)
+
+    def ProfileDone(self, Msg):
+        self.SendMsg(Msg, 0, 3)
+        self.SendMsg2(Msg, 3000)
+
+    # --------------
+    # SCRUB BUTTON
+    # --------------
+    def HandleScrub(self, event):
+        if event.data2 > 0:
+            self.Scrub = not self.Scrub
+            self.UpdateLEDs()
+
+    # --------------
+    # JOG SOURCES
+    # --------------
+    def HandleJogSource(self, event):
+        # update jog source
+        self.SliderHoldCount += -1 + (int(event.data2 > 0) * 2)
+        if event.data1 in [0x64, 0x4C]:
+            self.LEDs.Feedback(event)
+        if event.data2 == 0:
+            if self.JogSource == event.data1:
+                self.SetJogSource(0)
+        else:
+            self.SetJogSource(event.data1)
+            if event.data1 ==0x48: #markers
+                ui.showWindow(midi.widPlaylist)
+                ui.setFocused(midi.widPlaylist)
+            event.outEv = 0
+            self.Jog(event)  # for visual feedback
+
+    # ---------------
+    # ARROW BUTTONS
+    # ---------------
+    def HandleArrows(self, event):
+        if self.JogSource == 0x64:
+            if event.data1 == 0x60:
+                transport.globalTransport(
+                    midi.FPT_VZoomJog + int(self.Shift), -1, event.pmeFlags)
+            elif event.data1 == 0x61:
+                transport.globalTransport(
+                    midi.FPT_VZoomJog + int(self.Shift), 1, event.pmeFlags)
+            elif event.data1 == 0x62:
+                transport.globalTransport(
+                    midi.FPT_HZoomJog + int(self.Shift), -1, event.pmeFlags)
+            elif event.data1 == 0x63:
+                transport.globalTransport(
+                    midi.FPT_HZoomJog + int(self.Shift), 1, event.pmeFlags)
+
+        elif self.JogSource == 0:
+            transport.globalTransport(
+                midi.FPT_Up - 0x60 + event.data1, int(event.data2 > 0) * 2, event.pmeFlags)
+        else:
+            if event.data2 > 0:
+                event.inEv = ArrowStepT[event.data1 -
+                                        0x60]
+                event.outEv = event.inEv
+                self.Jog(event)
+
+    #------------
+    # COUNTDOWN:
+    #------------
+    def HandleCountDown(self, event):
+        if event.data2 == 0:
+            transport.globalTransport(midi.FPT_CountDown, 1)
+            if ui.isPrecountEnabled():
+                self.SendMsg2("Count in enabled for recording")
+            else:
+                self.SendMsg2("Count in disabled for recording")
+
+    #----------------
+    # PATTERN / SONG
+    #----------------
+    def HandlePatternSong(self, event):
+        if event.data2 > 0:
+            transport.globalTransport(midi.FPT_Loop, 1)
+            Looper = transport.getLoopMode()
+            if (Looper == midi.SM_Pat):
+                self.SendMsg2("Pattern Mode")
+            else:
+                self.SendMsg2("Song Mode")
+
+    #-------------------
+    # CONTROL SMOOTHING
+    #-------------------
+    def HandleSmoothing(self, event):
+        if event.data2 > 0:
+            self.SmoothSpeed = int(self.SmoothSpeed == 0) * 469
+            self.UpdateLEDs()
+            self.SendMsg2('Control smoothing ' +
+                          OffOnStr[int(self.SmoothSpeed > 0)])
+
+    # ------------------------------
+    # CUT/COPY/PASTE/INSERT/DELETE
+    # ------------------------------
+    def HandleCutCopy(self, event):
+        transport.globalTransport(midi.FPT_Cut + event.data1 -
+                                  0x36, int(event.data2 > 0) * 2, event.pmeFlags)
+        if event.data2 > 0:
+            self.SendMsg2(
+                CutCopyMsgT[midi.FPT_Cut + event.data1 - 0x36 - 50])
+
+    # -------------------
+    # TOGGLE UNDO / REDO
+    # -------------------
+    def HandleUndo(self, event):
+        if (transport.globalTransport(midi.FPT_Undo, int(event.data2 > 0) * 2, event.pmeFlags) == midi.GT_Global) & (event.data2 > 0):
+            self.OnSendTempMsg(
+                ui.getHintMsg() + ' (level ' + general.getUndoLevelHint() + ')')
+
+    # ---------------------------
+    # FREE1 - UNMUTE ALL TRACKS
+    # ---------------------------
+    def HandleFree1(self, event):
+        if event.data2 > 0:
+            if self.Shift:
+                n = self.Armed.DisarmAll()
+                self.SendMsg2("All tracks disarmed (" + str(n) + " changed)")
+            else:
+                n = self.Bulk.UnmuteAll()
+                self.SendMsg2("All tracks unmuted (" + str(n) + " changed)")
+
+    # -----------------------------------------------------------
+    # FREE2 - SELECT FIRST TRACK ON MIXER BANKING (DEFAULT OFF)
+    # -----------------------------------------------------------
+    def HandleFree2(self, event):
+        if event.data2 > 0:
+            if self.MixerScroll:
+                self.MixerScroll = False
+                self.SendMsg2(
+                    "Banking functionality reset to default")
+            else:
+                self.MixerScroll = True
+                self.SendMsg2(
+                    "Banking always selects and shows first track in the bank")
+
+    # -----------------------------------------------
+    # FREE3 - JOG DIAL ALWAYS CONTROLS THE PLAYLIST
+    # -----------------------------------------------
+    def HandleFree3(self, event):
+        if event.data2 > 0:
+            if self.DefaultJogToPlaylist:
+                self.DefaultJogToPlaylist = False
+                self.SendMsg2(
+                    "Jog Dial functionality reset to default")
+            else:
+                self.DefaultJogToPlaylist = True
+                self.SendMsg2(
+                    "Jog Dial always controls the playlist")
+
+    # ----------------------------------------------
+    # FREE4 - DEFAULTING BANKING COLOURS FOR MIXER
+    # ---------------------------------------------
+
+    # Could add more options here?
+    # Would be good to be able to invoke the new colour picker?
+    def HandleFree4(self, event):
+        if event.data2 > 0:
+            #Activate the mixer so we can see what is happening:
+            ui.showWindow(midi.widMixer)
+            ui.setFocused(midi.widMixer)
+            s="Defaulted"
+            if self.Shift:
+                n = self.Palette.Apply(Palette_Default)
+            else:
+                if self.colourOptions == 0:
+                    s="Banking Optimised (with gradient fills)"
+                    self.colourOptions = 1
+                    n = self.Palette.Apply(Palette_Gradient)
+                else:
+                    self.colourOptions = 0
+                    s="Banking Optimised (with solid colours)"
+                    n = self.Palette.Apply(Palette_Solid)
+            self.SendMsg2("Mixer colours:" + s + " (" + str(n) + " changed)")
+
+    # ---------
+    # BROWSER
+    # ---------
+    def HandleBrowser(self, event):
+        ui.showWindow(midi.widBrowser)
+        # ui.setFocused(midi.widBrowser)
+        self.SendMsg2("Browser Window Open")
+
+    # ------
+    # MAIN
+    # ------
+    def HandleMain(self, event):
+        if event.data2 > 0:
+                transport.globalTransport(midi.FPT_F11, 1) # Main song Window
+                self.SendMsg2("Main Window Open")
+                #ui.showWindow(midi.widChannelRack)
+                #ui.setFocused(midi.widChannelRack)
+
+    # ---------------------------
+    # BANK UP / DOWN (8 tracks)
+    # ---------------------------
+    def HandleBank(self, event):  # mixer bank (the whole surface, extenders included)
+        if event.data2 > 0:
+            self.SetFirstTrack(
+                self.FirstTrackT[self.FirstTrack] - self.Units.Width() + int(event.data1 == 0x2F) * 2 * self.Units.Width())
+            if self.MixerScroll:
+                if self.ColT[event.midiChan].TrackNum >= 0:
+                    if mixer.trackNumber() != self.ColT[event.midiChan].TrackNum:
+                        mixer.setTrackNumber(
+                            self.ColT[event.midiChan].TrackNum, midi.curfxScrollToMakeVisible | midi.curfxMinimalLatencyUpdate)
+
+            if (self.CurPluginID != -1):  # Selected Plugin
+                if (event.data1 == 0x2E) & (self.PluginParamOffset >= 8):
+                    self.PluginParamOffset -= 8
+                elif (event.data1 == 0x2F) & (self.PluginParamOffset + 8 < self.Plugins.ParamCount(mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset) - 8):
+                    self.PluginParamOffset += 8
+            else:  # No Selected Plugin
+                if (event.data1 == 0x2E) & (self.CurPluginOffset >= 2):
+                    self.CurPluginOffset -= 2
+                elif (event.data1 == 0x2F) & (self.CurPluginOffset < 2):
+                    self.CurPluginOffset += 2
+
+    # ---------------------------
+    # MOVE UP / DOWN (1 track)
+    # ---------------------------
+    def HandleMove(self, event):
+        if event.data2 > 0:
+            self.SetFirstTrack(
+                self.FirstTrackT[self.FirstTrack] - 1 + int(event.data1 == 0x31) * 2)
+
+    # ---------------------
+    # FLIP FADERS & VPOTS
+    # ---------------------
+    def HandleFlip(self, event):  # self.Flip
+        if event.data2 > 0:
+            self.Flip = not self.Flip
+            self.Units.Mirror(event)
+            self.UpdateColT()
+            self.UpdateLEDs()
+
+    # -----------------
+    # ASSIGNMENT PAGE
+    # -----------------
+    def HandlePageSelect(self, event):  # self.Page
+        self.SliderHoldCount += -1 + (int(event.data2 > 0) * 2)
+        if event.data2 > 0:
+            n = event.data1 - 0x28
+            # print(event.data1)
+            if event.data1 == 0x2B:
+                self.SendMsg2(
+                    'FX for track "'+self.Names.Track(mixer.trackNumber())+self.MackieCU_PageNameT[n])
+            elif event.data1 == 0x2C:
+                self.SendMsg2(
+                    'EQ for track "'+self.Names.Track(mixer.trackNumber())+self.MackieCU_PageNameT[n])
+            elif event.data1 == 42:
+                self.SendMsg2(
+                    'Sends for track "'+self.Names.Track(mixer.trackNumber())+self.MackieCU_PageNameT[n])
+            else:
+                self.SendMsg2(self.MackieCU_PageNameT[n])
+            # the extenders switch page first, so the position SetPage sends them applies to the new page
+            self.Units.Mirror(event)
+            self.SetPage(n)
+
+    # -------------------------------------------------
+    # MIXER SCENES (SHIFT+F1..F8, HOLD TO STORE)
+    # -------------------------------------------------
+    def HandleScene(self, event):
+        n = (event.data1 - 0x36) % SceneCount
+        if event.data2 > 0:
+            self.Scenes.DownT[n] = time.perf_counter()
+        elif self.Scenes.DownT[n] > 0:
+            Held = time.perf_counter() - self.Scenes.DownT[n]
+            self.Scenes.DownT[n] = 0
+            if Held >= SceneHoldTime:
+                c = self.Scenes.Capture(n)
+                self.SendMsg2("Scene " + str(n + 1) + " stored (" + str(c) + " tracks)")
+            else:
+                c = self.Scenes.Recall(n, self.Bulk, self.SmoothSpeed)
+                if c < 0:
+                    self.SendMsg2("Scene " + str(n + 1) + " is empty - hold to store", 1000, TempMsgPrio_Alert)
+                else:
+                    self.SendMsg2("Scene " + str(n + 1) + " recalled (" + str(c) + " changed)")
+
+    # -------
+    # SHIFT
+    # -------
+    def HandleShift(self, event):  # self.Shift
+        self.Shift = event.data2 > 0
+        self.LEDs.Feedback(event)
+
+    # ------
+    # MENU
+    # ------
+    def HandleMenu(self, event):  # menu (was self.Control)
+        #    self.Control = event.data2 > 0
+        #    device.directFeedback(event)
+        self.SendMsg2("Use the arrow & enter keys to navigate the menu")
+        transport.globalTransport(midi.FPT_Menu, int(
+            event.data2 > 0) * 2, event.pmeFlags)
+
+    # --------
+    # EDISON
+    # --------
+    def HandleEdison(self, event):  # open audio editor in current mixer track
+        if event.data2 > 0:
+            ui.launchAudioEditor(False, '', mixer.trackNumber(),
+                                 'AudioLoggerTrack.fst', '')
+            self.SendMsg2('Audio editor ready for track '+self.Names.Track(mixer.trackNumber()))
+
+    # -----------
+    # METRONOME
+    # -----------
+    def HandleMetronome(self, event):  # metronome/button self.Clicking
+        if event.data2 > 0:
+            if self.Shift:
+                self.Clicking = not self.Clicking
+                self.UpdateClicking()
+                self.SendMsg2('Metronome self clicking is ' + OffOnStr[self.Clicking])
+            else:
+                transport.globalTransport(
+                    midi.FPT_Metronome, 1, event.pmeFlags)
+                # if (ui.isMetronomeEnabled):
+                #    self.SendMsg2("Metronome is Enabled")
+                # else:
+                #    self.SendMsg2("Metronome is Disabled")
+
+    # ---------
+    # << & >>
+    # ---------
+    def HandleRewindForward(self, event):
+        if self.Shift:
+            if event.data2 == 0:
+                v2 = 1
+            elif event.data1 == 0x5B:
+                v2 = 0.5
+            else:
+                v2 = 2
+            transport.setPlaybackSpeed(v2)
+        else:
+            transport.globalTransport(midi.FPT_Rewind + int(event.data1 ==
+                                                            0x5C), int(event.data2 > 0) * 2, event.pmeFlags)
+        self.LEDs.Feedback(event)
+
+    # ------
+    # STOP
+    # ------
+    def HandleStop(self, event):
+        transport.globalTransport(midi.FPT_Stop, int(
+            event.data2 > 0) * 2, event.pmeFlags)
+
+    # ------
+    # PLAY
+    # ------
+    def HandlePlay(self, event):
+        transport.globalTransport(midi.FPT_Play, int(
+            event.data2 > 0) * 2, event.pmeFlags)
+
+    # --------
+    # RECORD
+    # --------
+    def HandleRecord(self, event):  # record
+        transport.globalTransport(midi.FPT_Record, int(
+            event.data2 > 0) * 2, event.pmeFlags)
+
+    # ------
+    # SNAP
+    # ------
+    def HandleSnap(self, event):
+        if self.Shift:
+            if event.data2 > 0:
+                transport.globalTransport(
+                    midi.FPT_SnapMode, 1, event.pmeFlags)
+            else:
+                transport.globalTransport(midi.FPT_Snap, int(
+                    event.data2 > 0) * 2, event.pmeFlags)
+
+    # --------
+    # ESCAPE
+    # --------
+    def HandleEscape(self, event):
+        if (self.Shift == False):
+            transport.globalTransport(
+                midi.FPT_Escape + int(self.Shift) * 2, int(event.data2 > 0) * 2, event.pmeFlags)
+
+    # --------
+    # ENTER
+    # --------
+    def HandleEnter(self, event):
+        transport.globalTransport(
+            midi.FPT_Enter + int(self.Shift) * 2, int(event.data2 > 0) * 2, event.pmeFlags)
+
+    # ------------
+    # VPOT PUSH
+    # ------------
+    def HandleFreeKnobPush(self, event):
+        i = event.data1 - 0x20
+        self.ColT[i].KnobHeld = event.data2 > 0
+        if event.data2 > 0:
+            self.Meters.Activity(i, self.ActivityMax)
+            event.data1 = self.ColT[i].BaseEventID + 2
+            event.outEv = 0
+            event.isIncrement = 2
+            self.SendMsg2(
+                'Free knob switch ' + str(event.data1))
+            device.processMIDICC(event)
+        device.hardwareRefreshMixerTrack(
+            self.ColT[i].TrackNum)
+        return True
+
+    def HandleSendsKnobPush(self, event):
+        if event.data2 > 0:
+            n = event.data1 - 0x20
+            if mixer.setRouteTo(mixer.trackNumber(), self.ColT[n].TrackNum, -1) < 0:
+                self.SendMsg2('Cannot send to this track', 1000, TempMsgPrio_Alert)
+            else:
+                if mixer.getRouteSendActive(mixer.trackNumber(), self.ColT[n].TrackNum):
+                    self.SendMsg2("VPOT set for send to " + self.Names.Track(self.ColT[n].TrackNum))
+                else:
+                    self.SendMsg2("The "+self.Names.Track(self.ColT[n].TrackNum)+" VPOT has been reset")
+                mixer.afterRoutingChanged()
+
+    def HandleEQResetAll(self, event):  # "Reset All"
+        if event.data2 > 0:
+            # the same resets as pressing each VPOT (see SetKnobValue), without a hint per knob
+            n = self.Bulk.ResetEvents([(Col.KnobResetEventID, Col.KnobResetValue) for Col in self.ColT[0:8]
+                                       if (Col.KnobEventID >= 0) & (Col.KnobMode < 4)], self.SmoothSpeed)
+            self.SendMsg2("All EQ levels reset (" + str(n) + " changed)")
+
+    def HandleKnobPush(self, event):
+        if event.data2 > 0:
+            n = event.data1 - 0x20
+            self.SetKnobValue(n, midi.MaxInt)
+            if self.Page == MackieCUPage_FX:
+                    self.SendMsg2("\\ Pending Functionality! \\", 1000, TempMsgPrio_Alert)
+
+    # -------------------
+    # FREE HOLD BUTTONS
+    # -------------------
+    def HandleFreeButton(self, event):
+        i = event.data1 % 8
+        self.Meters.Activity(i, self.ActivityMax)
+        event.data1 = self.ColT[i].BaseEventID + \
+            3 + event.data1 // 8
+        event.inEv = event.data2
+        event.outEv = int(event.inEv > 0) * \
+            midi.FromMIDI_Max
+        self.SendMsg2('Free button ' + str(event.data1) +
+                      ': ' + OffOnStr[event.outEv > 0])
+        device.processMIDICC(event)
+        device.hardwareRefreshMixerTrack(self.ColT[i].TrackNum)
+        return True
+
+    # -----------------------------------------------
+    # LINK SELECTED CHANNELS TO CURRENT MIXER TRACK
+    # -----------------------------------------------
+    def HandleLinkChannel(self, event):
+        if event.data2 > 0:
+            if self.Shift:
+                mixer.linkTrackToChannel(
+                    midi.ROUTE_StartingFromThis)
+            else:
+                mixer.linkTrackToChannel(midi.ROUTE_ToThis)
+                self.SendMsg2(
+                    "Chanel Track and Mixer Track now linked")
+
+    # -----------
+    # ITEM MENU
+    # -----------
+    def HandleItemMenu(self, event):
+        transport.globalTransport(midi.FPT_ItemMenu, int(
+            event.data2 > 0) * 2, event.pmeFlags)
+        if event.data2 > 0:
+            self.SendMsg2('Item Menu', 10)
+
+    # -------------------
+    # IN / OUT / SELECT
+    # -------------------
+    def HandlePunch(self, event):
+        #Ensure the playlist is selected:
+        ui.showWindow(midi.widPlaylist)
+        ui.setFocused(midi.widPlaylist)
+        if event.data1 == 0x4F:
+            n = midi.FPT_Punch
+        else:
+            n = midi.FPT_PunchIn + event.data1 - 0x4D
+        if event.data1 >= 0x4E:
+            self.SliderHoldCount += -1 + \
+                (int(event.data2 > 0) * 2)
+        if not ((event.data1 == 0x4D) & (event.data2 == 0)):
+            self.LEDs.Feedback(event)
+        if (event.data1 >= 0x4E) & (event.data2 >= int(event.data1 == 0x4E)):
+            if device.isAssigned():
+                self.LEDs.Set(0x4D, midi.TranzPort_OffOnT[False])
+        if transport.globalTransport(n, int(event.data2 > 0) * 2, event.pmeFlags) == midi.GT_Global:
+            t = -1
+            if n == midi.FPT_Punch:
+                if event.data2 != 1:
+                    t = int(event.data2 != 2)
+            elif event.data2 > 0:
+                t = int(n == midi.FPT_PunchOut)
+            if t >= 0:
+                self.SendMsg2(ui.getHintMsg())
+
+    # -----------
+    # ADD MARKER
+    # -----------
+    def HandleAddMarker(self, event):
+        if (transport.globalTransport(midi.FPT_AddMarker + int(self.Shift), int(event.data2 > 0) * 2, event.pmeFlags) == midi.GT_Global) & (event.data2 > 0):
+            self.SendMsg2(ui.getHintMsg())
+
+    # --------
+    # SELECT
+    # --------
+    def HandleSelect(self, event):
+        if event.data2 > 0:
+            i = event.data1 - 0x18
+
+            ui.showWindow(midi.widMixer)
+            ui.setFocused(midi.widMixer)
+            self.UpdateLEDs()
+            mixer.setTrackNumber(
+                self.ColT[i].TrackNum, midi.curfxScrollToMakeVisible | midi.curfxMinimalLatencyUpdate)
+
+            if self.Control:  # Link channel to track
+                mixer.linkTrackToChannel(midi.ROUTE_ToThis)
+            # Show Full Trackname on second display:
+            # EXPAND WITH CONTEXT?
+            self.SendMsg2(self.Names.Track(self.ColT[i].TrackNum))
+
+    # ------
+    # SOLO
+    # ------
+    def HandleSolo(self, event):  # solo
+        if event.data2 > 0:
+            i = event.data1 - 0x8
+            self.ColT[i].solomode = midi.fxSoloModeWithDestTracks
+            if self.Shift:
+                Include(self.ColT[i].solomode,
+                        midi.fxSoloModeWithSourceTracks)
+            mixer.soloTrack(self.ColT[i].TrackNum,
+                            midi.fxSoloToggle, self.ColT[i].solomode)
+            mixer.setTrackNumber(
+                self.ColT[i].TrackNum, midi.curfxScrollToMakeVisible)
+
+    # ------
+    # MUTE
+    # ------
+    def HandleMute(self, event):  # mute
+        if event.data2 > 0:
+            mixer.enableTrack(
+                self.ColT[event.data1 - 0x10].TrackNum)
+
+    # -----
+    # ARM
+    # -----
+    def HandleArm(self, event):  # arm
+        if event.data2 > 0:
+            mixer.armTrack(self.ColT[event.data1].TrackNum)
+            self.Armed.Update(self.ColT[event.data1].TrackNum)
+            if mixer.isTrackArmed(self.ColT[event.data1].TrackNum):
+                self.SendMsg2(self.Names.Track(
+                    self.ColT[event.data1].TrackNum) + ' recording to ' + mixer.getTrackRecordingFileName(self.ColT[event.data1].TrackNum), 2500)
+            else:
+                self.SendMsg2(self.Names.Track(
+                    self.ColT[event.data1].TrackNum) + ' unarmed')
+
+    # ------
+    # SAVE
+    # ------
+    def HandleSave(self, event):  # save/save new
+        transport.globalTransport(
+            midi.FPT_Save + int(self.Shift), int(event.data2 > 0) * 2, event.pmeFlags)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  HANDLES KNOB FUNCTIONS                                                                                                   #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def SetKnobValue(self, Num, Value, Res=midi.EKRes):
+        if (self.ColT[Num].KnobEventID >= 0) & (self.ColT[Num].KnobMode < 4):
+            if Value == midi.MaxInt:
+                if self.Page == MackieCUPage_FX:
+                    if self.ColT[Num].KnobPressEventID >= 0:
+                        Value = channels.incEventValue(
+                            self.ColT[Num].KnobPressEventID, 0, midi.EKRes)
+                        channels.processRECEvent(
+                            self.ColT[Num].KnobPressEventID, Value, midi.REC_Controller)
+                        s = self.Names.EventID(
+                            self.ColT[Num].KnobPressEventID, mixer.trackNumber())
+                        self.SendMsg2(s)
+                    self.CurPluginID = Num
+                    self.PluginParamOffset = 0
+                    self.UpdateColT()
+                    self.UpdateLEDs()
+                    self.UpdateTextDisplay()
+                    return
+                else:
+                    mixer.automateEvent(
+                        self.ColT[Num].KnobResetEventID, self.ColT[Num].KnobResetValue, midi.REC_MIDIController, self.SmoothSpeed)
+            else:
+                mixer.automateEvent(
+                    self.ColT[Num].KnobEventID, Value, midi.REC_Controller, self.SmoothSpeed, 1, Res)
+            # hint
+            n = mixer.getAutoSmoothEventValue(self.ColT[Num].KnobEventID)
+            s = mixer.getEventIDValueString(self.ColT[Num].KnobEventID, n)
+            if s != '':
+                s = ': ' + s
+            self.SendMsg2(self.ColT[Num].KnobName + s, 1000, TempMsgPrio_Hint)
+        if Trace.VerboseMask & TraceSub_Mixer:
+            Trace.Rec(TE_SetKnobValue, Num, Value)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  UPDATE BUTTON LEDS                                                                                                       #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def UpdateLEDs(self):
+
+        if device.isAssigned():
+            LEDs = self.LEDs
+            # stop
+            LEDs.Set(0x5D, midi.TranzPort_OffOnT[transport.isPlaying() == midi.PM_Stopped])
+            # loop
+            LoopMode = transport.getLoopMode()
+            LEDs.Set(0x5A, midi.TranzPort_OffOnT[LoopMode == midi.SM_Pat])
+            # record
+            r = transport.isRecording()
+            LEDs.Set(0x5F, midi.TranzPort_OffOnT[r])
+            # SMPTE/BEATS
+            LEDs.Set(0x71, midi.TranzPort_OffOnT[ui.getTimeDispMin()])
+            LEDs.Set(0x72, midi.TranzPort_OffOnT[not ui.getTimeDispMin()])
+            # self.Page
+            for m in range(0,  6):
+                LEDs.Set(0x28 + m, midi.TranzPort_OffOnT[m == self.Page])
+            # changed flag
+            LEDs.Set(0x50, midi.TranzPort_OffOnT[general.getChangedFlag() > 0])
+            # metronome
+            LEDs.Set(0x59, midi.TranzPort_OffOnT[general.getUseMetronome()])
+            # rec precount
+            LEDs.Set(0x58, midi.TranzPort_OffOnT[general.getPrecount()])
+            # self.Scrub
+            LEDs.Set(0x65, midi.TranzPort_OffOnT[self.Scrub])
+            # use RUDE SOLO to show if any track is armed for recording
+            b = 0
+            if self.Armed.Any():
+                b = 1 + int(r)
+            LEDs.Set(0x73, midi.TranzPort_OffOnBlinkT[b])
+            # smoothing
+            LEDs.Set(0x33, midi.TranzPort_OffOnT[self.SmoothSpeed > 0])
+            # self.Flip
+            LEDs.Set(0x32, midi.TranzPort_OffOnT[self.Flip])
+            # focused windows
+            LEDs.Set(0x45, midi.TranzPort_OffOnT[ui.getFocused(midi.widBrowser)])
+            LEDs.Set(0x3E, midi.TranzPort_OffOnT[ui.getFocused(midi.widPlaylist)])
+            BusLed = ui.getFocused(midi.widMixer) & (
+                self.ColT[0].TrackNum >= 100)
+            OutputLed = ui.getFocused(midi.widMixer) & (
+                self.ColT[0].TrackNum >= 0) & (self.ColT[0].TrackNum <= 1)
+            InputLed = ui.getFocused(midi.widMixer) & (
+                not OutputLed) & (not BusLed)
+            LEDs.Set(0x3F, midi.TranzPort_OffOnT[InputLed])
+            LEDs.Set(0x41, midi.TranzPort_OffOnT[ui.getFocused(midi.widChannelRack)])
+            LEDs.Set(0x43, midi.TranzPort_OffOnT[BusLed])
+            LEDs.Set(0x44, midi.TranzPort_OffOnT[OutputLed])
+
+            # LEDs.Set(0x4B, midi.TranzPort_OffOnT[ui.getFocused(midi.widChannelRack)])
+        if Trace.VerboseMask & TraceSub_LEDs:
+            Trace.Rec(TE_UpdateLEDs)
+
+
+
+# -------------------------------------------------------------------------------------------------------------------------------
+# PROCEDURES
+# -------------------------------------------------------------------------------------------------------------------------------
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    # TRACK SELECTION                                                                                                           #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def TrackSel(self, Index, Step):
+        Index = 2 - Index
+        device.baseTrackSelect(Index, Step)
+        if Index == 0:
+            # print(channels.channelNumber)
+            s = channels.getChannelName(channels.channelNumber())
+            self.SendMsg2('Selected Channel: ' + s)
+        elif Index == 1:
+            self.SendMsg2('Selected Mixer track: ' +
+                          self.Names.Track(mixer.trackNumber()))
+        elif Index == 2:
+            #if self.Shift:
+            #    #open the piano roll:
+            #    ui.hideWindow(midi.widPlaylist)
+            #    ui.showWindow(midi.widPianoRoll)
+            #    ui.setFocused(midi.widPianoRoll)
+            #else:
+            s = patterns.getPatternName(patterns.patternNumber())
+            self.SendMsg2('Selected Pattern: ' + s)
+            if transport.getLoopMode()==1:   
+            # Ensure that we are in Pattern Mode:
+                transport.globalTransport(midi.FPT_Loop,2) 
+                patterns.selectPattern(patterns.patternNumber()) 
+
+        if Trace.Mask & TraceSub_Jog:
+            Trace.Rec(TE_TrackSel, Index, Step)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    # PRINCIPAL JOG DIAL OPERATIONS                                                                                             #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def Jog(self, event):
+        if self.JogSource == 0:
+            transport.globalTransport(
+                midi.FPT_Jog + int(self.Shift ^ self.Scrub), event.outEv, event.pmeFlags)  # relocate
+        elif self.JogSource == 0x46:
+            transport.globalTransport(
+                midi.FPT_MoveJog, event.outEv, event.pmeFlags)
+            self.SendMsg2(
+                "Hold using JogDial to move selected item in playlist", 1000, TempMsgPrio_Hint)
+        elif self.JogSource == 0x48:
+            if self.Shift:
+                s = 'Marker selection'
+            else:
+                ui.showWindow(midi.widPlaylist)
+                ui.setFocused(midi.widPlaylist)
+                s = 'Hold MARK while using Jog Dial to navigate markers'
+            if event.outEv != 0:
+                if transport.globalTransport(midi.FPT_MarkerJumpJog + int(self.Shift), event.outEv, event.pmeFlags) == midi.GT_Global:
+                    s = ui.getHintMsg()
+            self.SendMsg2(s)
+
+        elif self.JogSource == 0x3D:
+            if event.outEv == 0:
+                s = 'Undo history'
+            elif transport.globalTransport(midi.FPT_UndoJog, event.outEv, event.pmeFlags) == midi.GT_Global:
+                s = ui.GetHintMsg()
+            self.OnSendTempMsg(
+                self.ArrowsStr + s + ' (level ' + general.getUndoLevelHint() + ')', 500)
+
+        elif self.JogSource == 0x64:
+            if event.outEv != 0:
+                transport.globalTransport(
+                    midi.FPT_HZoomJog + int(self.Shift), event.outEv, event.pmeFlags)
+
+        elif self.JogSource == 0x4C:
+
+            if event.outEv != 0:
+                transport.globalTransport(
+                    midi.FPT_WindowJog, event.outEv, event.pmeFlags)
+            # Application.ProcessMessages
+            s = ui.getFocusedFormCaption()
+            if s != "":
+                self.SendMsg2('Current window: ' + s)
+
+        elif (self.JogSource == 0x3F) & (event.outEv == 0):
+            self.SetFirstTrack(mixer.trackNumber())
+            ui.showWindow(midi.widMixer)
+            ui.setFocused(midi.widMixer)
+
+        elif (self.JogSource == 0x3E) | (self.JogSource == 0x3F):
+            self.TrackSel(self.JogSource -
+                          0x3E, event.outEv)
+            if self.JogSource == 0x3E:
+                ui.showWindow(midi.widPlaylist)
+                ui.setFocused(midi.widPlaylist)
+            elif self.JogSource == 0x3F:
+                ui.showWindow(midi.widMixer)
+                ui.setFocused(midi.widMixer)
+
+        #elif self.JogSource == 0x41:
+        #    ui.showWindow(midi.widChannelRack)
+        #    ui.setFocused(midi.widChannelRack)
+        #    self.TrackSel(2, event.outEv)
+
+        elif (self.JogSource == 0x44):
+            ui.showWindow(midi.widMixer)
+            ui.setFocused(midi.widMixer)
+            self.SetFirstTrack(0 + event.outEv)
+
+        elif (self.JogSource == 0x43):
+            ui.showWindow(midi.widMixer)
+            ui.setFocused(midi.widMixer)
+            x = 125
+            while (x > 0):
+                trackName = self.Names.Track(x)
+                x -= 1
+                if trackName.startswith('Insert '):
+                    break
+            self.SetFirstTrack(x+2)
+
+        elif self.JogSource == 0x4a:
+            ui.showWindow(midi.widBrowser)
+            ui.setFocused(midi.widBrowser)
+            self.SendMsg2("Browser Window")
+
+        elif self.JogSource == 0x41:
+
+            if event.outEv != 0:
+                channels.processRECEvent(midi.REC_Tempo, channels.incEventValue(midi.REC_Tempo, event.outEv, midi.EKRes),
+                                         midi.PME_RECFlagsT[int(event.pmeFlags & midi.PME_LiveInput != 0)] & (not midi.REC_FromMIDI))
+            self.SendMsg2('Tempo: ' +
+                          mixer.getEventIDValueString(midi.REC_Tempo, mixer.getCurrentTempo()))
+
+        #elif self.JogSource in [0x42, 0x43, 0x44, 0x45]:
+        #    # CC
+        #    event.data1 = 390 + self.JogSource - 0x42
+
+        #    if event.outEv != 0:
+        #        event.isIncrement = 1
+        #        s = chr(0x7E + int(event.outEv < 0))
+        #        self.SendMsg2('Free jog ' +
+        #                      str(event.data1) + ': ' + s)
+        #        device.processMIDICC(event)
+        #        return
+        #    else:
+        #        self.SendMsg2('Free jog ' + str(event.data1))
+        self.UpdateLEDs()
+        if Trace.Mask & TraceSub_Jog:
+            Trace.Rec(TE_Jog, self.JogSource, event.outEv)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   SEND A MESSAGE TO THE FIRST DISPLAY                                                                                     #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def SendMsg(self, Msg, Row=0, Display=1):
+        if Display == 1:
+            self.LCD1.Write(0, Msg)
+        elif Display == 2:
+            if not self.Diag.Active:  # the diagnostics page has the second display to itself
+                self.LCD2.Write(LCDRowLen * Row, Msg.ljust(LCDRowLen, ' '))
+        elif Display == 3:
+            ui.setHintMsg(Msg)
+        if Trace.VerboseMask & TraceSub_Display:
+            Trace.Rec(TE_SendMsg, Display, Row)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   SEND A MESSAGE TO THE SECOND DISPLAY (DURATION IN MS, 0 = STAYS UNTIL REPLACED)                                         #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def SendMsg2(self, Msg, Duration=1000, Priority=TempMsgPrio_Info):
+        if Duration <= 0:
+            self.TempMsg.SetBase(Msg)
+            self.TempMsg.Clear()
+        else:
+            self.TempMsg.Add(Msg, Duration, Priority, time.perf_counter())
+        if Trace.Mask & TraceSub_Display:
+            Trace.Rec(TE_SendMsg2, Msg, Duration)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   UPDATE THE TIME DISPLAY                                                                                                 #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def SendTimeMsg(self, Msg):
+        self.Digits.SetTimeStr(Msg)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  Called for short MIDI out messages sent from MIDI Out plugin.                                                            #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def SendAssignmentMsg(self, Msg):
+        self.Digits.SetAssignment(Msg)
+        if Trace.VerboseMask & TraceSub_Display:
+            Trace.Rec(TE_SendAssignmentMsg, Msg)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #   WRITE THE CURRENT TEMPORARY (OR PERSISTENT) MESSAGE TO THE TOP ROW OF THE SECOND DISPLAY                                #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def UpdateTempMsg(self):
+        self.SendMsg('  ' + self.TempMsg.Text()[0:LCDRowLen - 2], 0, 2)
+        self.TempMsg.Dirty = False
+        if Trace.VerboseMask & TraceSub_Display:
+            Trace.Rec(TE_UpdateTempMsg)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  HANDLES PRINCIPAL LOGIC FOR DISPLAYING DATA ON DISPLAYS                                                                  #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def UpdateTextDisplay(self):
+        s1 = ''
+        s2 = ''
+        s3 = '  '
+        ch = "CH"
+        master = 'MASTER '
+        EffectsExist = False
+        if self.Page == MackieCUPage_Free:
+            ch = "FR"
+        elif self.Page == MackieCUPage_FX:
+            ch = "FX"
+        elif self.Page == MackieCUPage_EQ:
+            ch = "EQ"
+        for m in range(0, len(self.ColT) - 1):
+            s = ''
+            sa = ''
+            sa2 = ''
+            if self.Page == MackieCUPage_Free:
+                s = '  ' + utils.Zeros(self.ColT[m].TrackNum + 1, 2, ' ')
+                ch = "FR"
+                master = "FR08   "
+            elif self.Page == MackieCUPage_FX and self.CurPluginID == -1:
+                ch = "FX"
+                master = "FX08   "
+                Plugin = self.Plugins.Get(mixer.trackNumber(), m + self.CurPluginOffset)
+                if Plugin.Valid:
+                    EffectsExist = True
+                    s, sa = self.Abbrev.Get(Plugin.Name)
+                else:
+                    s = "   \\   "  # invalid
+                    sa = "   \\   "
+                if self.ColT[m].TrackNum > 99:
+                    sa2 = ch[1]+str(self.ColT[m].TrackNum).zfill(2)+'  '
+                else:
+                    sa2 = 'ch'+str(self.ColT[m].TrackNum).zfill(2)+'  '
+            elif self.Page == MackieCUPage_FX and self.CurPluginID > -1:  # plugin params
+                s, sa = self.Abbrev.Get(self.ColT[m].TrackName)
+            else:
+                if self.ShowTrackNumbers:
+                    s = self.Names.Track(self.ColT[m].TrackNum, 6)
+                    sa = '   '+str(self.ColT[m].TrackNum)+' '
+                else:
+                    s, sa = self.Abbrev.Get(self.Names.Track(self.ColT[m].TrackNum, 12))
+
+            if self.ColT[m].TrackNum > 99:
+                sa2 = ch[1]+str(self.ColT[m].TrackNum).zfill(2)+'  '
+            else:
+                sa2 = ch+str(self.ColT[m].TrackNum).zfill(2)+'  '
+            for n in range(1, 7 - len(s) + 1):
+                s = s + ' '
+            for n in range(1, 7 - len(sa) + 1):
+                sa = sa + ' '
+            s1 = s1 + s
+            s2 = s2 + sa
+            s3 = s3 + sa2
+            if self.Page == MackieCUPage_Free:
+                if self.FreeText == 0:
+                    # Good for all (most) Roland Zenology Instruments
+                    self.TempMsg.SetBase("(Zenology Instruments)")
+                    s2 = "Cutoff  Reso   Attack Release Vibrato Decay Sust  Level"
+                elif self.FreeText == 1:
+                    self.TempMsg.SetBase("(Common Synth Parameters)")
+                    s2 = "Cutoff  Reso   Attack  Decay  Sustain Release Vib Level"  
+                elif self.FreeText == 2:
+                    self.TempMsg.SetBase("(Generic Parameters)")
+                    s2 = "Param1 Param2 Param3 Param4 Param5 Param6 Param7 Param8"  
+                else:
+                    self.TempMsg.SetBase("Blank")
+                    s2 = "                                                       "  # Or maybe just blank?
+            if self.Page == MackieCUPage_EQ:
+                s1 = "  Low    Med    High   Low    Med   High           Reset"
+                s2 = "  Freq   Freq   Freq   Width  Width Width           All "
+        if self.Page != MackieCUPage_Free:
+            self.TempMsg.SetBase(self.Names.Track(mixer.trackNumber()))
+        self.SendMsg(s1+s2)
+        if (self.ColT[m].TrackNum < 9):
+            self.SendMsg(s3[0:105] + master, 1, 2)
+        else:
+            self.SendMsg(
+                s3[0:105] + 'BNK'+str(math.ceil(self.ColT[m].TrackNum/8)-1).zfill(2), 1, 2)
+        if Trace.VerboseMask & TraceSub_Display:
+            Trace.Rec(TE_UpdateTextDisplay, self.Page)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  HANDLES UPDATING OF CHANNEL STRIPS FOR ASSIGNMENT SENDS, FX AND FREE                                                     #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def UpdateMixer_Sel(self):
+
+        if self.Page != MackieCUPage_Free:
+            if device.isAssigned():
+                for m in range(0, len(self.ColT) - 1):
+                    self.LEDs.Set(0x18 + m, midi.TranzPort_OffOnT[self.ColT[m].TrackNum == mixer.trackNumber()])
+
+            # the selected track's full name stays on the second display between temporary messages
+            self.TempMsg.SetBase(self.Names.Track(mixer.trackNumber()))
+
+            if self.Page in [MackieCUPage_Sends, MackieCUPage_FX]:
+                self.UpdateColT()
+        if Trace.VerboseMask & TraceSub_LEDs:
+            Trace.Rec(TE_UpdateMixer_Sel)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  PRINCIPAL FUNCTION RESPONSIBLE FOR UPDATINGCOLUMNS                                                                       #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def UpdateCol(self, Num):
+
+        data1 = 0
+        data2 = 0
+        baseID = 0
+        center = 0
+        b = False
+
+        if device.isAssigned():
+            if self.Page == MackieCUPage_Free:
+                baseID = midi.EncodeRemoteControlID(
+                    device.getPortNumber(), 0, self.ColT[Num].BaseEventID)
+                # slider
+                self.Faders.Send(Num, self.FaderPos(Num))
+                if Num < 8:
+                    # ring
+                    d = mixer.remoteFindEventValue(
+                        baseID + int(self.ColT[Num].KnobHeld))
+                    if d >= 0:
+                        m = 1 + round(d * 10)
+                    else:
+                        m = int(self.ColT[Num].KnobHeld) * (11 + (2 << 4))
+                    Output.NewMsg(OutPrio_Ring, Num, Codec.RingT[Num][m], self.ColT[Num].LastValueIndex)
+                    # buttons
+                    for n in range(0, 4):
+                        d = mixer.remoteFindEventValue(baseID + 3 + n)
+                        if d >= 0:
+                            b = d >= 0.5
+                        else:
+                            b = False
+
+                        self.LEDs.Set(n * 8 + Num, midi.TranzPort_OffOnT[b])
+            else:
+                sv = mixer.getEventValue(self.ColT[Num].SliderEventID)
+
+                if Num < 8:
+                    # V-Pot
+                    center = self.ColT[Num].KnobCenter
+                    if self.ColT[Num].KnobEventID >= 0:
+                        m = mixer.getEventValue(
+                            self.ColT[Num].KnobEventID, midi.MaxInt, False)
+                        if center < 0:
+                            if self.ColT[Num].KnobResetEventID == self.ColT[Num].KnobEventID:
+                                center = int(
+                                    m != self.ColT[Num].KnobResetValue)
+                            else:
+                                center = int(
+                                    sv != self.ColT[Num].KnobResetValue)
+
+                        if self.ColT[Num].KnobMode < 2:
+                            data1 = 1 + round(m * (10 / midi.FromMIDI_Max))
+                        else:
+                            data1 = round(m * (11 / midi.FromMIDI_Max))
+                        if self.ColT[Num].KnobMode > 3:
+                            data1 = (center << 6)
+                        else:
+                            data1 = data1 + \
+                                (self.ColT[Num].KnobMode << 4) + (center << 6)
+                    else:
+                        data1 = 0
+
+                        if self.Page == MackieCUPage_FX:
+                            # Plugin Parameter Value
+                            paramValue = plugins.getParamValue(int(
+                                Num + self.PluginParamOffset), mixer.trackNumber(), int(self.CurPluginID + self.CurPluginOffset))
+                            data1 = int(paramValue)
+                            self.SendMsg2("To Do \\:-) ")
+                            # TODO fix when getParamValue starts working
+
+                    Output.NewMsg(OutPrio_Ring, Num, Codec.RingT[Num][data1], self.ColT[Num].LastValueIndex)
+
+                    # arm, solo, mute
+                    self.LEDs.Set(0x00 + Num, midi.TranzPort_OffOnBlinkT[int(mixer.isTrackArmed(
+                        self.ColT[Num].TrackNum)) * (1 + int(transport.isRecording()))])
+                    self.LEDs.Set(0x08 + Num, midi.TranzPort_OffOnT[mixer.isTrackSolo(
+                        self.ColT[Num].TrackNum)])
+                    self.LEDs.Set(0x10 + Num, midi.TranzPort_OffOnT[not mixer.isTrackEnabled(
+                        self.ColT[Num].TrackNum)])
+
+                # slider
+                self.Faders.Send(Num, self.AlphaTrack_LevelToSlider(sv))
+
+            Dirty = False
+        if Trace.VerboseMask & TraceSub_Mixer:
+            Trace.Rec(TE_UpdateCol, Num, self.ColT[Num].TrackNum, self.ColT[Num].KnobMode)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  PRINCIPAL PROCEDURE FOR HANDLING INTERNAL COLUMN LIST                                                                    #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def UpdateColT(self):
+        Start = time.perf_counter()
+        f = self.FirstTrackT[self.FirstTrack] + self.Units.Offset(-1)
+        CurID = mixer.getTrackPluginId(mixer.trackNumber(), 0)
+        if self.Page in [MackieCUPage_Sends, MackieCUPage_FX, MackieCUPage_EQ]:
+            SelTrack = mixer.trackNumber()
+        else:
+            SelTrack = -1
+        # FX & EQ columns map to plugin slots / EQ bands by position rather than by track
+        Positional = self.Page in [MackieCUPage_FX, MackieCUPage_EQ]
+        TrackCount = mixer.trackCount()
+        # what each column should show; a column is only rebuilt when its key changes (or its track was flagged dirty)
+        KeyT = [None for m in range(0, len(self.ColT))]
+        for m in range(0, len(self.ColT)):
+            if self.Page == MackieCUPage_Free:
+                if m == 8:
+                    TrackNum = MackieCU_nFreeTracks
+                else:
+                    TrackNum = (f + m) % MackieCU_nFreeTracks
+            elif m == 8:
+                TrackNum = -2
+            else:
+                TrackNum = midi.TrackNum_Master + ((f + m) % TrackCount)
+            KeyT[m] = (self.Page, TrackNum, self.Flip, SelTrack, self.CurPluginID, self.CurPluginOffset, self.PluginParamOffset,
+                       m if Positional else -1)
+        # columns that are still shown (e.g. after a bank move) move to their new strip instead of being rebuilt
+        OldT = {}
+        for Col in self.ColT:
+            if Col.Key in KeyT:
+                OldT[Col.Key] = Col
+        SpareT = [Col for Col in self.ColT if OldT.get(Col.Key) is not Col]
+        NewT = [None for m in range(0, len(self.ColT))]
+        HeldT = [Col.KnobHeld for Col in self.ColT]  # belongs to the physical knob, not to the column
+        for m in range(0, len(self.ColT)):
+            NewT[m] = OldT.pop(KeyT[m], None)
+            if NewT[m] is None:
+                NewT[m] = SpareT.pop()
+        for m in range(0, len(self.ColT)):
+            NewT[m].KnobHeld = HeldT[m]
+        MovedT = [NewT[m] is not self.ColT[m] for m in range(0, len(self.ColT))]
+        self.ColT[:] = NewT
+
+        for m in range(0, len(self.ColT)):
+            if self.ColT[m].Key == KeyT[m]:
+                if MovedT[m]:
+                    self.ColT[m].LastValueIndex = 48 + m * 6
+                    self.Meters.Reset(m)
+                    self.UpdateCol(m)
+                continue
+            self.ColT[m].Key = KeyT[m]
+            self.ColT[m].TrackNum = KeyT[m][1]
+
+            if self.Page == MackieCUPage_Free:
+                # free controls
+                self.ColT[m].KnobName = 'Knob ' + \
+                    str(self.ColT[m].TrackNum + 1)
+                self.ColT[m].SliderName = 'Slider ' + \
+                    str(self.ColT[m].TrackNum + 1)
+
+                self.ColT[m].BaseEventID = self.FreeEventID + \
+                    self.ColT[m].TrackNum * 8  # first virtual CC
+            else:
+                self.ColT[m].KnobPressEventID = -1
+                ch = 'CH'+str(self.ColT[m].TrackNum).zfill(2) + ' - '
+
+                # mixer
+                if m == 8:
+                    self.ColT[m].BaseEventID = midi.REC_MainVol
+                    self.ColT[m].SliderEventID = self.ColT[m].BaseEventID
+                    self.ColT[m].SliderName = 'Master Volume'
+                else:
+                    self.ColT[m].BaseEventID = mixer.getTrackPluginId(
+                        self.ColT[m].TrackNum, 0)
+                    self.ColT[m].SliderEventID = self.ColT[m].BaseEventID + \
+                        midi.REC_Mixer_Vol
+                    s = ch+self.Names.Track(self.ColT[m].TrackNum)
+                    self.ColT[m].SliderName = s + ' - Volume'
+
+                    self.ColT[m].KnobEventID = -1
+                    self.ColT[m].KnobResetEventID = -1
+                    self.ColT[m].KnobResetValue = midi.FromMIDI_Max >> 1
+                    self.ColT[m].KnobName = ''
+                    self.ColT[m].KnobMode = 1  # parameter, pan, volume, off
+                    self.ColT[m].KnobCenter = -1
+
+                    self.ColT[m].TrackName = ''
+
+                    if self.Page == MackieCUPage_Pan:
+                        self.ColT[m].KnobEventID = self.ColT[m].BaseEventID + \
+                            midi.REC_Mixer_Pan
+                        self.ColT[m].KnobResetEventID = self.ColT[m].KnobEventID
+                        self.ColT[m].KnobName = self.Names.Track(
+                            self.ColT[m].TrackNum) + ' - ' + 'Panning'
+                    elif self.Page == MackieCUPage_Stereo:
+                        self.ColT[m].KnobEventID = self.ColT[m].BaseEventID + \
+                            midi.REC_Mixer_SS
+                        self.ColT[m].KnobResetEventID = self.ColT[m].KnobEventID
+                        self.ColT[m].KnobName = self.Names.Track(
+                            self.ColT[m].TrackNum) + ' - ' + 'Separation'
+                    elif self.Page == MackieCUPage_Sends:
+                        self.ColT[m].KnobEventID = CurID + \
+                            midi.REC_Mixer_Send_First + self.ColT[m].TrackNum
+                        s = self.Names.EventID(self.ColT[m].KnobEventID, SelTrack, self.ColT[m].TrackNum)
+                        self.ColT[m].KnobName = s
+                        self.ColT[m].KnobResetValue = round(
+                            12800 * midi.FromMIDI_Max / 16000)
+                        self.ColT[m].KnobCenter = mixer.getRouteSendActive(
+                            mixer.trackNumber(), self.ColT[m].TrackNum)
+                        if self.ColT[m].KnobCenter == 0:
+                            self.ColT[m].KnobMode = 4
+                        else:
+                            self.ColT[m].KnobMode = 2
+                    elif self.Page == MackieCUPage_FX:
+                        if self.CurPluginID == -1:  # Plugin not selected
+                            self.ColT[m].CurID = mixer.getTrackPluginId(
+                                mixer.trackNumber(), m + self.CurPluginOffset)
+                            self.ColT[m].KnobEventID = self.ColT[m].CurID + \
+                                midi.REC_Plug_MixLevel
+                            s = self.Names.EventID(self.ColT[m].KnobEventID, SelTrack)
+                            self.ColT[m].KnobName = s
+                            self.ColT[m].KnobResetValue = midi.FromMIDI_Max
+
+                            Plugin = self.Plugins.Get(SelTrack, m + self.CurPluginOffset)
+                            IsValid = Plugin.Valid
+                            IsEnabledAuto = mixer.isTrackAutomationEnabled(
+                                mixer.trackNumber(), m + self.CurPluginOffset)
+                            if IsValid:
+                                self.ColT[m].KnobMode = 2
+                                #self.ColT[m].KnobEventID = self.ColT[m].CurID + midi.REC_Plug
+                                #self.ColT[m].KnobPressEventID = self.ColT[m].CurID + midi.REC_Plug_Mute
+
+                                self.ColT[m].TrackName = Plugin.Name
+                            else:
+                                self.ColT[m].KnobMode = 4
+                            self.ColT[m].KnobCenter = int(IsValid & IsEnabledAuto)
+                        else:  # Plugin selected
+                            self.ColT[m].CurID = mixer.getTrackPluginId(
+                                mixer.trackNumber(), m + self.CurPluginOffset)
+                            if m + self.PluginParamOffset < self.Plugins.ParamCount(SelTrack, self.CurPluginID + self.CurPluginOffset):
+                                self.ColT[m].TrackName = self.Plugins.ParamName(m + self.PluginParamOffset, SelTrack, self.CurPluginID + self.CurPluginOffset)
+                                #print("plugin Param:"+self.ColT[m].TrackName)
+                                #print("plugin value:"+str(plugins.getParamValue(m + self.PluginParamOffset, mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset)))
+                                #print(plugins.getParamValue(m + self.PluginParamOffset, mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset))
+                                #plugins.setParamValue(0,m + self.PluginParamOffset, mixer.trackNumber(), self.CurPluginID + self.CurPluginOffset)
+                            self.ColT[m].KnobMode = 2
+                            self.ColT[m].KnobEventID = -1
+
+                    elif self.Page == MackieCUPage_EQ:
+                        if m < 3:
+                            # gain & freq
+                            self.ColT[m].SliderEventID = CurID + \
+                                midi.REC_Mixer_EQ_Gain + m
+                            self.ColT[m].KnobResetEventID = self.ColT[m].SliderEventID
+                            s = self.Names.EventID(
+                                self.ColT[m].SliderEventID, SelTrack)
+                            self.ColT[m].SliderName = s
+                            self.ColT[m].KnobEventID = CurID + \
+                                midi.REC_Mixer_EQ_Freq + m
+                            s = self.Names.EventID(self.ColT[m].KnobEventID, SelTrack)
+                            self.ColT[m].KnobName = s
+                            self.ColT[m].KnobResetValue = midi.FromMIDI_Max >> 1
+                            self.ColT[m].KnobCenter = -2
+                            self.ColT[m].KnobMode = 0
+                        else:
+                            if m < 6:
+                                # Q
+                                self.ColT[m].SliderEventID = CurID + \
+                                    midi.REC_Mixer_EQ_Q + m - 3
+                                self.ColT[m].KnobResetEventID = self.ColT[m].SliderEventID
+                                s = self.Names.EventID(
+                                    self.ColT[m].SliderEventID, SelTrack)
+                                self.ColT[m].SliderName = s
+                                self.ColT[m].KnobEventID = self.ColT[m].SliderEventID
+                                self.ColT[m].KnobName = self.ColT[m].SliderName
+                                self.ColT[m].KnobResetValue = 17500
+                                self.ColT[m].KnobCenter = -1
+                                self.ColT[m].KnobMode = 2
+                            else:
+                                self.ColT[m].SliderEventID = -1
+                                self.ColT[m].KnobEventID = -1
+                                self.ColT[m].KnobMode = 4
+
+                    # self.Flip knob & slider
+                    if self.Flip:
+                        self.ColT[m].KnobEventID, self.ColT[m].SliderEventID = utils.SwapInt(
+                            self.ColT[m].KnobEventID, self.ColT[m].SliderEventID)
+                        s = self.ColT[m].SliderName
+                        self.ColT[m].SliderName = self.ColT[m].KnobName
+                        self.ColT[m].KnobName = s
+                        self.ColT[m].KnobMode = 2
+                        if not (self.Page in [MackieCUPage_Sends, MackieCUPage_FX, MackieCUPage_EQ]):
+                            self.ColT[m].KnobCenter = -1
+                            self.ColT[m].KnobResetValue = round(
+                                12800 * midi.FromMIDI_Max / 16000)
+                            self.ColT[m].KnobResetEventID = self.ColT[m].KnobEventID
+
+            self.ColT[m].LastValueIndex = 48 + m * 6
+            self.Meters.Reset(m)
+            self.UpdateCol(m)
+        self.Diag.Time(Diag_ColT, Start)
+        if Trace.VerboseMask & TraceSub_Mixer:
+            Trace.Rec(TE_UpdateColT, self.Page, self.FirstTrackT[self.FirstTrack])
+
+    def SetJogSource(self, Value):
+
+        self.JogSource = Value
+        if Trace.Mask & TraceSub_Jog:
+            Trace.Rec(TE_SetJogSource, Value)
+
+    def OnWaitingForInput(self):
+
+        self.SendTimeMsg('..........')
+        self.Flush()
+        if Trace.Mask & TraceSub_Script:
+            Trace.Rec(TE_OnWaitingForInput)
+
+    def UpdateClicking(self):  # switch self.Clicking for transport buttons
+
+        if device.isAssigned():
+            Output.Sysex(OutPrio_LED, None, Codec.Setting(0x0A, int(self.Clicking)))
+        if Trace.Mask & TraceSub_Script:
+            Trace.Rec(TE_UpdateClicking, self.Clicking)
+    # set backlight timeout (0 should switch off immediately, but doesn't really work well)
+
+    def SetBackLight(self, Minutes):
+        if device.isAssigned():
+            Output.Sysex(OutPrio_LED, None, Codec.Setting(0x0B, Minutes))
+        if Trace.Mask & TraceSub_Script:
+            Trace.Rec(TE_SetBackLight, Minutes)
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  HANDLES THE DISPLAY METERS                                                                                                #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def UpdateMeterMode(self):
+
+        # force vertical (activity) meter mode for free controls self.Page
+        if self.Page == MackieCUPage_Free:
+            self.CurMeterMode = 1
+        else:
+            self.CurMeterMode = self.MeterMode
+
+        if device.isAssigned():
+            # clear peak indicators
+            self.Meters.ClearClips()
+            # disable all meters
+            for m in range(0, 8):
+                Output.Sysex(OutPrio_Meter, None, Codec.MeterModeT[m][0])
+
+        # $D for horizontal, $E for vertical meters
+        self.MeterMax = 0xD + int(self.CurMeterMode == 1)
+        self.ActivityMax = 0xD - int(self.CurMeterMode == 1) * 6
+
+        if device.isAssigned():
+            # device.midiOutSysex(bytes(bytearray([0xd1, 0xD, 0xF7])))
+            # device.midiOutSysex(bytes(bytearray([0xd1, 0xD+16, 0xF7])))
+            # horizontal/vertical meter mode
+            Output.Sysex(OutPrio_Meter, None, Codec.Setting(0x21, int(self.CurMeterMode > 0)))
+
+            # enable all meters
+            if self.CurMeterMode == 2:
+                n = 1
+            else:
+                n = 1 + 2
+            for m in range(0, 8):
+                Output.Sysex(OutPrio_Meter, None, Codec.MeterModeT[m][n])
+ 
+        if Trace.Mask & TraceSub_Mixer:
+            Trace.Rec(TE_UpdateMeterMode, self.CurMeterMode)
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  HANDLES ASSIGNMENT SELECTION (AND EXTENDER POSITIONING)                                                                   #
+    #                                                                                                                           #
+    #############################################################################################################################
+
+    def SetPage(self, Value):
+        oldPage = self.Page
+        self.Page = Value
+        self.PageDispatchT = self.DispatchT[self.Page]
+
+        self.FirstTrack = int(self.Page == MackieCUPage_Free)
+        # the columns are refreshed once, below
+        self.Units.Update()
+        self.SetFirstTrack(self.FirstTrackT[self.FirstTrack], False)
+
+        if self.Page == MackieCUPage_Free:
+
+            BaseID = midi.EncodeRemoteControlID(
+                device.getPortNumber(), 0, self.FreeEventID + 7)
+            for n in range(0,  len(self.FreeCtrlT)):
+                d = mixer.remoteFindEventValue(BaseID + n * 8, 1)
+                if d >= 0:
+                    self.FreeCtrlT[n] = min(round(d * 16384), 16384)
+            # Toggle options for  Free Controls Text
+            if self.Shift:
+                if self.FreeText == 0:
+                    self.FreeText = 1
+                elif self.FreeText == 1:
+                    self.FreeText = 2
+                elif self.FreeText == 2:
+                        self.FreeText = -1
+                else:
+                    self.FreeText = 0
+
+        if (oldPage == MackieCUPage_Free) | (self.Page == MackieCUPage_Free):
+            self.UpdateMeterMode()
+
+        self.CurPluginID = -1
+        self.CurPluginOffset = 0
+
+        self.UpdateColT()
+        self.UpdateLEDs()
+        self.UpdateTextDisplay()
+        if Trace.Mask & TraceSub_Mixer:
+            Trace.Rec(TE_SetPage, Value)
+
+    #############################################################################################################################
+    #                                                                                                                           #
+    #  SETS UP THE FIRST TRACK AFTER TRACK RELATED MOVEMENT OPERATIONS ARE CARRIED OUT                                          #
+    #                                                                                                                           #
+    #############################################################################################################################
+    def SetFirstTrack(self, Value, Refresh=True):
+        # Value is the first track of the whole surface (see TMackieUnits)
+        if self.Page == MackieCUPage_Free:
+            Wrap = MackieCU_nFreeTracks
+            self.FirstTrackT[self.FirstTrack] = (Value + Wrap) % Wrap
+            s = utils.Zeros(self.FirstTrackT[self.FirstTrack] + 1, 2, ' ')
+        else:
+            Wrap = mixer.trackCount()
+            self.FirstTrackT[self.FirstTrack] = (Value + Wrap) % Wrap
+            s = utils.Zeros(self.FirstTrackT[self.FirstTrack], 2, ' ')
+        self.Units.Place(self.FirstTrackT[self.FirstTrack], Wrap)
+        if Refresh:
+            self.UpdateColT()
+        self.SendAssignmentMsg(s)
+        if Trace.Mask & TraceSub_Mixer:
+            Trace.Rec(TE_SetFirstTrack, Value)
+
+
+MackieCU = TMackieCU()
+
+
+def OnInit():
+    if CaptureFileName != '':
+        Capture.Start()
+    MackieCU.OnInit()
+
+
+def OnDeInit():
+    Profiler.Stop()
+    MackieCU.OnDeInit()
+    if Capture.Active:
+        Capture.Active = False
+        Capture.Save()
+
+
+def OnDirtyMixerTrack(SetTrackNum):
+    if Capture.Active:
+        Capture.Rec(Cap_DirtyMixerTrack, SetTrackNum)
+    if Profiler.Active:
+        Profiler.Run(MackieCU.OnDirtyMixerTrack, SetTrackNum)
+    else:
+        MackieCU.OnDirtyMixerTrack(SetTrackNum)
+
+
+def OnRefresh(Flags):
+    if Capture.Active:
+        Capture.Rec(Cap_Refresh, Flags)
+    if Profiler.Active:
+        Profiler.Run(MackieCU.OnRefresh, Flags)
+    else:
+        MackieCU.OnRefresh(Flags)
+
+
+def OnMidiMsg(event):
+    if Capture.Active:
+        Capture.Rec(Cap_MidiMsg, event.midiId, event.midiChan, event.data1, event.data2, event.pmeFlags)
+    if Profiler.Active:
+        Profiler.Run(MackieCU.OnMidiMsg, event)
+    else:
+        MackieCU.OnMidiMsg(event)
+
+
+def SendMsg2(Msg, Duration=1000):
+    if Profiler.Active:
+        Profiler.Run(MackieCU.SendMsg2, Msg, Duration)
+    else:
+        MackieCU.SendMsg2(Msg, Duration)
+    MackieCU.Flush()
+
+
+def OnUpdateBeatIndicator(Value):
+    if Capture.Active:
+        Capture.Rec(Cap_BeatIndicator, Value)
+    if Profiler.Active:
+        Profiler.Run(MackieCU.OnUpdateBeatIndicator, Value)
+    else:
+        MackieCU.OnUpdateBeatIndicator(Value)
+
+
+def OnUpdateMeters():
+    if Capture.Active:
+        Capture.Rec(Cap_UpdateMeters)
+    if Profiler.Active:
+        Profiler.Run(MackieCU.OnUpdateMeters)
+    else:
+        MackieCU.OnUpdateMeters()
+
+
+def OnIdle():
+    if Capture.Active:
+        Capture.Rec(Cap_Idle)
+    if Profiler.Active:
+        Profiler.Run(MackieCU.OnIdle)
+    else:
+        MackieCU.OnIdle()
+
+
+def OnWaitingForInput():
+    if Profiler.Active:
+        Profiler.Run(MackieCU.OnWaitingForInput)
+    else:
+        MackieCU.OnWaitingForInput()
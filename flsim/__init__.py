@@ -0,0 +1,100 @@
+"""Headless stand-in for the FL Studio MIDI scripting API.
+
+flsim lets device_QCONProX.py run on a plain Python install: the modules in
+flsim/fl replace FL Studio's device, mixer, plugins, transport, ui, ... and
+every outgoing MIDI/sysex message is recorded in flsim.model.Sim.Output.
+
+    import flsim
+    script = flsim.LoadScript()
+    script.OnInit()
+    script.OnMidiMsg(flsim.Note(0x5E, 0x7F))
+
+TSimProfiler calls the script's callbacks and keeps, per callback name, how
+long they took and how many bytes they sent.
+"""
+
+import importlib.util
+import os
+import sys
+
+import time
+
+FLPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fl')
+ScriptPath = os.path.normpath(os.path.join(os.path.dirname(FLPath), '..', 'device_QCONProX.py'))
+
+if FLPath not in sys.path:
+    sys.path.insert(0, FLPath)
+
+import midi  # noqa: E402  (the stand-in, found through FLPath)
+from flsim.model import Sim, TSimPlugin, TSimTrack  # noqa: E402
+
+
+class TSimEvent:
+    """Mimics FL Studio's eventData object passed to OnMidiMsg."""
+
+    def __init__(self, Status, Data1, Data2, PMEFlags=midi.PME_System | midi.PME_System_Safe | midi.PME_FromMIDI):
+        self.status = Status
+        self.midiId = Status & 0xF0
+        self.midiChan = Status & 0x0F
+        self.midiChanEx = Status & 0x0F
+        self.data1 = Data1
+        self.data2 = Data2
+        self.pmeFlags = PMEFlags
+        self.handled = False
+        self.inEv = 0
+        self.outEv = 0
+        self.isIncrement = 0
+        self.sysex = None
+        self.port = 0
+
+    def __repr__(self):
+        return 'TSimEvent(' + hex(self.status) + ', ' + hex(self.data1) + ', ' + hex(self.data2) + ')'
+
+
+def Note(Data1, Data2=0x7F, Chan=0):
+    return TSimEvent(midi.MIDI_NOTEON + Chan, Data1, Data2)
+
+
+def CC(Data1, Data2, Chan=0):
+    return TSimEvent(midi.MIDI_CONTROLCHANGE + Chan, Data1, Data2)
+
+
+def PitchBend(Chan, Value):
+    return TSimEvent(midi.MIDI_PITCHBEND + Chan, Value & 0x7F, (Value >> 7) & 0x7F)
+
+
+def LoadScript(Path=ScriptPath, Name='device_QCONProX'):
+    """Import (or re-import) the script module against the stand-ins."""
+    Spec = importlib.util.spec_from_file_location(Name, os.path.abspath(Path))
+    Module = importlib.util.module_from_spec(Spec)
+    sys.modules[Name] = Module
+    Spec.loader.exec_module(Module)
+    return Module
+
+
+class TSimProfiler:
+    """Drives a loaded script and records callback latency and output volume."""
+
+    def __init__(self, Script):
+        self.Script = Script
+        self.StatT = {}  # callback name -> [calls, total seconds, worst seconds, messages, bytes]
+
+    def Call(self, Name, *Args):
+        Before = len(Sim.Output)
+        Start = time.perf_counter()
+        Result = getattr(self.Script, Name)(*Args)
+        Elapsed = time.perf_counter() - Start
+        Sent = Sim.Output[Before:]
+        Stat = self.StatT.setdefault(Name, [0, 0.0, 0.0, 0, 0])
+        Stat[0] += 1
+        Stat[1] += Elapsed
+        Stat[2] = max(Stat[2], Elapsed)
+        Stat[3] += len(Sent)
+        Stat[4] += sum(o.Size() for o in Sent)
+        return Result
+
+    def Report(self):
+        Lines = ['{:<20} {:>7} {:>10} {:>10} {:>8} {:>9}'.format('callback', 'calls', 'avg ms', 'worst ms', 'msgs', 'bytes')]
+        for Name, (Calls, Total, Worst, Msgs, Bytes) in sorted(self.StatT.items()):
+            Lines.append('{:<20} {:>7} {:>10.3f} {:>10.3f} {:>8} {:>9}'.format(Name, Calls, Total * 1000 / Calls, Worst * 1000, Msgs, Bytes))
+        return '\n'.join(Lines)
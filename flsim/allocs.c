@@ -0,0 +1,55 @@
+/* Counts malloc, calloc and realloc calls for python -m flsim.bench allocs.
+
+    cc -shared -fPIC -O2 -o allocs.so flsim/allocs.c -ldl
+    PYTHONMALLOC=malloc LD_PRELOAD=./allocs.so python -m flsim.bench allocs
+
+PYTHONMALLOC=malloc routes the interpreter's small objects through malloc
+too, so every allocation the script makes is counted. */
+
+#define _GNU_SOURCE
+#include <dlfcn.h>
+#include <stddef.h>
+
+static long Count = 0;
+static void *(*RealMalloc)(size_t) = 0;
+static void *(*RealCalloc)(size_t, size_t) = 0;
+static void *(*RealRealloc)(void *, size_t) = 0;
+
+/* dlsym itself calls calloc before RealCalloc is known; serve that from here */
+static char Early[65536];
+static size_t EarlyUsed = 0;
+
+long alloc_count(void) { return Count; }
+
+void *malloc(size_t Size)
+{
+    if (!RealMalloc)
+        RealMalloc = dlsym(RTLD_NEXT, "malloc");
+    Count++;
+    return RealMalloc(Size);
+}
+
+void *calloc(size_t Num, size_t Size)
+{
+    static int Busy = 0;
+    if (!RealCalloc) {
+        if (Busy) {
+            void *p = Early + EarlyUsed;
+            EarlyUsed += (Num * Size + 15) & ~(size_t)15;
+            return p;
+        }
+        Busy = 1;
+        RealCalloc = dlsym(RTLD_NEXT, "calloc");
+        Busy = 0;
+    }
+    Count++;
+    return RealCalloc(Num, Size);
+}
+
+void *realloc(void *p, size_t Size)
+{
+    if (!RealRealloc)
+        RealRealloc = dlsym(RTLD_NEXT, "realloc");
+    Count++;
+    return RealRealloc(p, Size);
+}
@@ -0,0 +1,241 @@
+"""Benchmarks behind the before / after numbers in the history, run against the stand-ins.
+
+    python -m flsim.bench [NAME ...] [--script PATH]
+
+To compare with an earlier version of the script:
+
+    git show <commit>:device_QCONProX.py > /tmp/old.py
+    python -m flsim.bench dispatch --script /tmp/old.py
+
+Timings depend on the machine, so compare runs made on the same one. Each
+timing is the best of Runs runs, which keeps other load on the machine out
+of it.
+"""
+
+import argparse
+import contextlib
+import ctypes
+import io
+import sys
+import time
+
+import flsim
+import midi
+from flsim import CC, Note, PitchBend, Sim
+
+Runs = 5
+
+
+def Load(Path):
+    Sim.Reset()
+    with contextlib.redirect_stdout(io.StringIO()):
+        Script = flsim.LoadScript(Path)
+        if hasattr(Script, 'debug'):
+            Script.debug = False  # early versions print every event unless this is off
+        Script.OnInit()
+    Sim.TakeOutput()
+    return Script
+
+
+def DispatchEvents():
+    # handlers write to the events they are given, so every run gets new ones
+    EventT = []
+    for i in range(200):
+        EventT += [PitchBend(i % 8, (i * 97) % 16000), CC(0x3C, 1), Note(0x50, 0x7F), Note(0x50, 0),
+                   Note(0x10 + i % 8, 0x7F), Note(0x10 + i % 8, 0), Note(0x5E, 0x7F), Note(0x5E, 0)]
+    return EventT
+
+
+def BenchDispatch(Path):
+    """OnMidiMsg throughput over a mix of fader, jog, SAVE, mute and play events."""
+    Script = Load(Path)
+    Best = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for r in range(Runs):
+            EventT = DispatchEvents()
+            Start = time.perf_counter()
+            for Event in EventT:
+                Script.OnMidiMsg(Event)
+            Elapsed = time.perf_counter() - Start
+            if (Best is None) or (Elapsed < Best):
+                Best = Elapsed
+    return ['{} events/s'.format(round(len(EventT) / Best))]
+
+
+def SweepEvents():
+    # eight faders thrown together, 400 positions each
+    EventT = []
+    for i in range(400):
+        for Chan in range(8):
+            EventT.append(PitchBend(Chan, (i * 41 + Chan * 500) % 16384))
+    return EventT
+
+
+def BenchSweep(Path):
+    """A recorded sweep of eight faders, with an OnIdle every 40 messages."""
+    Best = None
+    for r in range(Runs):
+        Script = Load(Path)
+        EventT = SweepEvents()
+        Sim.Calls.clear()
+        Sim.CountCalls = True
+        MidiTime = 0
+        IdleTime = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for n, Event in enumerate(EventT):
+                Start = time.perf_counter()
+                Script.OnMidiMsg(Event)
+                MidiTime += time.perf_counter() - Start
+                if n % 40 == 39:
+                    Start = time.perf_counter()
+                    Script.OnIdle()
+                    IdleTime += time.perf_counter() - Start
+        Sim.CountCalls = False
+        if (Best is None) or (MidiTime + IdleTime < Best[0] + Best[1]):
+            Best = (MidiTime, IdleTime)
+    MidiTime, IdleTime = Best
+    CallT = Sim.Calls
+    return ['{} messages, OnMidiMsg {:.1f} us/msg, OnIdle {:.0f} us, total {:.1f} ms'.format(
+                len(EventT), MidiTime / len(EventT) * 1e6, IdleTime / (len(EventT) // 40) * 1e6, (MidiTime + IdleTime) * 1e3),
+            '{} automateEvent, {} getEventIDValueString, {} sysex, {} bytes out'.format(
+                CallT.get('mixer.automateEvent', 0), CallT.get('mixer.getEventIDValueString', 0),
+                CallT.get('device.midiOutSysex', 0), Sim.OutputBytes())]
+
+
+# plugin, parameter and track names as they come out of a real project
+NameT = ['Fruity Limiter', 'Fruity Parametric EQ 2', 'Fruity Reeverb 2', 'Fruity Delay 3', 'Fruity Compressor', 'Maximus',
+         'Gross Beat', 'FabFilter Pro-Q 3', 'FabFilter Pro-C 2', 'Valhalla VintageVerb', 'Soundtoys EchoBoy',
+         'iZotope Ozone 9', 'Serum', 'Sytrus', 'Harmor', 'Edison', 'Patcher', 'Transient Processor',
+         'Fruity Stereo Shaper', 'Waves SSL E-Channel', 'ReaEQ', 'TDR Nova', 'OTT', 'Kickstart 2', 'Decapitator',
+         'Vocodex', 'Pitcher', 'NewTone', 'Reverberation', 'Cutoff frequency', 'Resonance', 'Filter envelope amount',
+         'Attack time', 'Release', 'LFO 1 Rate', 'Osc A Wavetable Pos', 'Master', 'Insert 1', 'Kick', 'Snare Top',
+         'Hi Hat', 'Lead Vox', 'Backing Vocals L', 'Bass DI', 'Drum Bus', 'Reverb Send', 'Sub Bass', 'Pad', 'FX Riser',
+         'Piano II', 'Strings v2', 'Synth 1.5']
+
+
+def OldAbbrev(Name):
+    # the split the script used before TMackieAbbrev, kept as the reference point
+    t = Name.split()
+    s = t[0][0:6]
+    sa = ''
+    if len(t) == 3:
+        t[1] = t[1] + t[2]
+    if len(t) >= 2:
+        sa = t[1][0:6].title()
+    elif (len(t) == 1) & (len(t[0]) > 6):
+        sa = t[0][6:]
+        if len(sa) == 1:
+            s = t[0][0:5]
+            sa = t[0][5:]
+    return s, sa
+
+
+def BenchAbbrev(Path):
+    """Time per name for the old split and for TMackieAbbrev: uncached, on a cold memo and memoized."""
+    Script = Load(Path)
+    FuncT = [('old split', lambda: OldAbbrev)]
+    if hasattr(Script, 'TMackieAbbrev'):
+        Abbrev = Script.TMackieAbbrev()
+        # cold: a new memo for every pass, as for names the surface has not shown yet
+        FuncT += [('uncached', lambda: Abbrev.Abbrev), ('cold memo', lambda: Script.TMackieAbbrev().Get),
+                  ('memoized', lambda: Abbrev.Get)]
+    Result = []
+    for Label, Make in FuncT:
+        Best = None
+        for r in range(Runs):
+            Elapsed = 0
+            for p in range(40):
+                Func = Make()
+                Start = time.perf_counter()
+                for Name in NameT:
+                    Func(Name)
+                Elapsed += time.perf_counter() - Start
+            if (Best is None) or (Elapsed < Best):
+                Best = Elapsed
+        Result.append('{:<10} {:.2f} us/name'.format(Label, Best / (40 * len(NameT)) * 1e6))
+    if len(FuncT) > 1:
+        Result.append('memoized: {} hits, {} misses'.format(Abbrev.Hits, Abbrev.Misses))
+    return Result
+
+
+def AllocCounter():
+    # alloc_count() from flsim/allocs.c when it is preloaded, otherwise None
+    try:
+        Func = ctypes.CDLL(None).alloc_count
+    except AttributeError:
+        return None
+    Func.restype = ctypes.c_long
+    return Func
+
+
+def BenchAllocs(Path):
+    """Allocations (with flsim/allocs.c preloaded) and time per call on the hot output paths."""
+    Script = Load(Path)
+    Counter = AllocCounter()
+    MackieCU = Script.MackieCU
+    Output = Script.Output
+
+    def Meters(i):
+        for k in range(10):
+            MackieCU.Meters.Send(k, (i + k) % 14)
+
+    def Digits(i):
+        MackieCU.Digits.SetTimeStr('%010d' % (i * 7919))
+
+    def LCD(i):
+        MackieCU.LCD1.Write(0, ('abcdefg %d ' % i) * 10)
+        MackieCU.LCD1.Flush()
+
+    def Faders(i):
+        for k in range(9):
+            MackieCU.Faders.Send(k, (i * 37 + k * 1000) % 16384)
+
+    def LEDs(i):
+        for k in range(24):
+            MackieCU.LEDs.Set(k, midi.TranzPort_OffOnT[(i + k) & 1])
+
+    def Cols(i):
+        for k in range(8):
+            MackieCU.ColT[k].Dirty = True
+            MackieCU.UpdateCol(k)
+
+    def Mode(i):
+        MackieCU.UpdateMeterMode()
+
+    Result = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for Name, Func, Count in [('meters', Meters, 2000), ('digits', Digits, 2000), ('lcd', LCD, 2000), ('faders', Faders, 2000),
+                                  ('leds', LEDs, 2000), ('cols', Cols, 500), ('mode', Mode, 500)]:
+            Func(0)
+            Output.Clear()
+            Allocs = Counter() if Counter else 0
+            Start = time.perf_counter()
+            for i in range(Count):
+                Func(i)
+                Output.Clear()
+            Elapsed = time.perf_counter() - Start
+            s = '{:<8} {:8.1f} us/op'.format(Name, Elapsed / Count * 1e6)
+            if Counter:
+                s += ' {:8.2f} allocs/op'.format((Counter() - Allocs) / Count)
+            Result.append(s)
+    if not Counter:
+        Result.append('(no allocation counts: build and preload flsim/allocs.c, see its header)')
+    return Result
+
+
+BenchT = {'dispatch': BenchDispatch, 'sweep': BenchSweep, 'abbrev': BenchAbbrev, 'allocs': BenchAllocs}
+
+
+def main(ArgT=None):
+    Parser = argparse.ArgumentParser(prog='python -m flsim.bench', description='Benchmark the script headlessly.')
+    Parser.add_argument('names', nargs='*', help='benchmarks to run (default: all): ' + ', '.join(BenchT))
+    Parser.add_argument('--script', default=flsim.ScriptPath)
+    Args = Parser.parse_args(ArgT)
+    for Name in Args.names or list(BenchT):
+        for Line in BenchT[Name](Args.script):
+            print('{:<10} {}'.format(Name, Line))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Regression checks for device_QCONProX.py, run against the stand-ins.
+
+    python -m flsim.checks
+
+Each Check* function loads a fresh copy of the script and raises
+AssertionError if the behaviour it covers is broken.
+"""
+
+import contextlib
+import io
+import sys
+
+import flsim
+import midi
+from flsim import Note, Sim
+from flsim.model import Out_Dispatch, Out_Sysex
+
+
+def Load(ReceiverCount=0):
+    Sim.Reset()
+    Sim.ReceiverCount = ReceiverCount
+    with contextlib.redirect_stdout(io.StringIO()):
+        Script = flsim.LoadScript()
+        Script.OnInit()
+    return Script
+
+
+def Press(Script, Data1):
+    Script.OnMidiMsg(Note(Data1, 0x7F))
+    Script.OnMidiMsg(Note(Data1, 0))
+
+
+def Sysex(Output):
+    return [o.Msg for o in Output if o.Kind == Out_Sysex]
+
+
+def CheckHintsKeepButtonFeedback():
+    """Values shown while moving a fader or turning a knob do not hide the message of a button just pressed."""
+    Script = Load()
+    MackieCU = Script.MackieCU
+    Press(Script, 0x35)  # time format: button feedback
+    Shown = MackieCU.TempMsg.Text()
+    Script.OnMidiMsg(flsim.PitchBend(0, 5000))
+    Script.OnIdle()
+    Script.OnMidiMsg(flsim.CC(0x10, 1))
+    Script.OnIdle()
+    assert MackieCU.TempMsg.Text() == Shown, 'button feedback replaced by ' + repr(MackieCU.TempMsg.Text())
+
+
+def CheckInitSettings():
+    """OnInit sends the touch sensitivity, clicking & backlight settings, whatever LEDs are queued with them."""
+    Script = Load()
+    Sent = Sysex(Sim.TakeOutput())
+    for Cmd in (0x0C, 0x0A, 0x0B):
+        assert any(m[:6] == bytes([0xF0, 0x00, 0x00, 0x66, 0x14, Cmd]) for m in Sent), 'setting 0x{:02X} not sent'.format(Cmd)
+    assert Script.Output.CoalescedT[Script.OutPrio_LED] == 0
+
+
+def CheckButtonFeedback():
+    """A release goes out after an LED update for the same button still waiting, so the button ends up dark."""
+    Script = Load()
+    Sim.TakeOutput()
+    Output = Script.Output
+    Output.Budget = 0  # nothing drains until the end of the frame
+    Script.MackieCU.LEDs.Set(0x54, midi.TranzPort_OffOnT[1])
+    Script.OnMidiMsg(Note(0x54, 0))  # shift released
+    Output.Drain(True)
+    Sent = [o.Msg for o in Sim.TakeOutput() if (o.Kind != Out_Sysex) and ((o.Msg >> 8) & 0xFF == 0x54)]
+    assert Sent[-1] == midi.MIDI_NOTEON + (0x54 << 8), 'shift left lit: {:06X}'.format(Sent[-1])
+
+
+def CheckCallbacksSendAtOnce():
+    """What a callback queues is on the wire when it returns: the beat LED and the waiting-for-input digits."""
+    Script = Load()
+    Sim.TakeOutput()
+    Script.OnUpdateBeatIndicator(1)
+    Sent = [o.Msg for o in Sim.TakeOutput() if o.Kind != Out_Sysex]
+    assert midi.MIDI_NOTEON + (0x5E << 8) + (0x7F << 16) in Sent, 'beat LED still queued'
+    Script.OnWaitingForInput()
+    Sent = [o.Msg for o in Sim.TakeOutput() if o.Kind != Out_Sysex]
+    assert len([m for m in Sent if m & 0xF0 == midi.MIDI_CONTROLCHANGE]) > 0, 'waiting digits still queued'
+
+
+def CheckFreeFaderFullScale():
+    """A free control at full scale (remoteFindEventValue 1.0) is sent as the top fader position."""
+    Script = Load()
+    Sim.RemoteDefault = 1.0
+    Press(Script, 0x2D)  # free controls page, which reads the free control values
+    Script.OnDirtyMixerTrack(-1)  # and redraw every strip from them
+    Script.OnRefresh(midi.HW_Dirty_Mixer_Display | midi.HW_Dirty_Mixer_Controls)
+    Script.Output.Drain(True)
+    Faders = [o.Msg for o in Sim.TakeOutput() if (o.Kind != Out_Sysex) and (o.Msg & 0xF0 == midi.MIDI_PITCHBEND)]
+    assert midi.MIDI_PITCHBEND + (0x7F << 8) + (0x7F << 16) in Faders, 'no full scale fader position sent'
+
+
+def CheckMirrorSurvivesLEDs():
+    """Page & flip presses reach every extender even while LED updates are waiting in the same class."""
+    Script = Load(ReceiverCount=2)
+    Sim.TakeOutput()
+    Output = Script.Output
+    Output.Budget = 0  # nothing drains until the end of the frame
+    for n in range(0, 128):
+        Script.MackieCU.LEDs.Set(n, midi.TranzPort_OffOnT[1])
+    Press(Script, 0x32)  # flip
+    Press(Script, 0x29)  # stereo page
+    for n in range(0, 128):
+        Script.MackieCU.LEDs.Set(n, midi.TranzPort_OffOnT[0])
+    Output.Drain(True)
+    Sent = [(o.Index, o.Msg) for o in Sim.TakeOutput() if o.Kind == Out_Dispatch]
+    for Receiver in range(0, 2):
+        for Data1 in (0x32, 0x29):
+            assert (Receiver, midi.MIDI_NOTEON + (Data1 << 8) + (0x7F << 16)) in Sent, \
+                'note 0x{:02X} not mirrored to extender {}'.format(Data1, Receiver)
+
+
+CheckT = [CheckHintsKeepButtonFeedback, CheckInitSettings, CheckButtonFeedback, CheckCallbacksSendAtOnce,
+          CheckFreeFaderFullScale, CheckMirrorSurvivesLEDs]
+
+
+def main():
+    Failed = 0
+    for Check in CheckT:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                Check()
+            print('ok     ' + Check.__name__)
+        except Exception as e:
+            Failed += 1
+            print('FAILED ' + Check.__name__ + ': ' + repr(e))
+    return int(Failed > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Stand-in for FL Studio's arrangement module."""
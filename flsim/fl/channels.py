@@ -0,0 +1,37 @@
+"""Stand-in for FL Studio's channels module."""
+
+import midi
+from flsim.model import Sim
+
+
+def channelNumber(CanBeNone=False):
+    return Sim.ChannelNumber
+
+
+def selectedChannel(CanBeNone=False, Offset=0, Indexglobal=0):
+    return Sim.ChannelNumber
+
+
+def getChannelIndex(Index):
+    return Index
+
+
+def getChannelName(Index):
+    return Sim.Channels[Index]
+
+
+def focusEditor(Index):
+    pass
+
+
+def showCSForm(Index, State=1):
+    pass
+
+
+def incEventValue(EventID, Step, Res=midi.EKRes):
+    return Sim.EventValues.get(EventID, 0) + round(Step * Res * midi.FromMIDI_Max)
+
+
+def processRECEvent(EventID, Value, Flags):
+    Sim.EventValues[EventID] = Value
+    return Value
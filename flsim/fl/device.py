@@ -0,0 +1,63 @@
+"""Stand-in for FL Studio's device module; records all output."""
+
+from flsim import model
+from flsim.model import Sim
+
+
+def isAssigned():
+    return Sim.Assigned
+
+
+def getPortNumber():
+    return Sim.PortNumber
+
+
+def setHasMeters():
+    pass
+
+
+def midiOutMsg(Message, *Args):
+    Sim.Call('device.midiOutMsg')
+    Sim.Send(model.Out_Msg, Message & 0xFFFFFF)
+
+
+def midiOutNewMsg(Message, Index):
+    Sim.Call('device.midiOutNewMsg')
+    if Sim.NewMsgT.get(Index) != Message:
+        Sim.NewMsgT[Index] = Message
+        Sim.Send(model.Out_NewMsg, Message & 0xFFFFFF, Index)
+
+
+def midiOutSysex(Message):
+    Sim.Call('device.midiOutSysex')
+    Sim.Send(model.Out_Sysex, bytes(Message))
+
+
+def directFeedback(Event):
+    Sim.Call('device.directFeedback')
+    Sim.Send(model.Out_Msg, Event.status + (Event.data1 << 8) + (Event.data2 << 16))
+
+
+def dispatchReceiverCount():
+    return Sim.ReceiverCount
+
+
+def dispatch(CtrlIndex, Message, Sysex=None):
+    Sim.Call('device.dispatch')
+    if Sysex is not None:
+        Sim.Send(model.Out_Dispatch, bytes(Sysex), CtrlIndex)
+    else:
+        Sim.Send(model.Out_Dispatch, Message, CtrlIndex)
+
+
+def processMIDICC(Event):
+    Sim.Call('device.processMIDICC')
+    Event.handled = True
+
+
+def hardwareRefreshMixerTrack(Index):
+    Sim.Call('device.hardwareRefreshMixerTrack')
+
+
+def baseTrackSelect(Index, Step):
+    Sim.Call('device.baseTrackSelect')
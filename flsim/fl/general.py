@@ -0,0 +1,19 @@
+"""Stand-in for FL Studio's general module."""
+
+from flsim.model import Sim
+
+
+def getChangedFlag():
+    return Sim.ChangedFlag
+
+
+def getUseMetronome():
+    return Sim.Metronome
+
+
+def getPrecount():
+    return Sim.Precount
+
+
+def getUndoLevelHint():
+    return '1/1'
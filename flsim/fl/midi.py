@@ -0,0 +1,192 @@
+"""Stand-in for FL Studio's midi module (constants only)."""
+
+MIDI_NOTEOFF = 0x80
+MIDI_NOTEON = 0x90
+MIDI_KEYAFTERTOUCH = 0xA0
+MIDI_CONTROLCHANGE = 0xB0
+MIDI_PROGRAMCHANGE = 0xC0
+MIDI_CHANAFTERTOUCH = 0xD0
+MIDI_PITCHBEND = 0xE0
+MIDI_BEGINSYSEX = 0xF0
+MIDI_ENDSYSEX = 0xF7
+
+MaxInt = 0x7FFFFFFF
+FromMIDI_Max = 1 << 30
+EKRes = 1 / 24
+
+TranzPort_OffOnT = (MIDI_NOTEON + (0x00 << 16), MIDI_NOTEON + (0x7F << 16))
+TranzPort_OffOnBlinkT = (MIDI_NOTEON + (0x00 << 16), MIDI_NOTEON + (0x7F << 16), MIDI_NOTEON + (0x01 << 16))
+
+# pmeFlags
+PME_LiveInput = 1 << 0
+PME_System = 1 << 1
+PME_System_Safe = 1 << 2
+PME_PreviewNote = 1 << 3
+PME_FromHost = 1 << 4
+PME_FromMIDI = 1 << 5
+PME_FromScript = 1 << 6
+
+# hardware refresh flags
+HW_Dirty_Mixer_Sel = 1
+HW_Dirty_Mixer_Display = 2
+HW_Dirty_Mixer_Controls = 4
+HW_Dirty_RemoteLinks = 16
+HW_Dirty_FocusedWindow = 32
+HW_Dirty_Performance = 64
+HW_Dirty_LEDs = 256
+HW_Dirty_RemoteLinkValues = 512
+HW_Dirty_Patterns = 1024
+HW_Dirty_Tracks = 2048
+HW_Dirty_ControlValues = 4096
+HW_Dirty_Colors = 8192
+HW_Dirty_Names = 16384
+HW_Dirty_ChannelRackGroup = 32768
+
+# REC flags
+REC_UpdateValue = 1 << 0
+REC_GetValue = 1 << 1
+REC_ShowHint = 1 << 2
+REC_UpdatePlugLearn = 1 << 3
+REC_UpdateControl = 1 << 4
+REC_FromMIDI = 1 << 5
+REC_SetChanged = 1 << 6
+REC_SetTouched = 1 << 7
+REC_Store = 1 << 8
+REC_InternalCtrl = 1 << 9
+REC_PlugReserved = 1 << 10
+REC_Control = REC_UpdateValue | REC_UpdateControl | REC_ShowHint | REC_InternalCtrl | REC_SetChanged | REC_SetTouched
+REC_MIDIController = REC_Control | REC_FromMIDI
+REC_Controller = REC_MIDIController | REC_Store
+PME_RECFlagsT = (REC_MIDIController, REC_Controller)
+
+# REC event IDs (offsets inside a mixer track / plugin event block)
+REC_Mixer_Vol = 0
+REC_Mixer_Pan = 1
+REC_Mixer_SS = 2
+REC_Mixer_EQ_Gain = 3
+REC_Mixer_EQ_Freq = 6
+REC_Mixer_EQ_Q = 9
+REC_Mixer_Send_First = 16
+REC_Plug = 0xE0
+REC_Plug_MixLevel = 0xF0
+REC_Plug_Mute = 0xF1
+REC_MainVol = 0x7F0000
+REC_Tempo = 0x7F0001
+
+TrackNum_Master = 0
+
+PEAK_LR = 0
+PEAK_L = 0
+PEAK_R = 1
+PEAK_LR_INV = 2
+
+PM_Stopped = 0
+PM_Playing = 1
+SM_Pat = 0
+SM_Song = 1
+
+GT_Cannot = -1
+GT_None = 0
+GT_Plugin = 1
+GT_Form = 2
+GT_Menu = 3
+GT_Global = 4
+
+ROUTE_ToThis = 0
+ROUTE_StartingFromThis = 1
+
+fxSoloModeWithSourceTracks = 1
+fxSoloModeWithDestTracks = 2
+fxSoloToggle = -1
+
+curfxScrollToMakeVisible = 1
+curfxCancelSmoothing = 2
+curfxNoDeselectAll = 4
+curfxMinimalLatencyUpdate = 8
+
+widMixer = 0
+widChannelRack = 1
+widPlaylist = 2
+widPianoRoll = 3
+widBrowser = 4
+widPlugin = 5
+
+# transport commands
+FPT_Jog = 0
+FPT_Jog2 = 1
+FPT_Strip = 2
+FPT_StripJog = 3
+FPT_StripHold = 4
+FPT_Previous = 5
+FPT_Next = 6
+FPT_MoveJog = 7
+FPT_Play = 10
+FPT_Stop = 11
+FPT_Record = 12
+FPT_Rewind = 13
+FPT_FastForward = 14
+FPT_Loop = 15
+FPT_Mute = 16
+FPT_Mode = 17
+FPT_Undo = 20
+FPT_UndoUp = 21
+FPT_UndoJog = 22
+FPT_Punch = 30
+FPT_PunchIn = 31
+FPT_PunchOut = 32
+FPT_AddMarker = 33
+FPT_AddAltMarker = 34
+FPT_MarkerJumpJog = 35
+FPT_MarkerSelJog = 36
+FPT_Up = 40
+FPT_Down = 41
+FPT_Left = 42
+FPT_Right = 43
+FPT_HZoomJog = 44
+FPT_VZoomJog = 45
+FPT_Snap = 48
+FPT_SnapMode = 49
+FPT_Cut = 50
+FPT_Copy = 51
+FPT_Paste = 52
+FPT_Insert = 53
+FPT_Delete = 54
+FPT_NextWindow = 58
+FPT_WindowJog = 59
+FPT_F1 = 60
+FPT_F2 = 61
+FPT_F3 = 62
+FPT_F4 = 63
+FPT_F5 = 64
+FPT_F6 = 65
+FPT_F7 = 66
+FPT_F8 = 67
+FPT_F9 = 68
+FPT_F10 = 69
+FPT_F11 = 70
+FPT_F12 = 71
+FPT_Enter = 80
+FPT_Escape = 81
+FPT_Yes = 82
+FPT_No = 83
+FPT_Menu = 90
+FPT_ItemMenu = 91
+FPT_Save = 92
+FPT_SaveNew = 93
+FPT_PatternJog = 100
+FPT_TrackJog = 101
+FPT_ChannelJog = 102
+FPT_TempoJog = 105
+FPT_TapTempo = 106
+FPT_NudgeMinus = 107
+FPT_NudgePlus = 108
+FPT_Metronome = 110
+FPT_WaitForInput = 111
+FPT_Overdub = 112
+FPT_LoopRecord = 113
+FPT_StepEdit = 114
+FPT_CountDown = 115
+
+
+def EncodeRemoteControlID(PortNum, ChanNum, CCNum):
+    return CCNum + (ChanNum << 16) + ((PortNum + 1) << 22)
@@ -0,0 +1,167 @@
+"""Stand-in for FL Studio's mixer module, backed by flsim.model.Sim."""
+
+import midi
+from flsim import model
+from flsim.model import Sim
+
+
+def _Track(Index):
+    Sim.Call('mixer.track')
+    return Sim.Tracks[Index]
+
+
+def _Split(EventID):
+    return EventID >> model.EventID_TrackShift, (EventID >> model.EventID_SlotShift) & 0xFF, EventID & model.EventID_OffsetMask
+
+
+def trackCount():
+    return len(Sim.Tracks)
+
+
+def trackNumber():
+    return Sim.TrackNumber
+
+
+def setTrackNumber(Index, Flags=0):
+    Sim.Call('mixer.setTrackNumber')
+    Sim.TrackNumber = Index
+
+
+def getTrackName(Index, MaxLen=0):
+    Name = _Track(Index).Name
+    if MaxLen > 0:
+        return Name[:MaxLen]
+    return Name
+
+
+def getTrackColor(Index):
+    return _Track(Index).Color
+
+
+def setTrackColor(Index, Color):
+    Sim.Call('mixer.setTrackColor')
+    Sim.Tracks[Index].Color = Color
+
+
+def isTrackArmed(Index):
+    return _Track(Index).Armed
+
+
+def armTrack(Index):
+    Sim.Call('mixer.armTrack')
+    Sim.Tracks[Index].Armed = not Sim.Tracks[Index].Armed
+
+
+def isTrackMuted(Index):
+    return _Track(Index).Muted
+
+
+def isTrackEnabled(Index):
+    return not _Track(Index).Muted
+
+
+def muteTrack(Index, Value=-1):
+    Sim.Call('mixer.muteTrack')
+    t = Sim.Tracks[Index]
+    t.Muted = (not t.Muted) if Value < 0 else bool(Value)
+
+
+def enableTrack(Index):
+    muteTrack(Index)
+
+
+def isTrackSolo(Index):
+    return _Track(Index).Solo
+
+
+def soloTrack(Index, Value=-1, Mode=-1):
+    Sim.Call('mixer.soloTrack')
+    t = Sim.Tracks[Index]
+    t.Solo = (not t.Solo) if Value < 0 else bool(Value)
+
+
+def getTrackPeaks(Index, Mode):
+    Sim.Call('mixer.getTrackPeaks')
+    if Index < 0 or Index >= len(Sim.Tracks):
+        return 0.0
+    return Sim.Tracks[Index].Peaks[Mode & 1]
+
+
+def getTrackPluginId(Index, Slot):
+    return (Index << model.EventID_TrackShift) + (Slot << model.EventID_SlotShift)
+
+
+def isTrackPluginValid(Index, Slot):
+    return _Track(Index).Plugins[Slot] is not None
+
+
+def isTrackAutomationEnabled(Index, Slot):
+    return True
+
+
+def getTrackRecordingFileName(Index):
+    return 'Track ' + str(Index) + '.wav'
+
+
+def getRouteSendActive(Index, DestIndex):
+    return int(DestIndex in _Track(Index).Routes)
+
+
+def setRouteTo(Index, DestIndex, Value):
+    Sim.Call('mixer.setRouteTo')
+    Routes = Sim.Tracks[Index].Routes
+    if DestIndex in Routes:
+        Routes.discard(DestIndex)
+    else:
+        Routes.add(DestIndex)
+    return 1
+
+
+def afterRoutingChanged():
+    pass
+
+
+def linkTrackToChannel(Mode):
+    Sim.Call('mixer.linkTrackToChannel')
+
+
+def getCurrentTempo(AsInt=False):
+    if AsInt:
+        return int(Sim.Tempo * 1000)
+    return Sim.Tempo
+
+
+def getEventValue(EventID, Value=midi.MaxInt, SmoothTarget=True):
+    Sim.Call('mixer.getEventValue')
+    return Sim.EventValues.get(EventID, midi.FromMIDI_Max >> 1)
+
+
+def getAutoSmoothEventValue(EventID, Locked=True):
+    Sim.Call('mixer.getAutoSmoothEventValue')
+    return Sim.EventValues.get(EventID, midi.FromMIDI_Max >> 1)
+
+
+def automateEvent(EventID, Value, Flags, Speed=0, IsIncrement=0, Res=midi.EKRes):
+    Sim.Call('mixer.automateEvent')
+    if IsIncrement:
+        Value = getEventValue(EventID) + round(Value * Res * midi.FromMIDI_Max)
+    Sim.EventValues[EventID] = max(0, min(midi.FromMIDI_Max, int(Value)))
+    return Value
+
+
+def getEventIDName(EventID, ShortName=False):
+    Sim.Call('mixer.getEventIDName')
+    Track, Slot, Offset = _Split(EventID)
+    if Track >= len(Sim.Tracks):
+        return 'Event ' + str(EventID)
+    return Sim.Tracks[Track].Name + ' - Param ' + str(Offset)
+
+
+def getEventIDValueString(EventID, Value):
+    Sim.Call('mixer.getEventIDValueString')
+    return str(round(Value * 100 / midi.FromMIDI_Max)) + '%'
+
+
+def remoteFindEventValue(EventID, Flags=0):
+    Sim.Call('mixer.remoteFindEventValue')
+    return Sim.RemoteValues.get(EventID, Sim.RemoteDefault)
@@ -0,0 +1,23 @@
+"""Stand-in for FL Studio's patterns module."""
+
+from flsim.model import Sim
+
+
+def patternCount():
+    return len(Sim.Patterns)
+
+
+def patternNumber():
+    return Sim.PatternNumber
+
+
+def getPatternName(Index):
+    return Sim.Patterns[(Index - 1) % len(Sim.Patterns)]
+
+
+def isPatternSelected(Index):
+    return Index == Sim.PatternNumber
+
+
+def selectPattern(Index, Value=-1, PreviewNote=-1):
+    Sim.PatternNumber = Index
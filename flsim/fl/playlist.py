@@ -0,0 +1,18 @@
+"""Stand-in for FL Studio's playlist module."""
+
+from flsim.model import Sim
+
+
+def getVisTimeBar():
+    Sim.Call('playlist.getVisTime')
+    return Sim.VisTime[0]
+
+
+def getVisTimeStep():
+    Sim.Call('playlist.getVisTime')
+    return Sim.VisTime[1]
+
+
+def getVisTimeTick():
+    Sim.Call('playlist.getVisTime')
+    return Sim.VisTime[2]
@@ -0,0 +1,48 @@
+"""Stand-in for FL Studio's plugins module (mixer effect slots only)."""
+
+from flsim.model import Sim
+
+
+def _Plugin(Index, Slot):
+    Sim.Call('plugins.plugin')
+    if Index < 0 or Index >= len(Sim.Tracks) or Slot < 0 or Slot >= len(Sim.Tracks[Index].Plugins):
+        return None
+    return Sim.Tracks[Index].Plugins[Slot]
+
+
+def isValid(Index, Slot=-1):
+    return _Plugin(Index, Slot) is not None
+
+
+def getPluginName(Index, Slot=-1, UserName=False):
+    p = _Plugin(Index, Slot)
+    if p is None:
+        raise TypeError('Operation unsafe at current time')
+    return p.Name
+
+
+def getParamCount(Index, Slot=-1):
+    p = _Plugin(Index, Slot)
+    if p is None:
+        return 0
+    return len(p.Params)
+
+
+def getParamName(ParamIndex, Index, Slot=-1):
+    p = _Plugin(Index, Slot)
+    if p is None or ParamIndex >= len(p.Params):
+        return ''
+    return p.Params[ParamIndex]
+
+
+def getParamValue(ParamIndex, Index, Slot=-1):
+    p = _Plugin(Index, Slot)
+    if p is None or ParamIndex >= len(p.Values):
+        return 0.0
+    return p.Values[ParamIndex]
+
+
+def setParamValue(Value, ParamIndex, Index, Slot=-1):
+    p = _Plugin(Index, Slot)
+    if p is not None and ParamIndex < len(p.Values):
+        p.Values[ParamIndex] = Value
@@ -0,0 +1,38 @@
+"""Stand-in for FL Studio's transport module."""
+
+import midi
+from flsim.model import Sim
+
+
+def globalTransport(Command, Value, PMEFlags=midi.PME_System, Flags=0):
+    Sim.Call('transport.globalTransport')
+    if Value > 0:
+        if Command == midi.FPT_Play:
+            Sim.Playing = not Sim.Playing
+        elif Command == midi.FPT_Stop:
+            Sim.Playing = False
+        elif Command == midi.FPT_Record:
+            Sim.Recording = not Sim.Recording
+        elif Command == midi.FPT_Loop:
+            Sim.LoopMode = 1 - Sim.LoopMode
+        elif Command == midi.FPT_Metronome:
+            Sim.Metronome = not Sim.Metronome
+        elif Command == midi.FPT_CountDown:
+            Sim.Precount = not Sim.Precount
+    return midi.GT_Global
+
+
+def isPlaying():
+    return int(Sim.Playing)
+
+
+def isRecording():
+    return Sim.Recording
+
+
+def getLoopMode():
+    return Sim.LoopMode
+
+
+def setPlaybackSpeed(Speed):
+    Sim.Call('transport.setPlaybackSpeed')
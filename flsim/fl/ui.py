@@ -0,0 +1,80 @@
+"""Stand-in for FL Studio's ui module."""
+
+from flsim.model import Sim
+
+
+def getTimeDispMin():
+    return Sim.TimeDispMin
+
+
+def setTimeDispMin():
+    Sim.TimeDispMin = not Sim.TimeDispMin
+
+
+def getFocused(Index):
+    return int(Index in Sim.Focused)
+
+
+def setFocused(Index):
+    Sim.Call('ui.setFocused')
+    Sim.Focused = {Index}
+
+
+def getVisible(Index):
+    return int(Index in Sim.Visible)
+
+
+def showWindow(Index):
+    Sim.Call('ui.showWindow')
+    Sim.Visible.add(Index)
+
+
+def hideWindow(Index):
+    Sim.Visible.discard(Index)
+
+
+def nextWindow():
+    pass
+
+
+def getFocusedFormCaption():
+    return 'Mixer'
+
+
+def getHintMsg():
+    return Sim.HintMsg
+
+
+GetHintMsg = getHintMsg
+
+
+def setHintMsg(Msg):
+    Sim.HintMsg = Msg
+
+
+def getHintValue(Value, Max):
+    return str(round(Value * 100 / Max)) + '%'
+
+
+def getProgTitle():
+    return 'FL Studio'
+
+
+def isClosing():
+    return False
+
+
+def isInPopupMenu():
+    return False
+
+
+def isMetronomeEnabled():
+    return Sim.Metronome
+
+
+def isPrecountEnabled():
+    return Sim.Precount
+
+
+def launchAudioEditor(Reuse, Filename, Index, Preset, PresetGUID):
+    pass
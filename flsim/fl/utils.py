@@ -0,0 +1,55 @@
+"""Stand-in for FL Studio's utils module."""
+
+import math
+
+
+def Limited(Value, Min, Max):
+    if Value <= Min:
+        return Min
+    if Value >= Max:
+        return Max
+    return Value
+
+
+def SignOf(Value):
+    if Value < 0:
+        return -1
+    elif Value == 0:
+        return 0
+    return 1
+
+
+def DivModU(A, B):
+    return A // B, A % B
+
+
+def SwapInt(A, B):
+    return B, A
+
+
+def Zeros(Value, NChars, c='0'):
+    if Value < 0:
+        Result = str(-Value)
+        while len(Result) < NChars - 1:
+            Result = c + Result
+        return '-' + Result
+    Result = str(Value)
+    while len(Result) < NChars:
+        Result = c + Result
+    return Result
+
+
+def Zeros_Strict(Value, NChars, c='0'):
+    Result = Zeros(Value, NChars, c)
+    return Result[len(Result) - NChars:]
+
+
+def KnobAccelToRes2(Value):
+    n = abs(Value)
+    if n > 1:
+        return n ** 1.5
+    return 1
+
+
+def Interpolate(a, b, t):
+    return a + (b - a) * t
@@ -0,0 +1,143 @@
+"""State shared by the FL Studio API stand-ins in flsim/fl.
+
+The stand-in modules (device, mixer, plugins, ...) all read and write the
+single TSimState instance held in `Sim`, so a test harness can configure a
+mixer, drive the script's callbacks and inspect everything it sent.
+"""
+
+import time
+
+import midi
+
+# event ID layout used by the stand-in mixer (see mixer.getTrackPluginId)
+EventID_TrackShift = 16
+EventID_SlotShift = 8
+EventID_OffsetMask = 0xFF
+
+# output log kinds
+Out_Msg = 0
+Out_NewMsg = 1
+Out_Sysex = 2
+Out_Dispatch = 3
+
+
+class TSimPlugin:
+    def __init__(self, Name, Params=None):
+        self.Name = Name
+        self.Params = list(Params) if Params is not None else ['Param ' + str(n + 1) for n in range(16)]
+        self.Values = [0.5 for n in range(len(self.Params))]
+
+
+class TSimTrack:
+    def __init__(self, Index, Name=''):
+        self.Index = Index
+        self.Name = Name or ('Insert ' + str(Index) if Index > 0 else 'Master')
+        self.Muted = False
+        self.Solo = False
+        self.Armed = False
+        self.Color = -10261391
+        self.Peaks = [0.0, 0.0]
+        self.Routes = set()
+        self.Plugins = [None for n in range(10)]
+
+
+class TSimOutput:
+    """One message sent by the script: (time, kind, message, index/port)."""
+
+    __slots__ = ('Time', 'Kind', 'Msg', 'Index')
+
+    def __init__(self, Time, Kind, Msg, Index=0):
+        self.Time = Time
+        self.Kind = Kind
+        self.Msg = Msg
+        self.Index = Index
+
+    def Size(self):
+        if self.Kind == Out_Sysex:
+            return len(self.Msg)
+        return 3
+
+
+class TSimState:
+    def __init__(self):
+        self.Reset()
+
+    def Reset(self, TrackCount=127):
+        self.Clock = time.perf_counter
+        self.Tracks = [TSimTrack(n) for n in range(TrackCount)]
+        self.TrackNumber = 1
+        self.EventValues = {}
+        self.RemoteValues = {}  # remote control ID -> value (0..1) for mixer.remoteFindEventValue
+        self.RemoteDefault = -1  # for IDs not in RemoteValues; -1 is 'not linked'
+        self.Output = []
+        self.Calls = {}
+        self.CountCalls = False
+        self.Assigned = True
+        self.PortNumber = 0
+        self.ReceiverCount = 0
+        self.NewMsgT = {}
+        self.Playing = False
+        self.Recording = False
+        self.LoopMode = 0
+        self.TimeDispMin = False
+        self.VisTime = [1, 1, 0]
+        self.Focused = set()
+        self.Visible = set()
+        self.HintMsg = ''
+        self.ChangedFlag = 0
+        self.Metronome = False
+        self.Precount = False
+        self.Tempo = 130.0
+        self.Patterns = ['Pattern ' + str(n + 1) for n in range(8)]
+        self.PatternNumber = 1
+        self.Channels = ['Channel ' + str(n + 1) for n in range(8)]
+        self.ChannelNumber = 0
+
+    # -- configuration helpers --------------------------------------------
+
+    def SetTrackCount(self, Count):
+        while len(self.Tracks) < Count:
+            self.Tracks.append(TSimTrack(len(self.Tracks)))
+        del self.Tracks[Count:]
+
+    def SetPlugin(self, Track, Slot, Plugin):
+        self.Tracks[Track].Plugins[Slot] = Plugin
+
+    def SetTrack(self, Index, Name=None, Volume=None, Pan=None, Muted=None, Solo=None, Armed=None, Routes=None):
+        """Configure one mixer track; Volume and Pan are event values (0..midi.FromMIDI_Max)."""
+        t = self.Tracks[Index]
+        if Name is not None:
+            t.Name = Name
+        if Volume is not None:
+            self.EventValues[(Index << EventID_TrackShift) + midi.REC_Mixer_Vol] = Volume
+        if Pan is not None:
+            self.EventValues[(Index << EventID_TrackShift) + midi.REC_Mixer_Pan] = Pan
+        if Muted is not None:
+            t.Muted = Muted
+        if Solo is not None:
+            t.Solo = Solo
+        if Armed is not None:
+            t.Armed = Armed
+        if Routes is not None:
+            t.Routes = set(Routes)
+        return t
+
+    # -- bookkeeping used by the stand-ins ----------------------------------
+
+    def Call(self, Name):
+        if self.CountCalls:
+            self.Calls[Name] = self.Calls.get(Name, 0) + 1
+
+    def Send(self, Kind, Msg, Index=0):
+        self.Output.append(TSimOutput(self.Clock(), Kind, Msg, Index))
+
+    def TakeOutput(self):
+        Result = self.Output
+        self.Output = []
+        return Result
+
+    def OutputBytes(self):
+        return sum(o.Size() for o in self.Output)
+
+
+Sim = TSimState()
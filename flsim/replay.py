@@ -0,0 +1,145 @@
+"""Replay a session captured by the script (see CaptureFileName) against it, headlessly.
+
+    python -m flsim.replay session.qcap [--script device_QCONProX.py] [--against other.py] [--realtime] [--profile]
+
+The records are fed to the script's module level callbacks on a virtual clock
+that advances by the recorded gaps, so a replay is deterministic whether it
+runs at the original pace (--realtime) or as fast as possible. With --against
+the same log is replayed against a second script and the two output streams
+are diffed. The stand-in mixer starts from Sim.Reset(), not from the mixer the
+session was recorded with.
+"""
+
+import argparse
+import difflib
+import sys
+import time
+
+import flsim
+from flsim.model import Sim
+
+OutKindNameT = ('msg', 'newmsg', 'sysex', 'dispatch')
+
+
+class TSimClock:
+    """Stands in for the time module inside the script during a replay."""
+
+    def __init__(self, Start=1000.0):
+        self.Now = Start
+
+    def perf_counter(self):
+        return self.Now
+
+    def time(self):
+        return self.Now
+
+    def monotonic(self):
+        return self.Now
+
+    def sleep(self, Seconds):
+        self.Now += Seconds
+
+    def ctime(self, Secs=None):
+        return time.ctime(0)
+
+
+def Read(FileName, Script):
+    """Decode a capture into (seconds since the previous record, kind, args) tuples."""
+    with open(FileName, 'rb') as f:
+        Data = f.read()
+    Magic = Script.CaptureMagic
+    if Data[:len(Magic)] != Magic:
+        raise ValueError(FileName + ' is not a session capture')
+    Records = []
+    Pos = len(Magic)
+    while Pos < len(Data):
+        Kind = Data[Pos + Script.TCapture.HeadS.size - 1]
+        Format = Script.TCapture.FormatT[Kind]
+        Values = Format.unpack_from(Data, Pos)
+        Records.append((Values[0] / 1000000, Kind, Values[2:]))
+        Pos += Format.size
+    return Records
+
+
+def Replay(Script, Records, RealTime=False, Profiler=None):
+    """Run OnInit and then every record through the script; returns what it sent."""
+    if Profiler is None:
+        Profiler = flsim.TSimProfiler(Script)
+    Clock = TSimClock()
+    Script.time = Clock
+    Sim.Clock = Clock.perf_counter
+    HandlerT = {Script.Cap_MidiMsg: 'OnMidiMsg', Script.Cap_Idle: 'OnIdle', Script.Cap_Refresh: 'OnRefresh',
+                Script.Cap_DirtyMixerTrack: 'OnDirtyMixerTrack', Script.Cap_UpdateMeters: 'OnUpdateMeters',
+                Script.Cap_BeatIndicator: 'OnUpdateBeatIndicator'}
+    Sim.TakeOutput()
+    Profiler.Call('OnInit')
+    Wall = time.perf_counter()
+    for Delta, Kind, Args in Records:
+        Clock.Now += Delta
+        if RealTime:
+            Wall += Delta
+            Wait = Wall - time.perf_counter()
+            if Wait > 0:
+                time.sleep(Wait)
+        if Kind == Script.Cap_MidiMsg:
+            MidiId, MidiChan, Data1, Data2, PMEFlags = Args
+            Args = (flsim.TSimEvent(MidiId + MidiChan, Data1, Data2, PMEFlags),)
+        Profiler.Call(HandlerT[Kind], *Args)
+    return Sim.TakeOutput()
+
+
+def Run(FileName, ScriptPath=flsim.ScriptPath, RealTime=False):
+    """Load a fresh copy of the script against a reset simulator and replay the log through it."""
+    Sim.Reset()
+    Script = flsim.LoadScript(ScriptPath)
+    Profiler = flsim.TSimProfiler(Script)
+    return Replay(Script, Read(FileName, Script), RealTime, Profiler), Profiler
+
+
+def Lines(Output):
+    # what was sent, without the timestamps
+    Result = []
+    for o in Output:
+        if isinstance(o.Msg, bytes):
+            Msg = o.Msg.hex(' ')
+        else:
+            Msg = '{:06X}'.format(o.Msg)
+        Result.append('{} {} {}'.format(OutKindNameT[o.Kind], o.Index, Msg))
+    return Result
+
+
+def Diff(A, B, NameA='a', NameB='b'):
+    return list(difflib.unified_diff(Lines(A), Lines(B), NameA, NameB, lineterm=''))
+
+
+def Summary(Output):
+    return '{} messages, {} bytes'.format(len(Output), sum(o.Size() for o in Output))
+
+
+def main(ArgT=None):
+    Parser = argparse.ArgumentParser(prog='python -m flsim.replay', description='Replay a captured surface session headlessly.')
+    Parser.add_argument('log')
+    Parser.add_argument('--script', default=flsim.ScriptPath)
+    Parser.add_argument('--against', help='a second script to replay the log against and diff with')
+    Parser.add_argument('--realtime', action='store_true', help='keep the recorded timing instead of running flat out')
+    Parser.add_argument('--profile', action='store_true', help='print callback latency and output per callback')
+    Args = Parser.parse_args(ArgT)
+
+    Output, Profiler = Run(Args.log, Args.script, Args.realtime)
+    print(Args.script + ': ' + Summary(Output))
+    if Args.profile:
+        print(Profiler.Report())
+    if Args.against is None:
+        return 0
+    Other, Profiler = Run(Args.log, Args.against, Args.realtime)
+    print(Args.against + ': ' + Summary(Other))
+    if Args.profile:
+        print(Profiler.Report())
+    DiffT = Diff(Output, Other, Args.script, Args.against)
+    for s in DiffT:
+        print(s)
+    return int(len(DiffT) > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())